@@ -0,0 +1,8 @@
+"""
+Benchmarks
+----------
+
+Performance benchmarks for csvcubed, run against synthetic cubes of realistic shapes and sizes.
+
+See `benchmarks/README.md` for details on running the suite and comparing results against a stored baseline.
+"""
@@ -0,0 +1,201 @@
+"""
+Benchmarks CLI
+--------------
+
+Usage: `python -m benchmarks run --scale 10k` and `python -m benchmarks compare BASELINE RESULTS`.
+"""
+import json
+import sys
+from pathlib import Path
+from typing import Tuple
+
+import click
+
+from csvcubed.utils.log import start_logging
+
+from .compare import (
+    DEFAULT_MINIMUM_DIFFERENCE_S,
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_results,
+    format_report,
+)
+from .generators import CubeShape
+from .suite import SCALES, TARGETS, run_benchmarks
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_BASELINE_PATH = BENCHMARKS_DIR / "baselines" / "baseline.json"
+DEFAULT_WORK_DIR = BENCHMARKS_DIR / ".work"
+
+
+def _load_json(path: Path) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _report_against_baseline(
+    baseline_path: Path, results: dict, threshold: float, minimum_difference: float
+) -> None:
+    comparisons = compare_results(
+        _load_json(baseline_path),
+        results,
+        threshold=threshold,
+        minimum_difference_s=minimum_difference,
+    )
+    print(format_report(comparisons))
+    if any(c.is_regression for c in comparisons):
+        sys.exit(1)
+
+
+@click.group(context_settings=dict(help_option_names=["-h", "--help"]))
+def benchmarks():
+    """
+    csvcubed performance benchmarks.
+    """
+
+
+@benchmarks.command("run")
+@click.option(
+    "--scale",
+    "scales",
+    help="The scale(s) to benchmark at.",
+    type=click.Choice(list(SCALES.keys())),
+    multiple=True,
+    default=["10k"],
+    show_default=True,
+)
+@click.option(
+    "--target",
+    "targets",
+    help="The operation(s) to time. Defaults to all of them.",
+    type=click.Choice(list(TARGETS.keys())),
+    multiple=True,
+)
+@click.option("--repeats", type=int, default=3, show_default=True)
+@click.option("--dimensions", type=int, default=3, show_default=True)
+@click.option("--codelist-cardinality", type=int, default=100, show_default=True)
+@click.option("--hierarchy-depth", type=int, default=1, show_default=True)
+@click.option("--measures", type=int, default=1, show_default=True)
+@click.option("--units", type=int, default=1, show_default=True)
+@click.option("--obs-status-sparsity", type=float, default=0.0, show_default=True)
+@click.option(
+    "--work-dir",
+    help="Where generated inputs (reused between runs) and outputs are written.",
+    type=click.Path(path_type=Path, file_okay=False),
+    default=DEFAULT_WORK_DIR,
+)
+@click.option(
+    "--out",
+    "-o",
+    help="Write the results document to this file.",
+    type=click.Path(path_type=Path, dir_okay=False),
+)
+@click.option(
+    "--baseline",
+    help="Compare the results against this baseline and exit with a non-zero status on regression.",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+)
+@click.option(
+    "--save-baseline",
+    help=f"Store the results as the baseline at {DEFAULT_BASELINE_PATH.relative_to(BENCHMARKS_DIR.parent)}.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, show_default=True
+)
+@click.option(
+    "--minimum-difference",
+    type=float,
+    default=DEFAULT_MINIMUM_DIFFERENCE_S,
+    show_default=True,
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["warn", "err", "crit", "info", "debug"], case_sensitive=False),
+    default="info",
+)
+def run_command(
+    scales: Tuple[str, ...],
+    targets: Tuple[str, ...],
+    repeats: int,
+    dimensions: int,
+    codelist_cardinality: int,
+    hierarchy_depth: int,
+    measures: int,
+    units: int,
+    obs_status_sparsity: float,
+    work_dir: Path,
+    out: Path,
+    baseline: Path,
+    save_baseline: bool,
+    threshold: float,
+    minimum_difference: float,
+    log_level: str,
+):
+    """Generate synthetic cubes and time csvcubed's key operations against them."""
+    start_logging(log_dir_name="csvcubed-benchmarks", selected_logging_level=log_level)
+    start_logging(
+        log_dir_name="csvcubed-benchmarks",
+        selected_logging_level=log_level,
+        root_logger_name="benchmarks",
+    )
+
+    shapes = {
+        scale: CubeShape(
+            rows=SCALES[scale],
+            num_dimensions=dimensions,
+            codelist_cardinality=codelist_cardinality,
+            hierarchy_depth=hierarchy_depth,
+            num_measures=measures,
+            num_units=units,
+            obs_status_sparsity=obs_status_sparsity,
+        )
+        for scale in scales
+    }
+    results = run_benchmarks(
+        shapes, list(targets or TARGETS.keys()), work_dir, repeats=repeats
+    )
+
+    results_json = json.dumps(results, indent=4)
+    if out is not None:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(results_json)
+    if save_baseline:
+        DEFAULT_BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DEFAULT_BASELINE_PATH.write_text(results_json)
+    if out is None and not save_baseline:
+        print(results_json)
+
+    if baseline is not None:
+        _report_against_baseline(baseline, results, threshold, minimum_difference)
+
+
+@benchmarks.command("compare")
+@click.argument(
+    "baseline",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+)
+@click.argument(
+    "results",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+)
+@click.option(
+    "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, show_default=True
+)
+@click.option(
+    "--minimum-difference",
+    type=float,
+    default=DEFAULT_MINIMUM_DIFFERENCE_S,
+    show_default=True,
+)
+def compare_command(
+    baseline: Path, results: Path, threshold: float, minimum_difference: float
+):
+    """Report the difference between a stored baseline and a set of results."""
+    _report_against_baseline(
+        baseline, _load_json(results), threshold, minimum_difference
+    )
+
+
+if __name__ == "__main__":
+    benchmarks()
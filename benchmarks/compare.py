@@ -0,0 +1,113 @@
+"""
+Compare
+-------
+
+Produce a regression report comparing a set of benchmark results against a stored baseline.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .suite import iterate_medians
+
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+"""The fractional slowdown above which a timing is reported as a regression."""
+
+DEFAULT_MINIMUM_DIFFERENCE_S = 0.05
+"""Differences smaller than this (in seconds) are treated as noise regardless of the relative slowdown."""
+
+
+@dataclass
+class TimingComparison:
+    scale: str
+    target: str
+    baseline_s: Optional[float]
+    current_s: Optional[float]
+    is_regression: bool
+
+    @property
+    def relative_change(self) -> Optional[float]:
+        if self.baseline_s is None or self.current_s is None or self.baseline_s == 0:
+            return None
+        return (self.current_s - self.baseline_s) / self.baseline_s
+
+    @property
+    def status(self) -> str:
+        if self.baseline_s is None:
+            return "new"
+        if self.current_s is None:
+            return "missing"
+        return "REGRESSION" if self.is_regression else "ok"
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    minimum_difference_s: float = DEFAULT_MINIMUM_DIFFERENCE_S,
+) -> List[TimingComparison]:
+    """
+    Compares the median timings in :obj:`current` against those in :obj:`baseline`.
+
+    A timing is a regression when it is more than :obj:`threshold` (fractionally) *and* more than
+    :obj:`minimum_difference_s` slower than the baseline.
+    """
+    baseline_medians: Dict[Tuple[str, str], float] = {
+        (scale, target): median for scale, target, median in iterate_medians(baseline)
+    }
+    current_medians: Dict[Tuple[str, str], float] = {
+        (scale, target): median for scale, target, median in iterate_medians(current)
+    }
+
+    comparisons: List[TimingComparison] = []
+    for key in list(current_medians.keys()) + [
+        k for k in baseline_medians.keys() if k not in current_medians
+    ]:
+        scale, target = key
+        baseline_s = baseline_medians.get(key)
+        current_s = current_medians.get(key)
+        is_regression = (
+            baseline_s is not None
+            and current_s is not None
+            and (current_s - baseline_s) > minimum_difference_s
+            and (current_s - baseline_s) > threshold * baseline_s
+        )
+        comparisons.append(
+            TimingComparison(scale, target, baseline_s, current_s, is_regression)
+        )
+
+    return comparisons
+
+
+def format_report(comparisons: List[TimingComparison]) -> str:
+    """
+    :return: a plain-text table describing each of the :obj:`comparisons`.
+    """
+
+    def _format_seconds(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.3f}s"
+
+    def _format_change(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:+.1%}"
+
+    header = ("Scale", "Target", "Baseline", "Current", "Change", "Status")
+    rows = [header] + [
+        (
+            c.scale,
+            c.target,
+            _format_seconds(c.baseline_s),
+            _format_seconds(c.current_s),
+            _format_change(c.relative_change),
+            c.status,
+        )
+        for c in comparisons
+    ]
+    column_widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, column_widths))
+        for row in rows
+    ]
+    num_regressions = len([c for c in comparisons if c.is_regression])
+    lines.append("")
+    lines.append(f"{num_regressions} regression(s) found.")
+    return "\n".join(lines)
@@ -0,0 +1,306 @@
+"""
+Synthetic Cube Generators
+-------------------------
+
+Generate tidy CSV files and matching qube-config.json files with a configurable shape so that csvcubed's performance
+can be measured at realistic scales.
+"""
+import json
+import math
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+QUBE_CONFIG_SCHEMA_URL = "https://purl.org/csv-cubed/qube-config/v1.3"
+CODE_LIST_CONFIG_SCHEMA_URL = "https://purl.org/csv-cubed/code-list-config/v1.0"
+SDMX_A_OBS_STATUS_URI = "http://purl.org/linked-data/sdmx/2009/attribute#obsStatus"
+
+OBSERVATION_COLUMN_TITLE = "Value"
+MEASURE_COLUMN_TITLE = "Measure"
+UNIT_COLUMN_TITLE = "Unit"
+OBS_STATUS_COLUMN_TITLE = "Marker"
+OBS_STATUS_VALUE = "Suppressed"
+
+_CSV_WRITE_CHUNK_SIZE = 1_000_000
+
+
+@dataclass(frozen=True)
+class CubeShape:
+    """
+    Describes the shape of a synthetic cube.
+
+    The first dimension is grown beyond :attr:`codelist_cardinality` where necessary so that every row has a unique
+    combination of dimension values (i.e. the cube never contains duplicate observations).
+    """
+
+    rows: int
+    num_dimensions: int = 3
+    codelist_cardinality: int = 100
+    hierarchy_depth: int = 1
+    num_measures: int = 1
+    num_units: int = 1
+    obs_status_sparsity: float = 0.0
+    """The fraction of observations which are missing a value and carry an `sdmxa:obsStatus` marker instead."""
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.rows < 1:
+            raise ValueError("A cube must contain at least one row.")
+        if self.num_dimensions < 1:
+            raise ValueError("A cube must contain at least one dimension.")
+        if self.codelist_cardinality < 1:
+            raise ValueError("Code lists must contain at least one concept.")
+        if self.hierarchy_depth < 1:
+            raise ValueError("The hierarchy depth must be at least 1.")
+        if self.num_measures < 1 or self.num_units < 1:
+            raise ValueError("A cube must contain at least one measure and one unit.")
+        if not 0.0 <= self.obs_status_sparsity <= 1.0:
+            raise ValueError("obs_status_sparsity must be between 0 and 1.")
+
+    @property
+    def identifier(self) -> str:
+        """A file-system safe identifier which uniquely describes this shape."""
+        return (
+            f"r{self.rows}-d{self.num_dimensions}-c{self.codelist_cardinality}-h{self.hierarchy_depth}"
+            f"-m{self.num_measures}-u{self.num_units}-s{self.obs_status_sparsity:g}-seed{self.seed}"
+        )
+
+    @property
+    def dimension_cardinalities(self) -> List[int]:
+        other_dimensions_combinations = (
+            self.codelist_cardinality ** (self.num_dimensions - 1)
+        ) * self.num_measures
+        first_dimension_cardinality = max(
+            self.codelist_cardinality,
+            math.ceil(self.rows / other_dimensions_combinations),
+        )
+        return [first_dimension_cardinality] + [self.codelist_cardinality] * (
+            self.num_dimensions - 1
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class GeneratedCube:
+    """The locations of the files making up a generated cube."""
+
+    shape: CubeShape
+    csv_path: Path
+    config_path: Path
+
+
+def dimension_column_title(dimension_index: int) -> str:
+    return f"Dimension {dimension_index + 1}"
+
+
+def concept_label(dimension_index: int, concept_index: int) -> str:
+    return f"D{dimension_index + 1} Concept {concept_index}"
+
+
+def _get_dimension_codes(shape: CubeShape) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Enumerates the unique dimension keys (mixed-radix) for each row.
+
+    :return: the codes for each dimension column along with the codes for the measure dimension.
+    """
+    remainder = np.arange(shape.rows, dtype=np.int64)
+    measure_codes = remainder % shape.num_measures
+    remainder = remainder // shape.num_measures
+
+    cardinalities = shape.dimension_cardinalities
+    dimension_codes: List[Optional[np.ndarray]] = [None] * shape.num_dimensions
+    for dimension_index in reversed(range(shape.num_dimensions)):
+        cardinality = cardinalities[dimension_index]
+        dimension_codes[dimension_index] = remainder % cardinality
+        remainder = remainder // cardinality
+
+    return [c for c in dimension_codes if c is not None], measure_codes
+
+
+def generate_data(shape: CubeShape) -> pd.DataFrame:
+    """
+    Generates the tidy data for a cube of the given :obj:`shape` as a :class:`pd.DataFrame`.
+
+    Text columns are returned as categoricals so that the frame remains compact even at tens of millions of rows.
+    """
+    random = np.random.default_rng(shape.seed)
+    dimension_codes, measure_codes = _get_dimension_codes(shape)
+
+    columns: Dict[str, object] = {}
+    for dimension_index, (codes, cardinality) in enumerate(
+        zip(dimension_codes, shape.dimension_cardinalities)
+    ):
+        categories = [concept_label(dimension_index, i) for i in range(cardinality)]
+        columns[dimension_column_title(dimension_index)] = pd.Categorical.from_codes(
+            codes, categories=categories
+        )
+
+    if shape.num_measures > 1:
+        columns[MEASURE_COLUMN_TITLE] = pd.Categorical.from_codes(
+            measure_codes, categories=_measure_labels(shape)
+        )
+
+    if shape.num_units > 1:
+        columns[UNIT_COLUMN_TITLE] = pd.Categorical.from_codes(
+            random.integers(0, shape.num_units, size=shape.rows),
+            categories=_unit_labels(shape),
+        )
+
+    values = np.round(random.random(shape.rows) * 1000, 2)
+    if shape.obs_status_sparsity > 0:
+        has_obs_status = random.random(shape.rows) < shape.obs_status_sparsity
+        values = np.where(has_obs_status, np.nan, values)
+        columns[OBS_STATUS_COLUMN_TITLE] = pd.Categorical.from_codes(
+            np.where(has_obs_status, 0, -1), categories=[OBS_STATUS_VALUE]
+        )
+
+    columns[OBSERVATION_COLUMN_TITLE] = values
+
+    return pd.DataFrame(columns)
+
+
+def _measure_labels(shape: CubeShape) -> List[str]:
+    return [f"Measure {i + 1}" for i in range(shape.num_measures)]
+
+
+def _unit_labels(shape: CubeShape) -> List[str]:
+    return [f"Unit {i + 1}" for i in range(shape.num_units)]
+
+
+def _get_code_list_config(
+    shape: CubeShape, dimension_index: int, cardinality: int
+) -> dict:
+    """
+    Generates a code-list-config.json arranging the dimension's concepts into a tree of
+    :attr:`CubeShape.hierarchy_depth` levels.
+    """
+    branching_factor = max(
+        2, math.ceil(cardinality ** (1 / max(1, shape.hierarchy_depth - 1)))
+    )
+
+    concepts: List[dict] = []
+    top_level_concepts: List[dict] = []
+    for concept_index in range(cardinality):
+        concept = {
+            "label": concept_label(dimension_index, concept_index),
+            "notation": f"d{dimension_index + 1}-{concept_index}",
+        }
+        concepts.append(concept)
+        if concept_index == 0:
+            top_level_concepts.append(concept)
+        else:
+            parent = concepts[(concept_index - 1) // branching_factor]
+            parent.setdefault("children", []).append(concept)
+
+    return {
+        "$schema": CODE_LIST_CONFIG_SCHEMA_URL,
+        "title": f"{dimension_column_title(dimension_index)} Code List",
+        "concepts": top_level_concepts,
+    }
+
+
+def generate_qube_config(
+    shape: CubeShape, code_list_config_paths: Optional[Dict[int, str]] = None
+) -> dict:
+    """
+    Generates the qube-config.json describing a cube of the given :obj:`shape`.
+
+    :obj:`code_list_config_paths` maps dimension indices to the (relative) path of their code-list-config.json, where
+    a hierarchical code list has been generated.
+    """
+    code_list_config_paths = code_list_config_paths or {}
+
+    columns: Dict[str, dict] = {}
+    for dimension_index in range(shape.num_dimensions):
+        columns[dimension_column_title(dimension_index)] = {
+            "type": "dimension",
+            "code_list": code_list_config_paths.get(dimension_index, True),
+        }
+
+    if shape.num_measures > 1:
+        columns[MEASURE_COLUMN_TITLE] = {
+            "type": "measures",
+            "values": [{"label": label} for label in _measure_labels(shape)],
+        }
+
+    if shape.num_units > 1:
+        columns[UNIT_COLUMN_TITLE] = {
+            "type": "units",
+            "values": [{"label": label} for label in _unit_labels(shape)],
+        }
+
+    if shape.obs_status_sparsity > 0:
+        columns[OBS_STATUS_COLUMN_TITLE] = {
+            "type": "attribute",
+            "from_existing": SDMX_A_OBS_STATUS_URI,
+            "values": True,
+        }
+
+    observations: dict = {"type": "observations", "data_type": "decimal"}
+    if shape.num_measures == 1:
+        observations["measure"] = {"label": _measure_labels(shape)[0]}
+    if shape.num_units == 1:
+        observations["unit"] = {"label": _unit_labels(shape)[0]}
+    columns[OBSERVATION_COLUMN_TITLE] = observations
+
+    return {
+        "$schema": QUBE_CONFIG_SCHEMA_URL,
+        "title": f"Synthetic benchmark cube {shape.identifier}",
+        "summary": "A synthetic cube generated for benchmarking csvcubed.",
+        "dataset_issued": "2022-01-01T00:00:00Z",
+        "columns": columns,
+    }
+
+
+def write_cube(shape: CubeShape, output_directory: Path) -> GeneratedCube:
+    """
+    Writes the tidy CSV, qube-config.json and any code-list-config.json files for a cube of the given :obj:`shape`
+    into :obj:`output_directory`.
+
+    Files which have already been generated for an identical shape are reused.
+    """
+    cube_directory = output_directory / shape.identifier
+    csv_path = cube_directory / "data.csv"
+    config_path = cube_directory / "qube-config.json"
+
+    if csv_path.exists() and config_path.exists():
+        return GeneratedCube(shape, csv_path, config_path)
+
+    cube_directory.mkdir(parents=True, exist_ok=True)
+
+    code_list_config_paths: Dict[int, str] = {}
+    if shape.hierarchy_depth > 1:
+        code_lists_directory = cube_directory / "codelists"
+        code_lists_directory.mkdir(exist_ok=True)
+        for dimension_index, cardinality in enumerate(shape.dimension_cardinalities):
+            relative_path = f"codelists/dimension-{dimension_index + 1}.json"
+            with open(cube_directory / relative_path, "w") as f:
+                json.dump(
+                    _get_code_list_config(shape, dimension_index, cardinality),
+                    f,
+                    indent=4,
+                )
+            code_list_config_paths[dimension_index] = relative_path
+
+    data = generate_data(shape)
+    # Write to a temporary file first so an interrupted run never leaves a truncated CSV to be reused.
+    partial_csv_path = csv_path.with_suffix(".csv.partial")
+    for chunk_start in range(0, len(data), _CSV_WRITE_CHUNK_SIZE):
+        chunk = data.iloc[chunk_start : chunk_start + _CSV_WRITE_CHUNK_SIZE]
+        chunk.to_csv(
+            partial_csv_path,
+            index=False,
+            mode="w" if chunk_start == 0 else "a",
+            header=chunk_start == 0,
+        )
+    partial_csv_path.replace(csv_path)
+
+    with open(config_path, "w") as f:
+        json.dump(generate_qube_config(shape, code_list_config_paths), f, indent=4)
+
+    return GeneratedCube(shape, csv_path, config_path)
@@ -0,0 +1,261 @@
+"""
+Benchmark Suite
+---------------
+
+Times csvcubed's key operations against synthetic cubes generated by :mod:`benchmarks.generators`.
+"""
+import contextlib
+import io
+import logging
+import platform
+import shutil
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import requests_mock
+
+from csvcubed import __version__
+from csvcubed.cli.build import build
+from csvcubed.cli.inspect.inspect import inspect
+from csvcubed.definitions import APP_ROOT_DIR_PATH
+from csvcubed.models.cube import QbCube, NewQbDimension, NewQbCodeList
+from csvcubed.readers.cubeconfig.schema_versions import get_deserialiser_for_schema
+from csvcubed.readers.cubeconfig.utils import load_resource
+from csvcubed.utils.qb.cube import get_columns_of_dsd_type
+from csvcubed.utils.sparql_handler.sparqlmanager import (
+    select_csvw_dsd_dataset_label_and_dsd_def_uri,
+    select_csvw_dsd_qube_components,
+)
+from csvcubed.utils.tableschema import CsvwRdfManager
+from csvcubed.writers.qbwriter import QbWriter
+from csvcubed.writers.skoscodelistwriter import SkosCodeListWriter
+
+from .generators import CubeShape, GeneratedCube, write_cube
+
+_logger = logging.getLogger(__name__)
+
+SCALES: Dict[str, int] = {
+    "10k": 10_000,
+    "1M": 1_000_000,
+    "10M": 10_000_000,
+}
+
+_SCHEMA_DIR = APP_ROOT_DIR_PATH / "schema"
+REMOTE_SCHEMAS_TO_SERVE_LOCALLY: Dict[str, Path] = {
+    "https://purl.org/csv-cubed/qube-config/v1.3": _SCHEMA_DIR
+    / "cube-config"
+    / "v1_3"
+    / "schema.json",
+    "https://purl.org/csv-cubed/code-list-config/v1.0": _SCHEMA_DIR
+    / "codelist-config"
+    / "v1_0"
+    / "schema.json",
+}
+"""
+Schemas which the generated configs reference. These are served from the copies bundled with csvcubed so that
+network latency doesn't pollute the timings.
+"""
+
+
+@dataclass
+class TargetResult:
+    """The timings recorded for one benchmark target at one scale."""
+
+    times_s: List[float] = field(default_factory=list)
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.times_s)
+
+    @property
+    def min_s(self) -> float:
+        return min(self.times_s)
+
+    def as_dict(self) -> dict:
+        return {
+            "times_s": self.times_s,
+            "median_s": self.median_s,
+            "min_s": self.min_s,
+        }
+
+
+def _deserialise_cube(generated_cube: GeneratedCube) -> QbCube:
+    config = load_resource(generated_cube.config_path)
+    deserialiser = get_deserialiser_for_schema(config.get("$schema"))
+    cube, _, _ = deserialiser(generated_cube.csv_path, generated_cube.config_path)
+    return cube
+
+
+def _get_new_code_lists(cube: QbCube) -> List[NewQbCodeList]:
+    return [
+        c.structural_definition.code_list
+        for c in get_columns_of_dsd_type(cube, NewQbDimension)
+        if isinstance(c.structural_definition.code_list, NewQbCodeList)
+    ]
+
+
+def _time_build(generated_cube: GeneratedCube, out_dir: Path) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        build(
+            generated_cube.csv_path,
+            generated_cube.config_path,
+            output_directory=out_dir,
+        )
+        return time.perf_counter() - start
+
+
+def _time_inspect(generated_cube: GeneratedCube, out_dir: Path) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        cube, _ = build(
+            generated_cube.csv_path,
+            generated_cube.config_path,
+            output_directory=out_dir,
+        )
+        metadata_file_path = out_dir / QbWriter(cube).csv_metadata_file_name
+
+        start = time.perf_counter()
+        inspect(metadata_file_path)
+        return time.perf_counter() - start
+
+
+def _time_select_qube_components(generated_cube: GeneratedCube, out_dir: Path) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        cube, _ = build(
+            generated_cube.csv_path,
+            generated_cube.config_path,
+            output_directory=out_dir,
+        )
+    metadata_file_path = out_dir / QbWriter(cube).csv_metadata_file_name
+    rdf_graph = CsvwRdfManager(metadata_file_path).rdf_graph
+    dsd_uri = select_csvw_dsd_dataset_label_and_dsd_def_uri(rdf_graph).dsd_uri
+
+    start = time.perf_counter()
+    select_csvw_dsd_qube_components(rdf_graph, dsd_uri, metadata_file_path)
+    return time.perf_counter() - start
+
+
+def _time_qb_writer_write(generated_cube: GeneratedCube, out_dir: Path) -> float:
+    writer = QbWriter(_deserialise_cube(generated_cube))
+    start = time.perf_counter()
+    writer.write(out_dir)
+    return time.perf_counter() - start
+
+
+def _time_skos_code_list_writer_write(
+    generated_cube: GeneratedCube, out_dir: Path
+) -> float:
+    writers = [
+        SkosCodeListWriter(code_list)
+        for code_list in _get_new_code_lists(_deserialise_cube(generated_cube))
+    ]
+    start = time.perf_counter()
+    for writer in writers:
+        writer.write(out_dir)
+    return time.perf_counter() - start
+
+
+def _time_cube_validate(generated_cube: GeneratedCube, out_dir: Path) -> float:
+    cube = _deserialise_cube(generated_cube)
+    start = time.perf_counter()
+    cube.validate()
+    return time.perf_counter() - start
+
+
+TARGETS: Dict[str, Callable[[GeneratedCube, Path], float]] = {
+    "build": _time_build,
+    "inspect": _time_inspect,
+    "select_csvw_dsd_qube_components": _time_select_qube_components,
+    "QbWriter.write": _time_qb_writer_write,
+    "SkosCodeListWriter.write": _time_skos_code_list_writer_write,
+    "Cube.validate": _time_cube_validate,
+}
+"""Map of target name to a function which performs any necessary set-up and returns the duration of the operation."""
+
+
+@contextlib.contextmanager
+def _serve_remote_schemas_locally() -> Iterator[None]:
+    with requests_mock.Mocker(real_http=True) as mocker:
+        for uri, path in REMOTE_SCHEMAS_TO_SERVE_LOCALLY.items():
+            with open(path) as f:
+                mocker.register_uri("GET", uri, text=f.read())
+        yield
+
+
+def get_environment_description() -> dict:
+    return {
+        "csvcubed_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run_benchmarks(
+    shapes: Dict[str, CubeShape],
+    targets: List[str],
+    work_dir: Path,
+    repeats: int = 3,
+) -> dict:
+    """
+    Times each of the :obj:`targets` against a synthetic cube for each of the :obj:`shapes`.
+
+    :obj:`shapes` maps a scale name (e.g. `10k`) to the shape of the cube to generate for that scale.
+
+    :return: a JSON-serialisable document containing the timings.
+    """
+    unknown_targets = [t for t in targets if t not in TARGETS]
+    if any(unknown_targets):
+        raise ValueError(f"Unknown benchmark target(s): {', '.join(unknown_targets)}")
+
+    results: Dict[str, dict] = {}
+    with _serve_remote_schemas_locally():
+        for scale_name, shape in shapes.items():
+            _logger.info("Generating cube for scale %s (%s)", scale_name, shape)
+            generated_cube = write_cube(shape, work_dir / "inputs")
+
+            target_results: Dict[str, dict] = {}
+            for target in targets:
+                target_result = TargetResult()
+                for repeat in range(repeats):
+                    out_dir = work_dir / "outputs" / scale_name / f"{target}-{repeat}"
+                    if out_dir.exists():
+                        shutil.rmtree(out_dir)
+                    out_dir.mkdir(parents=True)
+
+                    duration = TARGETS[target](generated_cube, out_dir)
+                    _logger.info(
+                        "%s @ %s (repeat %d): %.3fs",
+                        target,
+                        scale_name,
+                        repeat,
+                        duration,
+                    )
+                    target_result.times_s.append(duration)
+                    shutil.rmtree(out_dir)
+
+                target_results[target] = target_result.as_dict()
+
+            results[scale_name] = {
+                "shape": shape.as_dict(),
+                "targets": target_results,
+            }
+
+    return {
+        "environment": get_environment_description(),
+        "results": results,
+    }
+
+
+def iterate_medians(results: dict) -> Iterator[Tuple[str, str, float]]:
+    """
+    Yields `(scale, target, median_seconds)` for each timing held in a results document.
+    """
+    for scale_name, scale_results in results.get("results", {}).items():
+        for target, target_result in scale_results.get("targets", {}).items():
+            yield scale_name, target, target_result["median_s"]
@@ -1,26 +1,30 @@
 """
 Build Command
 -------------
-Build a qb-flavoured CSV-W from a config.json and a tidy CSV.
+Build a qb-flavoured CSV-W from a config.json and a tidy CSV (or a tidy dataframe held in memory).
 """
 import dataclasses
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 
 import jsonschema
+import pandas as pd
 from csvcubedmodels.dataclassbase import DataClassBase
 from csvcubed.cli.error_mapping import friendly_error_mapping
-from csvcubed.models.cube import QbCube
+from csvcubed.models.cube import NewQbCodeList, QbCube
 from csvcubed.models.errorurl import HasErrorUrl
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.readers.cubeconfig.schema_versions import (
     QubeConfigDeserialiser,
+    get_dataframe_deserialiser_for_schema,
     get_deserialiser_for_schema,
 )
 from csvcubed.readers.cubeconfig.utils import load_resource
+from csvcubed.utils.csvwriter import CsvWriterEngine
 from csvcubed.utils.json import serialize_sets
+from csvcubed.utils.qb.standardise import ensure_qbcube_data_is_categorical
 from csvcubed.utils.qb.validation.cube import validate_qb_component_constraints
 from csvcubed.writers.qbwriter import QbWriter
 
@@ -28,16 +32,90 @@ _logger = logging.getLogger(__name__)
 
 
 def build(
-    csv_path: Path,
+    csv_path: Union[Path, List[Path]],
     config_path: Optional[Path] = None,
     output_directory: Path = Path(".", "out").resolve(),
     fail_when_validation_error_occurs: bool = False,
     validation_errors_file_name: Optional[str] = None,
+    csv_writer_engine: CsvWriterEngine = CsvWriterEngine.Pandas,
+    partition_by: Optional[str] = None,
 ) -> Tuple[QbCube, List[ValidationError]]:
+    """
+    Build a qb-flavoured CSV-W from a tidy CSV, or from a list of CSV shards which together hold the cube's data.
+
+    Shards are read in parallel using the same datatypes and must all have the same columns.
+
+    :param partition_by: optionally, the title of a dimension column; one observations CSV is written for each of its
+        values.
+    """
     cube, json_schema_validation_errors, validation_errors = _extract_and_validate_cube(
         config_path, csv_path
     )
 
+    return _write_cube(
+        cube,
+        json_schema_validation_errors,
+        validation_errors,
+        output_directory,
+        fail_when_validation_error_occurs,
+        validation_errors_file_name,
+        csv_writer_engine,
+        partition_by,
+    )
+
+
+def build_from_dataframe(
+    data: pd.DataFrame,
+    config: Union[dict, Path, None] = None,
+    output_directory: Path = Path(".", "out").resolve(),
+    title: Optional[str] = None,
+    fail_when_validation_error_occurs: bool = False,
+    validation_errors_file_name: Optional[str] = None,
+    csv_writer_engine: CsvWriterEngine = CsvWriterEngine.Pandas,
+    partition_by: Optional[str] = None,
+) -> Tuple[QbCube, List[ValidationError]]:
+    """
+    Build a qb-flavoured CSV-W from a tidy dataframe held in memory, without first writing it out to a CSV file.
+
+    The dataframe's columns are coerced to the datatypes the qube-config expects (columns already holding compatible
+    data, e.g. categoricals, are used as they are) and the cube is validated exactly as :func:`build` validates it.
+    The dataframe passed in is not modified.
+
+    :param config: the qube-config, either as a dictionary or the path to its json file. Code list files referenced
+        by a dictionary config are resolved relative to the current working directory.
+    :param title: the cube's title, required when the config does not define one.
+    :param partition_by: optionally, the title of a dimension column; one observations CSV is written for each of its
+        values.
+    """
+    (
+        cube,
+        json_schema_validation_errors,
+        validation_errors,
+    ) = _extract_and_validate_cube_from_dataframe(data, config, title)
+
+    return _write_cube(
+        cube,
+        json_schema_validation_errors,
+        validation_errors,
+        output_directory,
+        fail_when_validation_error_occurs,
+        validation_errors_file_name,
+        csv_writer_engine,
+        partition_by,
+    )
+
+
+def _write_cube(
+    cube: QbCube,
+    json_schema_validation_errors: List[jsonschema.ValidationError],
+    validation_errors: List[ValidationError],
+    output_directory: Path,
+    fail_when_validation_error_occurs: bool,
+    validation_errors_file_name: Optional[str],
+    csv_writer_engine: CsvWriterEngine,
+    partition_by: Optional[str],
+    unchanged_code_lists: Optional[List[NewQbCodeList]] = None,
+) -> Tuple[QbCube, List[ValidationError]]:
     if not output_directory.exists():
         _logger.debug("Creating output directory %s", output_directory.absolute())
         output_directory.mkdir(parents=True)
@@ -69,7 +147,12 @@ def build(
                 )
 
     try:
-        writer = QbWriter(cube)
+        writer = QbWriter(
+            cube,
+            csv_writer_engine=csv_writer_engine,
+            partition_by=partition_by,
+            unchanged_code_lists=unchanged_code_lists or [],
+        )
         writer.write(output_directory)
     except:
         _logger.fatal("Failed to generate CSV-W.")
@@ -92,8 +175,11 @@ def _write_errors_to_log(
         _logger.warning("Schema Validation Error: %s", err.message)
 
 
-def _extract_and_validate_cube(config_path: Optional[Path], csv_path: Path):
-    _logger.debug("CSV: %s", csv_path.absolute() if csv_path is not None else "")
+def _extract_and_validate_cube(
+    config_path: Optional[Path], csv_path: Union[Path, List[Path]]
+):
+    csv_paths = [csv_path] if isinstance(csv_path, Path) else csv_path
+    _logger.debug("CSV: %s", ", ".join(str(p.absolute()) for p in csv_paths))
     _logger.debug(
         "qube-config.json: %s",
         config_path.absolute() if config_path is not None else "",
@@ -105,6 +191,39 @@ def _extract_and_validate_cube(config_path: Optional[Path], csv_path: Path):
         csv_path, config_path
     )
 
+    return _validate_cube(cube, json_schema_validation_errors, validation_errors)
+
+
+def _extract_and_validate_cube_from_dataframe(
+    data: pd.DataFrame, config: Union[dict, Path, None], title: Optional[str]
+):
+    if isinstance(config, Path):
+        _logger.debug("qube-config.json: %s", config.absolute())
+        config_path: Optional[Path] = config
+        config = load_resource(config.resolve())
+    else:
+        config_path = None
+
+    deserialiser = get_dataframe_deserialiser_for_schema(
+        None if config is None else config.get("$schema")
+    )
+
+    cube, json_schema_validation_errors, validation_errors = deserialiser(
+        data, config, config_path, title, None
+    )
+
+    return _validate_cube(cube, json_schema_validation_errors, validation_errors)
+
+
+def _validate_cube(
+    cube: QbCube,
+    json_schema_validation_errors: List[jsonschema.ValidationError],
+    validation_errors: List[ValidationError],
+):
+    # Converting the data to categoricals up-front (rather than when writing) lets validation, e.g. the check for
+    # duplicate observations, work on the categorical codes rather than on the underlying strings.
+    ensure_qbcube_data_is_categorical(cube)
+
     validation_errors += cube.validate()
     validation_errors += validate_qb_component_constraints(cube)
 
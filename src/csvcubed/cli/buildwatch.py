@@ -0,0 +1,272 @@
+"""
+Build Watch
+-----------
+
+Rebuilds a qb-flavoured CSV-W whenever its tidy CSV, its qube-config.json or the code list files the config refers to
+change.
+
+The watcher keeps the parsed data and the components each column was mapped to in memory between builds, so a
+rebuild only does the work affected by the change:
+
+* the CSV is only read again when it (or the datatypes the config asks for) changes,
+* only the columns whose configuration changed are mapped to components again, and
+* only the code lists which changed are written again.
+
+The observations CSV and the CSV-W metadata are always written.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from csvcubed.cli.build import _validate_cube, _write_cube
+from csvcubed.models.cube import NewQbCodeList, NewQbDimension, QbCube
+from csvcubed.models.validationerror import ValidationError
+from csvcubed.readers.cubeconfig.schema_versions import (
+    get_dataframe_deserialiser_for_schema,
+)
+from csvcubed.readers.cubeconfig.utils import (
+    generate_title_from_file_name,
+    load_resource,
+    read_and_check_csv,
+)
+from csvcubed.readers.cubeconfig.v1 import datatypes
+from csvcubed.readers.cubeconfig.v1.configdeserialiser import ColumnMappingCache
+from csvcubed.utils.csvwriter import CsvWriterEngine
+from csvcubed.utils.qb.cube import get_columns_of_dsd_type
+from csvcubed.utils.uri import looks_like_uri
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.5
+"""
+The number of seconds between checks for changes to the watched files.
+"""
+
+_FileSignature = Optional[Tuple[int, int]]
+
+
+@dataclass
+class BuildWatcher:
+    """
+    Builds a CSV-W and rebuilds it when the files it is built from change.
+    """
+
+    csv_paths: List[Path]
+    config_path: Optional[Path] = None
+    output_directory: Path = Path(".", "out").resolve()
+    fail_when_validation_error_occurs: bool = False
+    validation_errors_file_name: Optional[str] = None
+    csv_writer_engine: CsvWriterEngine = CsvWriterEngine.Pandas
+    partition_by: Optional[str] = None
+
+    _column_mapping_cache: ColumnMappingCache = field(
+        default_factory=ColumnMappingCache, init=False, repr=False
+    )
+    _data: Optional[pd.DataFrame] = field(default=None, init=False, repr=False)
+    _data_errors: List[ValidationError] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _data_key: Optional[tuple] = field(default=None, init=False, repr=False)
+    _written_code_lists: List[NewQbCodeList] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _written_uri_style: Optional[str] = field(default=None, init=False, repr=False)
+    _file_signatures: Dict[Path, _FileSignature] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def build(self) -> Tuple[Optional[QbCube], List[ValidationError]]:
+        """
+        Builds the CSV-W, reusing the data and column mappings from the previous build where they're unaffected by
+        changes.
+
+        Member of :class:`./BuildWatcher`.
+
+        :return: `Tuple[Optional[QbCube], List[ValidationError]]` - the cube (`None` if the output wasn't written
+            because of validation errors) and the validation errors found.
+        """
+        # N.B. the files' signatures are recorded before building so that a failed build isn't retried until the
+        # files change again.
+        self._file_signatures = self._get_file_signatures(self._try_load_config())
+        config = (
+            None
+            if self.config_path is None
+            else load_resource(self.config_path.resolve())
+        )
+
+        deserialiser = get_dataframe_deserialiser_for_schema(
+            None if config is None else config.get("$schema")
+        )
+        data, data_errors = self._get_data(config)
+
+        cube, json_schema_validation_errors, validation_errors = deserialiser(
+            data,
+            config,
+            self.config_path,
+            generate_title_from_file_name(self.csv_paths[0]),
+            self._column_mapping_cache,
+        )
+        cube, json_schema_validation_errors, validation_errors = _validate_cube(
+            cube, json_schema_validation_errors, data_errors + validation_errors
+        )
+
+        unchanged_code_lists = (
+            self._written_code_lists
+            if self._written_uri_style == str(cube.uri_style)
+            else []
+        )
+        try:
+            _write_cube(
+                cube,
+                json_schema_validation_errors,
+                validation_errors,
+                self.output_directory,
+                self.fail_when_validation_error_occurs,
+                self.validation_errors_file_name,
+                self.csv_writer_engine,
+                self.partition_by,
+                unchanged_code_lists=unchanged_code_lists,
+            )
+        except SystemExit:
+            # Raised when validation errors occur and `fail_when_validation_error_occurs` is set.
+            _logger.error(
+                "The CSV-W was not written since the cube has %s validation error(s).",
+                len(validation_errors),
+            )
+            return None, validation_errors
+
+        self._written_code_lists = [
+            column.structural_definition.code_list
+            for column in get_columns_of_dsd_type(cube, NewQbDimension)
+            if isinstance(column.structural_definition.code_list, NewQbCodeList)
+        ]
+        self._written_uri_style = str(cube.uri_style)
+
+        return cube, validation_errors
+
+    def rebuild_if_changed(self) -> bool:
+        """
+        Rebuilds the CSV-W if any of the files it is built from have changed since the last build.
+
+        Member of :class:`./BuildWatcher`.
+
+        :return: `bool` - whether the CSV-W was rebuilt.
+        """
+        if self._get_file_signatures(self._try_load_config()) == self._file_signatures:
+            return False
+
+        _logger.info("Changes detected, rebuilding.")
+        self.build()
+        return True
+
+    def watch(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """
+        Builds the CSV-W and then rebuilds it whenever the files it is built from change, until interrupted.
+
+        Member of :class:`./BuildWatcher`.
+        """
+        print(
+            "Watching for changes to "
+            + ", ".join(str(p) for p in self._get_watched_paths(None))
+            + " (press Ctrl+C to stop)"
+        )
+        try:
+            self._build_logging_errors(self.build)
+            while True:
+                time.sleep(poll_interval)
+                self._build_logging_errors(self.rebuild_if_changed)
+        except KeyboardInterrupt:
+            _logger.info("Stopped watching for changes.")
+
+    def _build_logging_errors(self, build) -> None:
+        # The build's input is likely to be mid-edit, so errors shouldn't stop the watcher.
+        try:
+            build()
+        except Exception:
+            _logger.exception("Failed to build the CSV-W; waiting for further changes.")
+
+    def _try_load_config(self) -> Optional[dict]:
+        if self.config_path is None or not self.config_path.exists():
+            return None
+
+        try:
+            return load_resource(self.config_path.resolve())
+        except Exception:
+            # The config may be part-way through being saved; it's checked again on the next poll.
+            _logger.debug("Unable to load the config", exc_info=True)
+            return None
+
+    def _get_data(
+        self, config: Optional[dict]
+    ) -> Tuple[pd.DataFrame, List[ValidationError]]:
+        """
+        Returns the cube's data, only reading the CSV again if it (or the datatypes the config asks for) has changed.
+        """
+        dtype = datatypes.get_pandas_datatypes(self.csv_paths[0], config=config or {})
+        data_key = (
+            tuple(_get_file_signature(p) for p in self.csv_paths),
+            tuple(sorted(dtype.items())),
+        )
+        if self._data is None or data_key != self._data_key:
+            _logger.info("Reading %s", ", ".join(str(p) for p in self.csv_paths))
+            self._data, self._data_errors = read_and_check_csv(
+                self.csv_paths[0] if len(self.csv_paths) == 1 else self.csv_paths,
+                dtype=dtype,
+            )
+            self._data_key = data_key
+            # Columns are mapped to components using their data, so the mappings are now stale.
+            self._column_mapping_cache.clear()
+        else:
+            _logger.debug("The CSV is unchanged; reusing its data.")
+
+        return self._data, list(self._data_errors)
+
+    def _get_file_signatures(
+        self, config: Optional[dict]
+    ) -> Dict[Path, _FileSignature]:
+        return {p: _get_file_signature(p) for p in self._get_watched_paths(config)}
+
+    def _get_watched_paths(self, config: Optional[dict]) -> List[Path]:
+        watched_paths = list(self.csv_paths)
+        if self.config_path is not None:
+            watched_paths.append(self.config_path)
+            watched_paths += _get_local_code_list_paths(config, self.config_path)
+
+        return watched_paths
+
+
+def _get_local_code_list_paths(config: Optional[dict], config_path: Path) -> List[Path]:
+    """
+    Returns the paths to the code list config files the config refers to.
+    """
+    if config is None or not isinstance(config.get("columns"), dict):
+        return []
+
+    code_list_paths = []
+    for column_config in config["columns"].values():
+        code_list = (
+            column_config.get("code_list") if isinstance(column_config, dict) else None
+        )
+        if isinstance(code_list, str) and not looks_like_uri(code_list):
+            code_list_path = Path(code_list)
+            if not code_list_path.is_absolute():
+                code_list_path = config_path.parent / code_list_path
+            code_list_paths.append(code_list_path)
+
+    return code_list_paths
+
+
+def _get_file_signature(path: Path) -> _FileSignature:
+    """
+    Identifies the version of the file by its modification time and size (`None` if it doesn't exist).
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
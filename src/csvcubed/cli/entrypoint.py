@@ -3,21 +3,33 @@ CLI
 ---
 The *Command Line Interface* for :mod:`~csvcubed.cli`.
 """
+import glob
 import logging
 import sys
 from pathlib import Path
+from typing import List, Optional, Set, Tuple
 
 import click
 
 from csvcubed import __version__
 from csvcubed.utils.log import log_exception, start_logging
-from csvcubed.cli.inspect.inspect import inspect
-from csvcubed.cli.build import build
+from csvcubed.cli.inspect.inspectoptions import InspectOutputFormat, InspectSection
+from csvcubed.cli.serve.client import submit_build_job, submit_inspect_job
+from csvcubed.cli.serve.defaults import (
+    DEFAULT_HOST,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PORT,
+)
 from csvcubed.models.errorurl import HasErrorUrl
+from csvcubed.utils.csvwriterengine import CsvWriterEngine
+from csvcubed.utils.sparql_handler.storebackend import RdfStoreBackend
 
 
 _logger = logging.getLogger(__name__)
 
+# N.B. the modules doing the work (and the libraries they depend upon, e.g. pandas and rdflib) are only imported by
+# the commands which use them, so that submitting a job to a server (`--server`) starts quickly.
+
 
 @click.group(context_settings=dict(help_option_names=["-h", "--help"]))
 def entry_point():
@@ -66,6 +78,36 @@ def version():
     default=False,
     show_default=True,
 )
+@click.option(
+    "--writer",
+    "csv_writer",
+    help="The engine used to write the CSV files. 'chunked' is faster for large cubes; both produce identical output.",
+    type=click.Choice([e.value for e in CsvWriterEngine], case_sensitive=False),
+    default=CsvWriterEngine.Pandas.value,
+    show_default=True,
+)
+@click.option(
+    "--partition-by",
+    "partition_by",
+    help="The title of a dimension column to partition the observations by; one CSV is written for each of its values.",
+    type=str,
+    required=False,
+    metavar="COLUMN_TITLE",
+)
+@click.option(
+    "--server",
+    "server_url",
+    help=f"The URL of a running csvcubed server (see the 'serve' command) to run the build on, e.g. 'http://{DEFAULT_HOST}:{DEFAULT_PORT}'.",
+    type=str,
+    required=False,
+    metavar="SERVER_URL",
+)
+@click.option(
+    "--watch",
+    help="Keep running, rebuilding the CSV-W whenever the tidy CSV, the qube-config or its code lists change.",
+    is_flag=True,
+    default=False,
+)
 @click.option(
     "--log-level",
     help="select a logging level out of: 'warn', 'err', 'crit', 'info' or 'debug'.",
@@ -73,17 +115,37 @@ def version():
     default="warn",
 )
 @click.argument(
-    "csv", type=click.Path(exists=True, path_type=Path), metavar="TIDY_CSV_PATH"
+    "csv",
+    type=click.Path(path_type=Path),
+    nargs=-1,
+    required=True,
+    metavar="TIDY_CSV_PATH...",
 )
 def build_command(
     config: Path,
     out: Path,
-    csv: Path,
+    csv: Tuple[Path, ...],
     log_level: str,
     fail_when_validation_error: bool,
     validation_errors_to_file: bool,
+    csv_writer: str,
+    partition_by: Optional[str],
+    server_url: Optional[str],
+    watch: bool,
 ):
-    """Build a qb-flavoured CSV-W from a tidy CSV."""
+    """
+    Build a qb-flavoured CSV-W from a tidy CSV.
+
+    The cube's data may be split across several CSV shards with the same columns; pass each of the shards' paths or
+    a glob pattern matching them (e.g. 'data/*.csv').
+    """
+    if watch and server_url is not None:
+        raise click.BadParameter(
+            "The build can't be watched whilst running on a server.",
+            param_hint="--watch",
+        )
+
+    csv_paths = _expand_csv_paths(csv)
     validation_errors_file_name = (
         "validation-errors.json" if validation_errors_to_file else None
     )
@@ -91,12 +153,46 @@ def build_command(
 
     start_logging(log_dir_name="csvcubed-cli", selected_logging_level=log_level)
     try:
+        if server_url is not None:
+            result = submit_build_job(
+                server_url,
+                csv_paths,
+                config_path=config,
+                output_directory=out,
+                fail_when_validation_error=fail_when_validation_error,
+                validation_errors_to_file=validation_errors_to_file,
+                csv_writer=csv_writer,
+                partition_by=partition_by,
+            )
+            for validation_error in result["validation_errors"]:
+                _logger.warning(validation_error)
+            print(f"Build Complete @ {result['output_directory']}")
+            return
+
+        if watch:
+            from csvcubed.cli.buildwatch import BuildWatcher
+
+            BuildWatcher(
+                csv_paths,
+                config_path=config,
+                output_directory=out,
+                fail_when_validation_error_occurs=fail_when_validation_error,
+                validation_errors_file_name=validation_errors_file_name,
+                csv_writer_engine=CsvWriterEngine(csv_writer.lower()),
+                partition_by=partition_by,
+            ).watch()
+            return
+
+        from csvcubed.cli.build import build
+
         build(
             config_path=config,
             output_directory=out,
-            csv_path=csv,
+            csv_path=csv_paths[0] if len(csv_paths) == 1 else csv_paths,
             fail_when_validation_error_occurs=fail_when_validation_error,
             validation_errors_file_name=validation_errors_file_name,
+            csv_writer_engine=CsvWriterEngine(csv_writer.lower()),
+            partition_by=partition_by,
         )
 
     except Exception as e:
@@ -104,6 +200,53 @@ def build_command(
         sys.exit(1)
 
 
+def _expand_csv_paths(csv_paths: Tuple[Path, ...]) -> List[Path]:
+    """
+    Expands any glob patterns (which the shell hasn't already expanded) into the paths of the files they match.
+    """
+    expanded_paths: List[Path] = []
+    for csv_path in csv_paths:
+        if csv_path.exists():
+            expanded_paths.append(csv_path)
+            continue
+
+        matching_paths = sorted(Path(p) for p in glob.glob(str(csv_path)))
+        if len(matching_paths) == 0:
+            raise click.BadParameter(
+                f"'{csv_path}' does not exist.", param_hint="TIDY_CSV_PATH"
+            )
+        expanded_paths += matching_paths
+
+    return expanded_paths
+
+
+def _parse_inspect_sections(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[Set[InspectSection]]:
+    """
+    Parses the comma-separated list of sections to inspect; `None` meaning all sections.
+    """
+    if value is None:
+        return None
+
+    sections: Set[InspectSection] = set()
+    for section_name in value.split(","):
+        section_name = section_name.strip().lower()
+        if section_name == "":
+            continue
+        try:
+            sections.add(InspectSection(section_name))
+        except ValueError:
+            raise click.BadParameter(
+                f"'{section_name}' is not a section. Choose from: "
+                + ", ".join(s.value for s in InspectSection),
+                ctx=ctx,
+                param=param,
+            )
+
+    return sections
+
+
 @entry_point.command("inspect")
 @click.option(
     "--log-level",
@@ -111,18 +254,176 @@ def build_command(
     type=click.Choice(["warn", "err", "crit", "info", "debug"], case_sensitive=False),
     default="warn",
 )
+@click.option(
+    "--duplicates",
+    help="Count the duplicate observations. This requires reading the whole CSV so is slower for large cubes.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--format",
+    "output_format",
+    help="The format of the output. Machine-readable formats ('json' and 'ndjson') are cached beside the metadata file.",
+    type=click.Choice([f.value for f in InspectOutputFormat], case_sensitive=False),
+    default=InspectOutputFormat.Text.value,
+    show_default=True,
+)
+@click.option(
+    "--no-cache",
+    help="Don't read or write cached results for the machine-readable formats.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--rdf-store",
+    "rdf_store",
+    help="The store the CSV-W's RDF is loaded into and queried with. 'oxigraph' is faster for large CSV-Ws but requires the optional 'oxrdflib' package.",
+    type=click.Choice([b.value for b in RdfStoreBackend], case_sensitive=False),
+    default=RdfStoreBackend.Rdflib.value,
+    show_default=True,
+)
+@click.option(
+    "--graph-cache",
+    "graph_cache",
+    help="Cache the CSV-W's parsed RDF beside the metadata file so that inspecting it again (whilst it remains unchanged) is faster.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--sections",
+    help="Comma-separated list of the sections to output, out of: "
+    + ", ".join(s.value for s in InspectSection)
+    + ". Defaults to all sections. Sections which aren't output aren't computed, e.g. 'metadata,dsd' never reads the observations CSV.",
+    type=str,
+    default=None,
+    callback=_parse_inspect_sections,
+)
+@click.option(
+    "--server",
+    "server_url",
+    help=f"The URL of a running csvcubed server (see the 'serve' command) to run the inspection on, e.g. 'http://{DEFAULT_HOST}:{DEFAULT_PORT}'.",
+    type=str,
+    required=False,
+    metavar="SERVER_URL",
+)
 @click.argument(
     "csvw_metadata_json_path",
     type=click.Path(exists=True, path_type=Path),
     metavar="CSVW_METADATA_JSON_PATH",
 )
-def inspect_command(log_level: str, csvw_metadata_json_path: Path) -> None:
+def inspect_command(
+    log_level: str,
+    duplicates: bool,
+    output_format: str,
+    no_cache: bool,
+    rdf_store: str,
+    graph_cache: bool,
+    sections: Optional[Set[InspectSection]],
+    server_url: Optional[str],
+    csvw_metadata_json_path: Path,
+) -> None:
     """Inspect the contents of a CSV-W generated by csvcubed."""
     start_logging(log_dir_name="csvcubed-cli", selected_logging_level=log_level)
     try:
-        inspect(csvw_metadata_json_path)
+        if server_url is not None:
+            output = submit_inspect_job(
+                server_url,
+                csvw_metadata_json_path,
+                count_duplicates=duplicates,
+                output_format=output_format,
+                use_cache=not no_cache,
+                rdf_store=rdf_store,
+                use_graph_cache=graph_cache,
+                sections=None if sections is None else [s.value for s in sections],
+            )
+            if output is not None:
+                print(output, end="")
+            return
+
+        from csvcubed.cli.inspect.inspect import inspect
+
+        inspect(
+            csvw_metadata_json_path,
+            count_duplicates=duplicates,
+            output_format=InspectOutputFormat(output_format.lower()),
+            use_cache=not no_cache,
+            rdf_store_backend=RdfStoreBackend(rdf_store.lower()),
+            use_graph_cache=graph_cache,
+            sections=sections,
+        )
     except Exception as e:
         log_exception(_logger, e)
         if isinstance(e, HasErrorUrl):
             _logger.error(f"More information available at {e.get_error_url()}")
         sys.exit(1)
+
+
+@entry_point.command("serve")
+@click.option(
+    "--host",
+    help="The interface to listen on. The server reads and writes any local path it is sent, so only listen on other interfaces with care.",
+    default=DEFAULT_HOST,
+    show_default=True,
+)
+@click.option(
+    "--port",
+    help="The port to listen on.",
+    type=int,
+    default=DEFAULT_PORT,
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    help="The maximum number of jobs run at once.",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_WORKERS,
+    show_default=True,
+)
+@click.option(
+    "--log-level",
+    help="select a logging level out of: 'warn', 'err', 'crit', 'info' or 'debug'.",
+    type=click.Choice(["warn", "err", "crit", "info", "debug"], case_sensitive=False),
+    default="warn",
+)
+def serve_command(host: str, port: int, workers: int, log_level: str) -> None:
+    """
+    Run a local server which builds and inspects CSV-Ws on request.
+
+    The server keeps csvcubed's libraries loaded and its caches warm between jobs, so jobs submitted with the
+    build and inspect commands' '--server' option only take as long as the work itself.
+    """
+    start_logging(log_dir_name="csvcubed-cli", selected_logging_level=log_level)
+    try:
+        from csvcubed.cli.serve.server import serve
+
+        serve(host, port, workers)
+    except Exception as e:
+        log_exception(_logger, e)
+        sys.exit(1)
+
+
+@entry_point.command("validate-output")
+@click.option(
+    "--log-level",
+    help="select a logging level out of: 'warn', 'err', 'crit', 'info' or 'debug'.",
+    type=click.Choice(["warn", "err", "crit", "info", "debug"], case_sensitive=False),
+    default="warn",
+)
+@click.argument(
+    "csvw_metadata_json_path",
+    type=click.Path(exists=True, path_type=Path),
+    metavar="CSVW_METADATA_JSON_PATH",
+)
+def validate_output_command(log_level: str, csvw_metadata_json_path: Path) -> None:
+    """Check a CSV-W's data satisfy its primary key and code list foreign key constraints."""
+    start_logging(log_dir_name="csvcubed-cli", selected_logging_level=log_level)
+    try:
+        from csvcubed.cli.validateoutput import validate_output
+
+        errors = validate_output(csvw_metadata_json_path)
+    except Exception as e:
+        log_exception(_logger, e)
+        sys.exit(1)
+
+    if len(errors) > 0:
+        sys.exit(1)
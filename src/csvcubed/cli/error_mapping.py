@@ -22,6 +22,8 @@ from csvcubed.models.cube import (
     ObservationValuesMissing,
     MissingColumnDefinitionError,
     DuplicateColumnTitleError,
+    DuplicateObservationsError,
+    InconsistentShardColumnsError,
     ColumnValidationError,
     ColumnNotFoundInDataError,
     QbObservationValue,
@@ -62,6 +64,8 @@ def friendly_error_mapping(error: ValidationError) -> str:
         CsvColumnUriTemplateMissingError: "The '{error.csv_column_name}' column definition is missing a 'cell_uri_template'; a suitable "
         "value could not be inferred.",
         DuplicateColumnTitleError: "There are multiple CSV columns with the title: '{error.csv_column_title}'.",
+        DuplicateObservationsError: "{error.message}",
+        InconsistentShardColumnsError: "{error.message}",
         EmptyQbMultiMeasureDimensionError: "A Measure column has been defined but no measures have been defined within it",
         EmptyQbMultiUnitsError: "A Unit column has been defined but no units have been defined within it",
         MoreThanOneObservationsColumnError: "Found {error.actual_number} observed values columns. Only 1 is permitted.",
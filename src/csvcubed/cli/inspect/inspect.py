@@ -5,9 +5,10 @@ Inspect Command
 Output CSV-W metadata in a user-friendly format to the CLI for validation.
 """
 
+import json
 import logging
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Optional, Set, Tuple
 from os import linesep
 
 import rdflib
@@ -16,24 +17,139 @@ from csvcubed.cli.inspect.metadatainputvalidator import (
     CSVWType,
     MetadataValidator,
 )
+from csvcubed.cli.inspect.inspectoptions import InspectOutputFormat, InspectSection
 from csvcubed.cli.inspect.metadataprinter import MetadataPrinter
+from csvcubed.cli.inspect.inspectcache import (
+    get_inspect_cache_key,
+    read_cached_inspect_results,
+    write_cached_inspect_results,
+)
+from csvcubed.utils.sparql_handler.store import RdfStoreBackend
 from csvcubed.utils.tableschema import CsvwRdfManager
 from csvcubed.models.csvcubedexception import FailedToLoadRDFGraphException
 
 _logger = logging.getLogger(__name__)
 
 
-def inspect(csvw_metadata_json_path: Path) -> None:
+def inspect(
+    csvw_metadata_json_path: Path,
+    count_duplicates: bool = False,
+    output_format: InspectOutputFormat = InspectOutputFormat.Text,
+    use_cache: bool = True,
+    rdf_store_backend: RdfStoreBackend = RdfStoreBackend.Rdflib,
+    use_graph_cache: bool = False,
+    sections: Optional[Set[InspectSection]] = None,
+) -> None:
     """
     Command for validating CSV-W metadata files through the CLI.
 
+    Prints the output of :func:`get_inspect_output`.
+
     Member of :file:`./inspect.py`
 
     :return: `None`
     """
+    output = get_inspect_output(
+        csvw_metadata_json_path,
+        count_duplicates,
+        output_format,
+        use_cache,
+        rdf_store_backend,
+        use_graph_cache,
+        sections,
+    )
+    if output is not None:
+        print(output, end="")
+
+
+def get_inspect_output(
+    csvw_metadata_json_path: Path,
+    count_duplicates: bool = False,
+    output_format: InspectOutputFormat = InspectOutputFormat.Text,
+    use_cache: bool = True,
+    rdf_store_backend: RdfStoreBackend = RdfStoreBackend.Rdflib,
+    use_graph_cache: bool = False,
+    sections: Optional[Set[InspectSection]] = None,
+) -> Optional[str]:
+    """
+    Generates the output of inspecting a CSV-W in the given format.
+
+    Only the requested `sections` (all sections by default) are output; anything not required by them (e.g. reading
+    the observations CSV) isn't computed.
+
+    Counting the duplicate observations requires reading the whole CSV and so only happens when `count_duplicates`
+    is set.
+
+    Machine-readable (JSON/NDJSON) results are cached beside the metadata file (unless `use_cache` is `False`) and
+    are reused whilst the content of the CSV-W remains unchanged.
+
+    The CSV-W's RDF is loaded into (and queried using) the store selected by `rdf_store_backend`. When
+    `use_graph_cache` is set, the parsed RDF is cached beside the metadata file and reused whilst the CSV-W remains
+    unchanged.
+
+    Member of :file:`./inspect.py`
+
+    :return: `Optional[str]` - `None` where the CSV-W is unsupported.
+    """
     _logger.debug(f"Metadata json-ld path: {csvw_metadata_json_path.absolute()}")
 
-    csvw_rdf_manager = CsvwRdfManager(csvw_metadata_json_path)
+    if output_format == InspectOutputFormat.Text:
+        return _get_text_output(
+            csvw_metadata_json_path,
+            count_duplicates,
+            rdf_store_backend,
+            use_graph_cache,
+            sections,
+        )
+
+    cache_key: Optional[str] = None
+    results: Optional[Dict[str, Any]] = None
+    if use_cache:
+        cache_key = get_inspect_cache_key(
+            csvw_metadata_json_path,
+            count_duplicates,
+            None if sections is None else [s.value for s in sections],
+        )
+        results = read_cached_inspect_results(csvw_metadata_json_path, cache_key)
+
+    if results is None:
+        results = _get_output_dict(
+            csvw_metadata_json_path,
+            count_duplicates,
+            rdf_store_backend,
+            use_graph_cache,
+            sections,
+        )
+        if results is None:
+            return None
+        if cache_key is not None:
+            write_cached_inspect_results(csvw_metadata_json_path, cache_key, results)
+
+    if output_format == InspectOutputFormat.Json:
+        return json.dumps(results, indent=4) + "\n"
+
+    return "".join(
+        json.dumps({"section": section, "results": section_results}) + "\n"
+        for section, section_results in results.items()
+    )
+
+
+def _load_and_validate_csvw(
+    csvw_metadata_json_path: Path,
+    rdf_store_backend: RdfStoreBackend,
+    use_graph_cache: bool,
+) -> Tuple[rdflib.ConjunctiveGraph, Optional[CSVWType]]:
+    """
+    Loads the CSV-W's RDF graph and detects its type.
+
+    Member of :file:`./inspect.py`
+
+    :return: `Tuple[rdflib.ConjunctiveGraph, Optional[CSVWType]]` - the RDF graph and its type (or `None` where the
+        CSV-W is unsupported).
+    """
+    csvw_rdf_manager = CsvwRdfManager(
+        csvw_metadata_json_path, rdf_store_backend, use_graph_cache
+    )
     csvw_metadata_rdf_graph = csvw_rdf_manager.rdf_graph
 
     if csvw_metadata_rdf_graph is None:
@@ -48,82 +164,76 @@ def inspect(csvw_metadata_json_path: Path) -> None:
         csvw_type,
     ) = csvw_metadata_rdf_validator.validate_and_detect_type()
 
-    if valid_csvw_metadata:
-        (
-            type_printable,
-            catalog_metadata_printable,
-            dsd_info_printable,
-            codelist_info_printable,
-            dataset_observations_printable,
-            val_counts_by_measure_unit_printable,
-            codelist_hierarchy_info_printable,
-        ) = _generate_printables(
-            csvw_type, csvw_metadata_rdf_graph, csvw_metadata_json_path
-        )
-
-        print(f"{linesep}{type_printable}")
-        print(f"{linesep}{catalog_metadata_printable}")
-        if csvw_type == CSVWType.QbDataSet:
-            print(f"{linesep}{dsd_info_printable}")
-            print(f"{linesep}{codelist_info_printable}")
-        print(f"{linesep}{dataset_observations_printable}")
-        if csvw_type == CSVWType.QbDataSet:
-            print(f"{linesep}{val_counts_by_measure_unit_printable}")
-        if csvw_type == CSVWType.CodeList:
-            print(f"{linesep}{codelist_hierarchy_info_printable}")
-
-    else:
+    if not valid_csvw_metadata:
         _logger.error(
             "This is an unsupported csv-w! Supported types are `data cube` and `code list`."
         )
+        return (csvw_metadata_rdf_graph, None)
+
+    return (csvw_metadata_rdf_graph, csvw_type)
 
 
-def _generate_printables(
-    csvw_type: CSVWType,
-    csvw_metadata_rdf_graph: rdflib.ConjunctiveGraph,
+def _get_output_dict(
     csvw_metadata_json_path: Path,
-) -> Tuple[str, str, str, str, str, str, str]:
+    count_duplicates: bool,
+    rdf_store_backend: RdfStoreBackend,
+    use_graph_cache: bool,
+    sections: Optional[Set[InspectSection]],
+) -> Optional[Dict[str, Any]]:
     """
-    Generates printables of type, metadata, dsd, code list, head/tail and value count information.
+    Generates the machine-readable results of inspecting the CSV-W.
 
     Member of :file:`./inspect.py`
 
-    :return: `Tuple[str, str, str, str, str]` - printables of metadata information.
+    :return: `Optional[Dict[str, Any]]` - `None` where the CSV-W is unsupported.
     """
-    metadata_printer = MetadataPrinter(
-        csvw_type, csvw_metadata_rdf_graph, csvw_metadata_json_path
+    csvw_metadata_rdf_graph, csvw_type = _load_and_validate_csvw(
+        csvw_metadata_json_path, rdf_store_backend, use_graph_cache
     )
+    if csvw_type is None:
+        return None
 
-    type_info_printable: str = metadata_printer.type_info_printable
-    catalog_metadata_printable: str = metadata_printer.catalog_metadata_printable
-    dsd_info_printable: str = (
-        metadata_printer.dsd_info_printable if csvw_type == CSVWType.QbDataSet else ""
-    )
-    codelist_info_printable: str = (
-        metadata_printer.codelist_info_printable
-        if csvw_type == CSVWType.QbDataSet
-        else ""
-    )
-    dataset_observations_info_printable: str = (
-        metadata_printer.dataset_observations_info_printable
-    )
-    dataset_val_counts_by_measure_unit: str = (
-        metadata_printer.dataset_val_counts_by_measure_unit_info_printable
-        if csvw_type == CSVWType.QbDataSet
-        else ""
+    return MetadataPrinter(
+        csvw_type,
+        csvw_metadata_rdf_graph,
+        csvw_metadata_json_path,
+        count_duplicates,
+        sections,
+    ).output_dict
+
+
+def _get_text_output(
+    csvw_metadata_json_path: Path,
+    count_duplicates: bool,
+    rdf_store_backend: RdfStoreBackend,
+    use_graph_cache: bool,
+    sections: Optional[Set[InspectSection]],
+) -> Optional[str]:
+    """
+    Generates the human-readable results of inspecting the CSV-W.
+
+    Member of :file:`./inspect.py`
+
+    :return: `Optional[str]` - `None` where the CSV-W is unsupported.
+    """
+    csvw_metadata_rdf_graph, csvw_type = _load_and_validate_csvw(
+        csvw_metadata_json_path, rdf_store_backend, use_graph_cache
     )
-    codelist_hierarchy_info_printable: str = (
-        metadata_printer.codelist_hierachy_info_printable
-        if csvw_type == CSVWType.CodeList
-        else ""
+    if csvw_type is None:
+        return None
+
+    metadata_printer = MetadataPrinter(
+        csvw_type,
+        csvw_metadata_rdf_graph,
+        csvw_metadata_json_path,
+        count_duplicates,
+        sections,
     )
 
-    return (
-        type_info_printable,
-        catalog_metadata_printable,
-        dsd_info_printable,
-        codelist_info_printable,
-        dataset_observations_info_printable,
-        dataset_val_counts_by_measure_unit,
-        codelist_hierarchy_info_printable,
+    return "".join(
+        f"{linesep}{printable}\n"
+        for printable in [
+            metadata_printer.type_info_printable,
+            *metadata_printer.printables,
+        ]
     )
@@ -0,0 +1,159 @@
+"""
+Inspect Cache
+-------------
+
+Caches the machine-readable results of inspecting a CSV-W on disk, beside the metadata file.
+
+Entries are keyed by a hash of the metadata file and of the local files it depends on (its tables' CSVs and table
+schemas, and the code list CSV-Ws it refers to), so a CSV-W which hasn't changed is served from the cache without
+being re-loaded. Large files (i.e. the observations) are identified by their size and modification time so that
+computing the key doesn't cost a full read of the data.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from csvcubed import __version__
+from csvcubed.utils.csvw import (
+    get_dependent_local_files,
+    get_local_metadata_dependencies,
+)
+
+_logger = logging.getLogger(__name__)
+
+_MAX_CONTENT_HASHED_FILE_SIZE = 1024 * 1024
+
+
+def get_inspect_cache_path(csvw_metadata_json_path: Path) -> Path:
+    """
+    Returns the path of the (hidden) file holding the cached inspect results for the given metadata file.
+
+    Member of :file:`./inspectcache.py`
+
+    :return: `Path`
+    """
+    return (
+        csvw_metadata_json_path.parent
+        / f".{csvw_metadata_json_path.name}.inspect-cache.json"
+    )
+
+
+def get_inspect_cache_key(
+    csvw_metadata_json_path: Path,
+    count_duplicates: bool,
+    sections: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Generates the key identifying the inspect results for the current content of the CSV-W.
+
+    The key changes whenever the metadata file, any of the local CSV or table schema files it refers to, any of its
+    local RDF dependencies (e.g. code list CSV-Ws), the csvcubed version or the options affecting the results
+    (including the requested `sections`; `None` meaning all sections) change. Files larger than 1 MiB are identified
+    by their size and modification time rather than their content.
+
+    Member of :file:`./inspectcache.py`
+
+    :return: `str` - hex digest of the content hash.
+    """
+    content_hash = hashlib.sha256()
+    sections_str = "*" if sections is None else ",".join(sorted(sections))
+    content_hash.update(
+        f"{__version__}|{count_duplicates}|{sections_str}".encode("utf-8")
+    )
+    for file_path in [
+        csvw_metadata_json_path,
+        *_get_dependent_file_paths(csvw_metadata_json_path),
+    ]:
+        _update_hash_with_file(content_hash, file_path)
+
+    return content_hash.hexdigest()
+
+
+def read_cached_inspect_results(
+    csvw_metadata_json_path: Path, cache_key: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached inspect results for the metadata file if they were stored with the given key.
+
+    Member of :file:`./inspectcache.py`
+
+    :return: `Optional[Dict[str, Any]]` - `None` where there is no (valid) cached result.
+    """
+    cache_path = get_inspect_cache_path(csvw_metadata_json_path)
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as ex:
+        _logger.warning(f"Ignoring unreadable inspect cache {cache_path}: {ex}")
+        return None
+
+    if not isinstance(cache, dict) or cache.get("key") != cache_key:
+        _logger.debug("Inspect cache is stale.")
+        return None
+
+    _logger.info(f"Using cached inspect results from {cache_path}")
+    return cache.get("results")
+
+
+def write_cached_inspect_results(
+    csvw_metadata_json_path: Path, cache_key: str, results: Dict[str, Any]
+) -> None:
+    """
+    Stores the inspect results beside the metadata file. Failing to write the cache is not an error.
+
+    Member of :file:`./inspectcache.py`
+    """
+    cache_path = get_inspect_cache_path(csvw_metadata_json_path)
+    try:
+        with open(cache_path, "w") as f:
+            json.dump({"key": cache_key, "results": results}, f)
+        _logger.debug(f"Written inspect cache to {cache_path}")
+    except OSError as ex:
+        _logger.warning(f"Unable to write inspect cache {cache_path}: {ex}")
+
+
+def _get_dependent_file_paths(csvw_metadata_json_path: Path) -> List[Path]:
+    """
+    Returns the local files whose content affects the inspect results: the CSV and table schema files the tables
+    refer to along with the RDF dependencies (e.g. code list CSV-Ws) and their tables.
+    """
+    file_paths = {
+        p.resolve() for p in get_dependent_local_files(csvw_metadata_json_path)
+    }
+    for dependency_path in get_local_metadata_dependencies(csvw_metadata_json_path):
+        file_paths.add(dependency_path)
+        if dependency_path.suffix == ".json" and dependency_path.is_file():
+            try:
+                file_paths |= {
+                    p.resolve() for p in get_dependent_local_files(dependency_path)
+                }
+            except Exception as ex:
+                _logger.debug(f"Unable to read dependencies of {dependency_path}: {ex}")
+
+    file_paths.discard(csvw_metadata_json_path.resolve())
+    return sorted(file_paths)
+
+
+def _update_hash_with_file(content_hash: Any, file_path: Path) -> None:
+    """
+    Small files are hashed by content. Large files (i.e. the observations CSVs) are identified by their size and
+    modification time so that the key doesn't cost a full read of the data.
+    """
+    content_hash.update(file_path.name.encode("utf-8"))
+    if not file_path.is_file():
+        content_hash.update(b"|missing")
+        return
+
+    stat = file_path.stat()
+    if stat.st_size > _MAX_CONTENT_HASHED_FILE_SIZE:
+        content_hash.update(f"|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8"))
+        return
+
+    with open(file_path, "rb") as f:
+        content_hash.update(f.read())
@@ -8,12 +8,15 @@ Collection of functions handling csv-related operations used in the inspect cli.
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
-from csvcubed.utils.pandas import read_csv
+from csvcubed.utils.csvscan import scan_csv_rows
+from csvcubed.utils.pandas import SPECIFIED_NA_VALUES, read_csv, read_csv_shards
 from csvcubed.models.sparqlresults import (
     QubeComponentResult,
+    TableColumnDataTypeResult,
 )
 from csvcubed.utils.qb.components import (
     ComponentField,
@@ -22,6 +25,7 @@ from csvcubed.utils.qb.components import (
     get_component_property_as_relative_path,
 )
 from csvcubed.models.inspectdataframeresults import (
+    DATASET_HEAD_TAIL_LIMIT,
     CodelistHierarchyInfoResult,
     DatasetObservationsByMeasureUnitInfoResult,
     DatasetObservationsInfoResult,
@@ -37,6 +41,32 @@ from csvcubed.utils.skos.codelist import build_concepts_hierarchy_tree
 
 _logger = logging.getLogger(__name__)
 
+_DUPLICATES_CHUNK_SIZE = 1_000_000
+
+_NON_CATEGORICAL_DATA_TYPES = {
+    "boolean",
+    "byte",
+    "decimal",
+    "double",
+    "float",
+    "int",
+    "integer",
+    "long",
+    "negativeInteger",
+    "nonNegativeInteger",
+    "nonPositiveInteger",
+    "number",
+    "positiveInteger",
+    "short",
+    "unsignedByte",
+    "unsignedInt",
+    "unsignedLong",
+    "unsignedShort",
+}
+"""
+Datatypes whose values are left for pandas to parse. Columns of any other datatype are loaded as categoricals.
+"""
+
 
 def _filter_components_from_dsd(
     components: List[QubeComponentResult],
@@ -58,20 +88,59 @@ def _filter_components_from_dsd(
     ]
 
 
-def load_csv_to_dataframe(json_path: Path, csv_path: Path) -> pd.DataFrame:
+def get_dataset_dtypes(columns: List[TableColumnDataTypeResult]) -> Dict[str, str]:
+    """
+    Derives the pandas dtypes for the columns of a CSV from the datatypes in its table schema.
+
+    Textual columns (and any column whose values are converted into URIs) contain relatively few distinct values, so
+    loading them as categoricals substantially reduces the memory needed to hold the dataset.
+
+    Member of :file:`./inspectdatasetmanager.py`
+
+    :return: `Dict[str, str]` - map of column title to pandas dtype.
+    """
+    return {
+        column.column_title: "category"
+        for column in columns
+        if column.column_value_url is not None
+        or column.data_type not in _NON_CATEGORICAL_DATA_TYPES
+    }
+
+
+def load_csv_to_dataframe(
+    json_path: Path,
+    csv_path: Union[Path, List[Path]],
+    dtype: Optional[Dict[str, str]] = None,
+    usecols: Optional[List[str]] = None,
+) -> pd.DataFrame:
     """
     Loads the csv in given path to a Panda Dataframe.
 
+    :param csv_path: the csv, or the list of csvs which the dataset's rows are partitioned across.
+    :param dtype: optionally, the pandas dtypes of the columns (see :func:`get_dataset_dtypes`).
+    :param usecols: optionally, the titles of the only columns which should be loaded.
+
     Member of :file:`./inspectdatasetmanager.py`
 
     :return: `DataFrame` - Dataframe of the csv.
     """
 
     try:
-        dataset_path = json_path.parent / csv_path
-        _logger.debug(f"Dataset path: {dataset_path.absolute()}")
-
-        dataset, data_errors = read_csv(dataset_path)
+        if dtype is not None and usecols is not None:
+            dtype = {col: t for col, t in dtype.items() if col in usecols}
+
+        if isinstance(csv_path, list) and len(csv_path) > 1:
+            dataset_paths = [json_path.parent / p for p in csv_path]
+            _logger.debug(f"Dataset paths: {[p.absolute() for p in dataset_paths]}")
+            dataset, data_errors = read_csv_shards(
+                dataset_paths, dtype=dtype, usecols=usecols
+            )
+        else:
+            if isinstance(csv_path, list):
+                csv_path = csv_path[0]
+            dataset_path = json_path.parent / csv_path
+            _logger.debug(f"Dataset path: {dataset_path.absolute()}")
+            dataset, data_errors = read_csv(dataset_path, dtype=dtype, usecols=usecols)
         for error in data_errors:
             _logger.warning(friendly_error_mapping(error))
         _logger.info("Successfully loaded csv into dataframe.")
@@ -160,31 +229,136 @@ def get_single_measure_from_dsd(
     )
 
 
-def get_dataset_observations_info(
-    dataset: pd.DataFrame, csvw_type: CSVWType
+def get_csv_observations_info(
+    json_path: Path,
+    csv_path: Union[Path, List[Path]],
+    csvw_type: CSVWType,
+    dtype: Optional[Dict[str, str]] = None,
+    count_duplicates: bool = False,
 ) -> DatasetObservationsInfoResult:
     """
-    Generates the `DatasetObservationsInfoResult` from the dataset.
+    Generates the `DatasetObservationsInfoResult` for the csv in the given path without loading the whole csv.
+
+    The head is read from the start of the file. The rows are counted (and the start of the tail is located) in a
+    single scan of the file, after which the tail is read by seeking directly to it.
+
+    Where the dataset's rows are partitioned across a list of csvs, the head is taken from the start of the first
+    csv(s) and the tail from the end of the last.
+
+    Counting duplicate rows requires a pass over the whole csv and so is only performed when `count_duplicates`
+    is set.
 
     Member of :file:`./inspectdatasetmanager.py`
 
     :return: `DatasetObservationsInfoResult`
     """
+    csv_paths = csv_path if isinstance(csv_path, list) else [csv_path]
+    dataset_paths = [json_path.parent / p for p in csv_paths]
+
+    num_of_rows = 0
+    dataset_heads: List[pd.DataFrame] = []
+    dataset_tails: List[pd.DataFrame] = []
+    try:
+        for dataset_path in dataset_paths:
+            _logger.debug(f"Dataset path: {dataset_path.absolute()}")
+            dataset_head, dataset_tail, num_of_csv_rows = _get_csv_head_and_tail(
+                dataset_path, dtype
+            )
+            num_of_rows += num_of_csv_rows
+            dataset_heads.append(dataset_head)
+            dataset_tails.append(dataset_tail)
+    except Exception as ex:
+        raise CsvToDataFrameLoadFailedException() from ex
+
     return DatasetObservationsInfoResult(
         csvw_type,
-        len(dataset.index),
-        dataset.duplicated().sum(),
-        dataset.head(n=10),
-        dataset.tail(n=10),
+        num_of_rows,
+        _count_duplicate_rows(dataset_paths) if count_duplicates else None,
+        _concat_partitions(dataset_heads).head(n=DATASET_HEAD_TAIL_LIMIT),
+        _concat_partitions(dataset_tails).tail(n=DATASET_HEAD_TAIL_LIMIT),
     )
 
 
+def _get_csv_head_and_tail(
+    dataset_path: Path, dtype: Optional[Dict[str, str]]
+) -> Tuple[pd.DataFrame, pd.DataFrame, int]:
+    """
+    :return: the head and tail of the csv along with the number of rows it contains.
+    """
+    dataset_head, data_errors = read_csv(
+        dataset_path, dtype=dtype, nrows=DATASET_HEAD_TAIL_LIMIT
+    )
+    for error in data_errors:
+        _logger.warning(friendly_error_mapping(error))
+
+    scan_result = scan_csv_rows(dataset_path, DATASET_HEAD_TAIL_LIMIT)
+    _logger.debug(f"Dataset contains {scan_result.num_of_rows} rows.")
+
+    if scan_result.num_of_rows <= DATASET_HEAD_TAIL_LIMIT:
+        dataset_tail = dataset_head
+    else:
+        with open(dataset_path, "rb") as f:
+            f.seek(scan_result.tail_offset)
+            dataset_tail = pd.read_csv(
+                f,
+                header=None,
+                names=list(dataset_head.columns),
+                keep_default_na=False,
+                na_values=SPECIFIED_NA_VALUES,
+                dtype=dtype,
+            )
+
+    return (
+        dataset_head,
+        dataset_tail.tail(n=DATASET_HEAD_TAIL_LIMIT),
+        scan_result.num_of_rows,
+    )
+
+
+def _concat_partitions(partitions: List[pd.DataFrame]) -> pd.DataFrame:
+    if len(partitions) == 1:
+        return partitions[0]
+
+    return pd.concat(partitions, ignore_index=True)
+
+
+def _count_duplicate_rows(dataset_paths: List[Path]) -> int:
+    """
+    Counts the duplicate rows in the csv(s) in a single streaming pass, retaining only a hash of each row.
+
+    Every column is read as a categorical so that each chunk is hashed consistently.
+    """
+    row_hashes: List[np.ndarray] = []
+    for dataset_path in dataset_paths:
+        for chunk in pd.read_csv(
+            dataset_path,
+            keep_default_na=False,
+            na_values=SPECIFIED_NA_VALUES,
+            dtype="category",
+            chunksize=_DUPLICATES_CHUNK_SIZE,
+        ):
+            row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+
+    if len(row_hashes) == 0:
+        return 0
+
+    all_row_hashes = np.concatenate(row_hashes)
+    return len(all_row_hashes) - len(np.unique(all_row_hashes))
+
+
 def get_dataset_val_counts_info(
-    dataset: pd.DataFrame, measure_col: str, unit_col: str
+    dataset: pd.DataFrame,
+    measure_col: str,
+    unit_col: str,
+    constant_columns: Optional[Dict[str, str]] = None,
 ) -> DatasetObservationsByMeasureUnitInfoResult:
     """
     Generates the `DatasetObservationsByMeasureUnitInfoResult` from the dataset.
 
+    The `measure_col` and/or `unit_col` may be virtual columns with a single value across the whole dataset (as
+    described by `constant_columns`). These are not materialised in the dataset; the grouping is performed on the
+    real columns only and the constant values are attached to the (small) result.
+
     Member of :file:`./inspectdatasetmanager.py`
 
     :return: `DatasetObservationsByMeasureUnitInfoResult`
@@ -192,12 +366,26 @@ def get_dataset_val_counts_info(
     _logger.debug(f"Dataset measure column name: {measure_col}")
     _logger.debug(f"Dataset unit column name: {unit_col}")
 
-    by_measure_and_unit_grouped = dataset.groupby([measure_col, unit_col])
+    constant_columns = constant_columns or {}
+    group_by_cols = [
+        col for col in [measure_col, unit_col] if col not in constant_columns
+    ]
 
-    return DatasetObservationsByMeasureUnitInfoResult(
-        by_measure_and_unit_val_counts_df=pd.DataFrame(
-            by_measure_and_unit_grouped.size().reset_index()
+    if any(group_by_cols):
+        by_measure_and_unit_val_counts_df = pd.DataFrame(
+            dataset.groupby(group_by_cols, observed=True).size().reset_index()
         )
+    else:
+        by_measure_and_unit_val_counts_df = pd.DataFrame({0: [len(dataset.index)]})
+
+    for position, col in enumerate([measure_col, unit_col]):
+        if col in constant_columns:
+            by_measure_and_unit_val_counts_df.insert(
+                position, col, constant_columns[col]
+            )
+
+    return DatasetObservationsByMeasureUnitInfoResult(
+        by_measure_and_unit_val_counts_df=by_measure_and_unit_val_counts_df
     )
 
 
@@ -0,0 +1,47 @@
+"""
+Inspect Options
+---------------
+
+The options of the inspect command. These only depend upon the standard library so that the command line can be
+parsed without importing the libraries used to inspect a CSV-W.
+"""
+from enum import Enum
+
+
+class InspectOutputFormat(Enum):
+    """
+    The formats in which the results of inspecting a CSV-W can be output.
+    """
+
+    Text = "text"
+    """Human-readable text."""
+
+    Json = "json"
+    """A single JSON document containing every section."""
+
+    NDJson = "ndjson"
+    """One JSON document per line, for each section."""
+
+
+class InspectSection(Enum):
+    """
+    The sections of the results of inspecting a CSV-W, each of which can be requested independently.
+    """
+
+    Metadata = "metadata"
+    """The catalog metadata."""
+
+    Dsd = "dsd"
+    """The data structure definition (data cubes only)."""
+
+    CodeLists = "codelists"
+    """The code lists used by the data structure definition (data cubes only)."""
+
+    Observations = "observations"
+    """The number of observations along with the head and tail of the dataset."""
+
+    ValueCounts = "value-counts"
+    """The number of observations by measure and unit (data cubes only)."""
+
+    Hierarchy = "hierarchy"
+    """The hierarchy of the code list's concepts (code lists only)."""
@@ -5,13 +5,14 @@ Metadata Printer
 Provides functionality for validating and detecting input metadata.json file.
 """
 
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
 import rdflib
-from pandas import DataFrame
+from pandas import DataFrame, RangeIndex
 
 from csvcubed.models.sparqlresults import (
     CatalogMetadataResult,
@@ -19,10 +20,12 @@ from csvcubed.models.sparqlresults import (
     CodelistColumnResult,
     CodelistsResult,
     ColsWithSuppressOutputTrueResult,
+    DatasetURLResult,
     DSDLabelURIResult,
     QubeComponentsResult,
 )
 from csvcubed.utils.sparql_handler.sparql import path_to_file_uri_for_rdflib
+from csvcubed.cli.inspect.inspectoptions import InspectSection
 from csvcubed.cli.inspect.metadatainputvalidator import CSVWType
 from csvcubed.utils.sparql_handler.sparqlmanager import (
     select_codelist_cols_by_dataset_url,
@@ -33,11 +36,15 @@ from csvcubed.utils.sparql_handler.sparqlmanager import (
     select_csvw_dsd_qube_components,
     select_dsd_code_list_and_cols,
     select_qb_dataset_url,
+    select_table_column_datatypes,
 )
 from csvcubed.cli.inspect.inspectdatasetmanager import (
     get_concepts_hierarchy_info,
-    get_dataset_observations_info,
+    get_csv_observations_info,
+    get_dataset_dtypes,
     get_dataset_val_counts_info,
+    get_measure_col_name_from_dsd,
+    get_unit_col_name_from_dsd,
     load_csv_to_dataframe,
 )
 from csvcubed.models.inspectdataframeresults import (
@@ -55,22 +62,44 @@ from csvcubed.utils.skos.codelist import (
     CodelistPropertyUrl,
     get_codelist_col_title_by_property_url,
 )
+from csvcubed.utils.taskgraph import Task, run_task_graph
 from csvcubed.utils.uri import looks_like_uri
 
+_MAX_WORKERS = 4
+
+
+_SECTION_TASK_NAMES: Dict[InspectSection, List[str]] = {
+    InspectSection.Metadata: ["catalog_metadata"],
+    InspectSection.Dsd: ["dsd", "cols_with_suppress_output_true"],
+    InspectSection.CodeLists: ["code_lists"],
+    InspectSection.Observations: ["dataset_observations_info"],
+    InspectSection.ValueCounts: ["dataset_value_counts"],
+    InspectSection.Hierarchy: ["concepts_hierarchy_info"],
+}
+"""
+The tasks generating the results printed in each section.
+"""
+
 
 @dataclass
 class MetadataPrinter:
     """
     This class produces the printables necessary for producing outputs to the CLI.
+
+    Only the results required by the requested `sections` (all sections by default) are generated up-front; the
+    results behind any other printable are generated on first access.
     """
 
     csvw_type: CSVWType
     csvw_metadata_rdf_graph: rdflib.ConjunctiveGraph
     csvw_metadata_json_path: Path
+    count_duplicates: bool = False
+    sections: Optional[Set[InspectSection]] = None
 
     csvw_type_str: str = field(init=False)
     dataset_url: str = field(init=False)
-    dataset: DataFrame = field(init=False)
+    dataset_urls: List[str] = field(init=False)
+    dataset_dtypes: Optional[Dict[str, str]] = field(init=False)
 
     result_catalog_metadata: CatalogMetadataResult = field(init=False)
     result_dataset_label_dsd_uri: DSDLabelURIResult = field(init=False)
@@ -86,6 +115,11 @@ class MetadataPrinter:
     result_code_list_cols: CodeListColsByDatasetUrlResult = field(init=False)
     result_concepts_hierachy_info: CodelistHierarchyInfoResult = field(init=False)
 
+    _rdf_graph_lock: threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _completed_task_names: Set[str] = field(init=False, repr=False, default_factory=set)
+
     @staticmethod
     def get_csvw_type_str(csvw_type: CSVWType) -> str:
         if csvw_type == CSVWType.QbDataSet:
@@ -96,17 +130,19 @@ class MetadataPrinter:
             raise InputNotSupportedException()
 
     @staticmethod
-    def get_dataset_url(
+    def get_dataset_url_result(
         csvw_metadata_rdf_graph: rdflib.ConjunctiveGraph,
         csvw_type: CSVWType,
         dataset_uri: str,
-    ) -> str:
+    ) -> DatasetURLResult:
+        """
+        The result lists every CSV holding the dataset's rows; a data cube's observations may be partitioned across
+        several.
+        """
         if csvw_type == CSVWType.QbDataSet:
-            return select_qb_dataset_url(
-                csvw_metadata_rdf_graph, dataset_uri
-            ).dataset_url
+            return select_qb_dataset_url(csvw_metadata_rdf_graph, dataset_uri)
         elif csvw_type == CSVWType.CodeList:
-            return select_codelist_dataset_url(csvw_metadata_rdf_graph).dataset_url
+            return select_codelist_dataset_url(csvw_metadata_rdf_graph)
         else:
             raise InputNotSupportedException()
 
@@ -125,33 +161,98 @@ class MetadataPrinter:
         )
         return (parent_notation_col_name, label_col_name, notation_col_name)
 
-    def generate_general_results(self):
+    def get_dataset_dtypes(self) -> Optional[Dict[str, str]]:
         """
-        Generates results related to data cubes and code lists.
+        Derives the dtypes used to load the data cube's observations from its table schema.
+
+        Code lists are small enough that they are loaded without any dtypes specified.
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        if self.csvw_type != CSVWType.QbDataSet:
+            return None
+
+        return get_dataset_dtypes(
+            select_table_column_datatypes(
+                self.csvw_metadata_rdf_graph, self.dataset_url
+            ).columns
+        )
+
+    def load_measure_and_unit_columns(self) -> DataFrame:
+        """
+        Loads only the measure and unit columns (where present) of the data cube's observations.
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        qube_components = self.result_qube_components.qube_components
+        columns = [
+            col
+            for col in [
+                get_measure_col_name_from_dsd(qube_components),
+                get_unit_col_name_from_dsd(qube_components),
+            ]
+            if col is not None
+        ]
+
+        if not any(columns):
+            # Both the measure and unit are constant; only the number of observations is required.
+            return DataFrame(
+                index=RangeIndex(
+                    self.result_dataset_observations_info.num_of_observations
+                )
+            )
+
+        return load_csv_to_dataframe(
+            self.csvw_metadata_json_path,
+            [Path(url) for url in self.dataset_urls],
+            dtype=self.dataset_dtypes,
+            usecols=columns,
+        )
+
+    def generate_catalog_metadata_result(self):
+        """
+        Queries the catalog metadata.
 
         Member of :class:`./MetadataPrinter`.
         """
-        self.csvw_type_str = self.get_csvw_type_str(self.csvw_type)
         self.result_catalog_metadata = select_csvw_catalog_metadata(
             self.csvw_metadata_rdf_graph
         )
-        self.dataset_url = self.get_dataset_url(
+
+    def generate_dataset_url_result(self):
+        """
+        Finds the CSV(s) holding the dataset's rows and the dtypes to load them with.
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        dataset_url_result = self.get_dataset_url_result(
             self.csvw_metadata_rdf_graph,
             self.csvw_type,
             to_absolute_rdflib_file_path(
                 self.result_catalog_metadata.dataset_uri, self.csvw_metadata_json_path
             ),
         )
-        self.dataset = load_csv_to_dataframe(
-            self.csvw_metadata_json_path, Path(self.dataset_url)
-        )
-        self.result_dataset_observations_info = get_dataset_observations_info(
-            self.dataset, self.csvw_type
+        self.dataset_url = dataset_url_result.dataset_url
+        self.dataset_urls = dataset_url_result.dataset_urls
+        self.dataset_dtypes = self.get_dataset_dtypes()
+
+    def generate_dataset_observations_info_result(self):
+        """
+        Reads the number of observations (and the head and tail) from the dataset's CSV(s).
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        self.result_dataset_observations_info = get_csv_observations_info(
+            self.csvw_metadata_json_path,
+            [Path(url) for url in self.dataset_urls],
+            self.csvw_type,
+            dtype=self.dataset_dtypes,
+            count_duplicates=self.count_duplicates,
         )
 
-    def get_datacube_results(self):
+    def generate_dsd_results(self):
         """
-        Generates results specific to data cubes.
+        Queries the data structure definition and its components.
 
         Member of :class:`./MetadataPrinter`.
         """
@@ -163,54 +264,228 @@ class MetadataPrinter:
             self.result_dataset_label_dsd_uri.dsd_uri,
             self.csvw_metadata_json_path,
         )
+
+    def generate_cols_with_suppress_output_true_result(self):
+        """
+        Queries the columns whose output is suppressed.
+
+        Member of :class:`./MetadataPrinter`.
+        """
         self.result_cols_with_suppress_output_true = (
             select_cols_where_suppress_output_is_true(self.csvw_metadata_rdf_graph)
         )
+
+    def generate_code_lists_result(self):
+        """
+        Queries the code lists used by the data structure definition.
+
+        Member of :class:`./MetadataPrinter`.
+        """
         self.result_code_lists = select_dsd_code_list_and_cols(
             self.csvw_metadata_rdf_graph,
             self.result_dataset_label_dsd_uri.dsd_uri,
             self.csvw_metadata_json_path,
         )
-        (
-            canonical_shape_dataset,
-            measure_col,
-            unit_col,
-        ) = transform_dataset_to_canonical_shape(
-            self.dataset,
-            self.result_qube_components.qube_components,
-            self.result_dataset_label_dsd_uri.dsd_uri,
-            self.csvw_metadata_rdf_graph,
-            self.csvw_metadata_json_path,
-        )
+
+    def generate_dataset_value_counts_result(self):
+        """
+        Counts the observations by measure and unit.
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        measure_and_unit_columns = self.load_measure_and_unit_columns()
+        with self._rdf_graph_lock:
+            (
+                canonical_shape_dataset,
+                measure_col,
+                unit_col,
+                constant_columns,
+            ) = transform_dataset_to_canonical_shape(
+                measure_and_unit_columns,
+                self.result_qube_components.qube_components,
+                self.result_dataset_label_dsd_uri.dsd_uri,
+                self.csvw_metadata_rdf_graph,
+                self.csvw_metadata_json_path,
+            )
         self.result_dataset_value_counts = get_dataset_val_counts_info(
-            canonical_shape_dataset, measure_col, unit_col
+            canonical_shape_dataset, measure_col, unit_col, constant_columns
         )
 
-    def generate_codelist_results(self):
+    def generate_code_list_cols_result(self):
         """
-        Generates results specific to code lists.
+        Queries the code list's columns.
 
         Member of :class:`./MetadataPrinter`.
         """
         self.result_code_list_cols = select_codelist_cols_by_dataset_url(
             self.csvw_metadata_rdf_graph, self.dataset_url
         )
+
+    def generate_concepts_hierarchy_info_result(self):
+        """
+        Reads the code list's CSV to describe its concepts' hierarchy.
+
+        Member of :class:`./MetadataPrinter`.
+        """
         (
             parent_notation_col_name,
             label_col_name,
             notation_col_name,
         ) = self.get_parent_label_notation_col_names(self.result_code_list_cols.columns)
         self.result_concepts_hierachy_info = get_concepts_hierarchy_info(
-            self.dataset, parent_notation_col_name, label_col_name, notation_col_name
+            load_csv_to_dataframe(self.csvw_metadata_json_path, Path(self.dataset_url)),
+            parent_notation_col_name,
+            label_col_name,
+            notation_col_name,
         )
 
-    def __post_init__(self):
-        self.generate_general_results()
+    def _querying_rdf_graph(self, func: Callable[[], None]) -> Callable[[], None]:
+        """
+        Wraps a task so that it holds the lock on the RDF graph whilst it runs.
+
+        rdflib's SPARQL engine isn't thread-safe (and, being pure python, gains nothing from running queries
+        concurrently) so the queries run one at a time; the tasks reading CSVs run alongside them.
+        """
+
+        def _locked_func() -> None:
+            with self._rdf_graph_lock:
+                func()
+
+        return _locked_func
+
+    def get_tasks(self) -> Dict[str, Task]:
+        """
+        Returns the tasks generating each of the results, along with the tasks each depends on.
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        tasks = {
+            "catalog_metadata": Task(
+                self._querying_rdf_graph(self.generate_catalog_metadata_result)
+            ),
+            "dataset_url": Task(
+                self._querying_rdf_graph(self.generate_dataset_url_result),
+                depends_on=["catalog_metadata"],
+            ),
+            "dataset_observations_info": Task(
+                self.generate_dataset_observations_info_result,
+                depends_on=["dataset_url"],
+            ),
+        }
 
         if self.csvw_type == CSVWType.QbDataSet:
-            self.get_datacube_results()
+            # N.B. the queries only run one at a time, so the remaining queries wait for the dataset's URL to be
+            # found; this lets the (slowest) task, reading the CSV, start as early as possible.
+            tasks["dsd"] = Task(
+                self._querying_rdf_graph(self.generate_dsd_results),
+                depends_on=["dataset_url"],
+            )
+            tasks["cols_with_suppress_output_true"] = Task(
+                self._querying_rdf_graph(
+                    self.generate_cols_with_suppress_output_true_result
+                ),
+                depends_on=["dataset_url"],
+            )
+            tasks["code_lists"] = Task(
+                self._querying_rdf_graph(self.generate_code_lists_result),
+                depends_on=["dsd"],
+            )
+            tasks["dataset_value_counts"] = Task(
+                self.generate_dataset_value_counts_result,
+                depends_on=["dsd", "dataset_url", "dataset_observations_info"],
+            )
         elif self.csvw_type == CSVWType.CodeList:
-            self.generate_codelist_results()
+            tasks["code_list_cols"] = Task(
+                self._querying_rdf_graph(self.generate_code_list_cols_result),
+                depends_on=["dataset_url"],
+            )
+            tasks["concepts_hierarchy_info"] = Task(
+                self.generate_concepts_hierarchy_info_result,
+                depends_on=["code_list_cols"],
+            )
+
+        return tasks
+
+    @property
+    def applicable_sections(self) -> List[InspectSection]:
+        """
+        Returns the requested sections which apply to this type of CSV-W, in the order they are output.
+
+        Member of :class:`./MetadataPrinter`.
+
+        :return: `List[InspectSection]`
+        """
+        if self.csvw_type == CSVWType.QbDataSet:
+            type_sections = [
+                InspectSection.Metadata,
+                InspectSection.Dsd,
+                InspectSection.CodeLists,
+                InspectSection.Observations,
+                InspectSection.ValueCounts,
+            ]
+        else:
+            type_sections = [
+                InspectSection.Metadata,
+                InspectSection.Observations,
+                InspectSection.Hierarchy,
+            ]
+
+        return [
+            section
+            for section in type_sections
+            if self.sections is None or section in self.sections
+        ]
+
+    def generate_section_results(self, sections: Iterable[InspectSection]) -> None:
+        """
+        Generates the results printed in the given sections (along with the results they depend upon) unless they
+        have already been generated.
+
+        Member of :class:`./MetadataPrinter`.
+        """
+        tasks = self.get_tasks()
+        required_task_names: Set[str] = set()
+        task_names_to_visit = [
+            task_name
+            for section in sections
+            for task_name in _SECTION_TASK_NAMES[section]
+            if task_name in tasks
+        ]
+        while any(task_names_to_visit):
+            task_name = task_names_to_visit.pop()
+            if (
+                task_name in required_task_names
+                or task_name in self._completed_task_names
+            ):
+                continue
+            required_task_names.add(task_name)
+            task_names_to_visit += tasks[task_name].depends_on
+
+        if not any(required_task_names):
+            return
+
+        # Independent tasks run concurrently so that reading the CSV(s) overlaps with querying the RDF graph.
+        run_task_graph(
+            {
+                task_name: Task(
+                    tasks[task_name].func,
+                    [
+                        d
+                        for d in tasks[task_name].depends_on
+                        if d in required_task_names
+                    ],
+                )
+                for task_name in required_task_names
+            },
+            max_workers=_MAX_WORKERS,
+        )
+        self._completed_task_names |= required_task_names
+
+    def __post_init__(self):
+        self.csvw_type_str = self.get_csvw_type_str(self.csvw_type)
+
+        # Anything outside of the requested sections (e.g. the observations CSV) is left untouched unless accessed.
+        self.generate_section_results(self.applicable_sections)
 
     @property
     def type_info_printable(self) -> str:
@@ -235,6 +510,7 @@ class MetadataPrinter:
 
         :return: `str` - user-friendly string which will be output to CLI.
         """
+        self.generate_section_results([InspectSection.Metadata])
         return f"- The {self.csvw_type_str} has the following catalog metadata:{self.result_catalog_metadata.output_str}"
 
     @property
@@ -246,6 +522,7 @@ class MetadataPrinter:
 
         :return: `str` - user-friendly string which will be output to CLI.
         """
+        self.generate_section_results([InspectSection.Dsd])
         return f"- The {self.csvw_type_str} has the following data structure definition:{self.result_dataset_label_dsd_uri.output_str}{self.result_qube_components.output_str}{self.result_cols_with_suppress_output_true.output_str}"
 
     @property
@@ -257,6 +534,7 @@ class MetadataPrinter:
 
         :return: `str` - user-friendly string which will be output to CLI.
         """
+        self.generate_section_results([InspectSection.CodeLists])
         return f"- The {self.csvw_type_str} has the following code list information:{self.result_code_lists.output_str}"
 
     @property
@@ -268,6 +546,7 @@ class MetadataPrinter:
 
         :return: `str` - user-friendly string which will be output to CLI.
         """
+        self.generate_section_results([InspectSection.Observations])
         return f"- The {self.csvw_type_str} has the following dataset information:{self.result_dataset_observations_info.output_str}"
 
     @property
@@ -279,6 +558,7 @@ class MetadataPrinter:
 
         :return: `str` - user-friendly string which will be output to CLI.
         """
+        self.generate_section_results([InspectSection.ValueCounts])
         return f"- The {self.csvw_type_str} has the following value counts:{self.result_dataset_value_counts.output_str}"
 
     @property
@@ -290,8 +570,65 @@ class MetadataPrinter:
 
         :return: `str` - user-friendly string which will be output to CLI.
         """
+        self.generate_section_results([InspectSection.Hierarchy])
         return f"- The {self.csvw_type_str} has the following concepts information:{self.result_concepts_hierachy_info.output_str}"
 
+    @property
+    def printables(self) -> List[str]:
+        """
+        Returns the printables for each of the requested sections, in the order they are output.
+
+        Member of :class:`./MetadataPrinter`.
+
+        :return: `List[str]` - user-friendly strings which will be output to CLI.
+        """
+        section_printables: Dict[InspectSection, Callable[[], str]] = {
+            InspectSection.Metadata: lambda: self.catalog_metadata_printable,
+            InspectSection.Dsd: lambda: self.dsd_info_printable,
+            InspectSection.CodeLists: lambda: self.codelist_info_printable,
+            InspectSection.Observations: lambda: self.dataset_observations_info_printable,
+            InspectSection.ValueCounts: lambda: self.dataset_val_counts_by_measure_unit_info_printable,
+            InspectSection.Hierarchy: lambda: self.codelist_hierachy_info_printable,
+        }
+
+        return [section_printables[section]() for section in self.applicable_sections]
+
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        """
+        Returns the results as a JSON-serialisable dictionary (with one entry per requested section).
+
+        Member of :class:`./MetadataPrinter`.
+
+        :return: `Dict[str, Any]` - machine-readable equivalent of the printables.
+        """
+        self.generate_section_results(self.applicable_sections)
+
+        output: Dict[str, Any] = {"type": self.csvw_type_str}
+        for section in self.applicable_sections:
+            if section == InspectSection.Metadata:
+                output["catalog_metadata"] = self.result_catalog_metadata.output_dict
+            elif section == InspectSection.Dsd:
+                output["data_structure_definition"] = {
+                    **self.result_dataset_label_dsd_uri.output_dict,
+                    **self.result_qube_components.output_dict,
+                    "columns_with_suppress_output_true": self.result_cols_with_suppress_output_true.columns,
+                }
+            elif section == InspectSection.CodeLists:
+                output["code_lists"] = self.result_code_lists.output_dict
+            elif section == InspectSection.Observations:
+                output[
+                    "dataset_information"
+                ] = self.result_dataset_observations_info.output_dict
+            elif section == InspectSection.ValueCounts:
+                output["value_counts"] = self.result_dataset_value_counts.output_dict
+            elif section == InspectSection.Hierarchy:
+                output[
+                    "concepts_hierarchy"
+                ] = self.result_concepts_hierachy_info.output_dict
+
+        return output
+
 
 def to_absolute_rdflib_file_path(path: str, parent_document_path: Path) -> str:
     if looks_like_uri(path):
@@ -0,0 +1,163 @@
+"""
+Serve Client
+------------
+
+A thin client submitting build and inspect jobs to a running csvcubed server (see :mod:`~csvcubed.cli.serve.server`).
+
+The client only depends upon the standard library so that submitting a job doesn't require importing the libraries
+csvcubed uses to do the work. Paths are made absolute before being sent since the server's working directory may
+differ from the client's.
+
+Each job must be authorised with the token the server generates when it starts. Unless a token is given, the client
+uses the `CSVCUBED_SERVER_TOKEN` environment variable or else the token file the server wrote for its port (see
+:func:`get_server_token_file_path`).
+"""
+import json
+import logging
+import os
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from appdirs import AppDirs
+
+from csvcubed.models.csvcubedexception import ServerJobFailedException
+
+_logger = logging.getLogger(__name__)
+
+SERVER_TOKEN_ENV_VAR = "CSVCUBED_SERVER_TOKEN"
+
+
+def get_server_token_file_path(port: int) -> Path:
+    """
+    Returns the path of the file holding the token of the csvcubed server listening on the port.
+
+    Member of :file:`./client.py`
+
+    :return: `Path`
+    """
+    return Path(AppDirs("csvcubed-server", "csvcubed").user_data_dir) / f"{port}.token"
+
+
+def submit_build_job(
+    server_url: str,
+    csv_paths: List[Path],
+    config_path: Optional[Path] = None,
+    output_directory: Path = Path("out"),
+    fail_when_validation_error: bool = True,
+    validation_errors_to_file: bool = False,
+    csv_writer: Optional[str] = None,
+    partition_by: Optional[str] = None,
+    timeout: Optional[float] = None,
+    token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Builds a CSV-W on the csvcubed server.
+
+    Member of :file:`./client.py`
+
+    :return: `Dict[str, Any]` - the `output_directory` written to and the `validation_errors` found.
+    """
+    request: Dict[str, Any] = {
+        "csv": [str(p.resolve()) for p in csv_paths],
+        "config": None if config_path is None else str(config_path.resolve()),
+        "out": str(output_directory.resolve()),
+        "fail_when_validation_error": fail_when_validation_error,
+        "validation_errors_to_file": validation_errors_to_file,
+        "partition_by": partition_by,
+    }
+    if csv_writer is not None:
+        request["csv_writer"] = csv_writer
+
+    return _submit_job(server_url, "build", request, timeout, token)
+
+
+def submit_inspect_job(
+    server_url: str,
+    csvw_metadata_json_path: Path,
+    count_duplicates: bool = False,
+    output_format: Optional[str] = None,
+    use_cache: bool = True,
+    rdf_store: Optional[str] = None,
+    use_graph_cache: bool = False,
+    sections: Optional[Iterable[str]] = None,
+    timeout: Optional[float] = None,
+    token: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Inspects a CSV-W on the csvcubed server.
+
+    Member of :file:`./client.py`
+
+    :return: `Optional[str]` - the output the inspect command prints (`None` for an unsupported CSV-W).
+    """
+    request: Dict[str, Any] = {
+        "csvw_metadata_json_path": str(csvw_metadata_json_path.resolve()),
+        "count_duplicates": count_duplicates,
+        "use_cache": use_cache,
+        "use_graph_cache": use_graph_cache,
+        "sections": None if sections is None else list(sections),
+    }
+    if output_format is not None:
+        request["output_format"] = output_format
+    if rdf_store is not None:
+        request["rdf_store"] = rdf_store
+
+    return _submit_job(server_url, "inspect", request, timeout, token)["output"]
+
+
+def _submit_job(
+    server_url: str,
+    job_type: str,
+    request: Dict[str, Any],
+    timeout: Optional[float],
+    token: Optional[str],
+) -> Dict[str, Any]:
+    job_url = f"{server_url.rstrip('/')}/jobs/{job_type}"
+    _logger.debug("Submitting %s job to %s", job_type, job_url)
+    headers = {"Content-Type": "application/json"}
+    token = token or _get_server_token(server_url)
+    if token is not None:
+        headers["Authorization"] = f"Bearer {token}"
+
+    http_request = urllib.request.Request(
+        job_url,
+        data=json.dumps(request).encode("utf-8"),
+        headers=headers,
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(http_request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        raise ServerJobFailedException(
+            job_type, server_url, _get_error_message(e)
+        ) from e
+    except urllib.error.URLError as e:
+        raise ServerJobFailedException(job_type, server_url, str(e.reason)) from e
+
+
+def _get_server_token(server_url: str) -> Optional[str]:
+    token = os.environ.get(SERVER_TOKEN_ENV_VAR)
+    if token:
+        return token
+
+    port = urlsplit(server_url).port
+    if port is None:
+        return None
+
+    token_file_path = get_server_token_file_path(port)
+    if not token_file_path.is_file():
+        _logger.debug("No token file found for the server at %s", server_url)
+        return None
+
+    return token_file_path.read_text().strip()
+
+
+def _get_error_message(error: urllib.error.HTTPError) -> str:
+    try:
+        return json.loads(error.read())["error"]
+    except (ValueError, KeyError, TypeError):
+        return f"HTTP {error.code} {error.reason}"
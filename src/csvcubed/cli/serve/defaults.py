@@ -0,0 +1,13 @@
+"""
+Serve Defaults
+--------------
+
+The csvcubed server's default settings, shared by the server and the command line. These only depend upon the
+standard library so that the command line can be parsed without importing the server.
+"""
+
+DEFAULT_HOST = "127.0.0.1"
+
+DEFAULT_PORT = 8765
+
+DEFAULT_MAX_WORKERS = 2
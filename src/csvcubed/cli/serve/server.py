@@ -0,0 +1,484 @@
+"""
+Serve Command
+-------------
+
+Runs a long-lived local server which builds and inspects CSV-Ws on request.
+
+Each job runs in the server's process, so the libraries csvcubed depends upon are imported once and the per-process
+caches (the HTTP cache session, the cube-config schema validators, the column templates and the pydantic
+constructors) stay warm between jobs. Jobs run on a bounded pool of workers.
+
+The API accepts JSON `POST` requests to `/jobs/build` and `/jobs/inspect` (see :mod:`~csvcubed.cli.serve.client`)
+and responds once the job has finished. `GET /status` reports that the server is running.
+
+The server reads and writes any local path it is given, so by default it only listens on the loopback interface and
+it only runs jobs which:
+
+* are `application/json` requests (which a web page can't send to the server without the browser first asking it),
+* are addressed to a loopback name (or the host the server listens on), which defeats DNS rebinding, and
+* carry the token the server generated when it started in their `Authorization: Bearer <token>` header. The
+  :func:`serve` function writes the token to a file only the user can read (see
+  :func:`~csvcubed.cli.serve.client.get_server_token_file_path`), where the client finds it.
+"""
+import hmac
+import json
+import logging
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+from csvcubed import __version__
+from csvcubed.cli.build import build
+from csvcubed.cli.inspect.inspect import get_inspect_output
+from csvcubed.cli.inspect.inspectoptions import InspectOutputFormat, InspectSection
+from csvcubed.cli.serve.client import get_server_token_file_path
+from csvcubed.cli.serve.defaults import (
+    DEFAULT_HOST,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PORT,
+)
+from csvcubed.models.errorurl import HasErrorUrl
+from csvcubed.utils.csvwriterengine import CsvWriterEngine
+from csvcubed.utils.sparql_handler.storebackend import RdfStoreBackend
+
+_logger = logging.getLogger(__name__)
+
+_LOOPBACK_HOST_NAMES = {"localhost", "127.0.0.1", "::1"}
+
+TEnum = TypeVar("TEnum", bound=Enum)
+
+
+class BadJobRequestException(Exception):
+    """
+    The job's request is malformed; responded to with `400 Bad Request`.
+    """
+
+    pass
+
+
+@dataclass
+class BuildJob:
+    """
+    Builds a CSV-W, accepting the same options as the build command.
+    """
+
+    csv_paths: List[Path]
+    config_path: Optional[Path] = None
+    output_directory: Path = Path("out")
+    fail_when_validation_error: bool = True
+    validation_errors_to_file: bool = False
+    csv_writer_engine: CsvWriterEngine = CsvWriterEngine.Pandas
+    partition_by: Optional[str] = None
+
+    @staticmethod
+    def from_request(request: Dict[str, Any]) -> "BuildJob":
+        """
+        Reads the job from its request.
+
+        Member of :class:`./BuildJob`.
+
+        :raises BadJobRequestException: where the request is malformed.
+        """
+        csv = _get_required(request, "csv")
+        csv_paths = [
+            _to_path("csv", p) for p in ([csv] if isinstance(csv, str) else csv)
+        ]
+        if not any(csv_paths):
+            raise BadJobRequestException("At least one CSV must be provided.")
+
+        config = _get_optional(request, "config", str)
+        return BuildJob(
+            csv_paths=csv_paths,
+            config_path=None if config is None else _to_path("config", config),
+            output_directory=_to_path("out", _get_optional(request, "out", str, "out")),
+            fail_when_validation_error=_get_optional(
+                request, "fail_when_validation_error", bool, True
+            ),
+            validation_errors_to_file=_get_optional(
+                request, "validation_errors_to_file", bool, False
+            ),
+            csv_writer_engine=_get_enum(
+                request, "csv_writer", CsvWriterEngine, CsvWriterEngine.Pandas
+            ),
+            partition_by=_get_optional(request, "partition_by", str),
+        )
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Member of :class:`./BuildJob`.
+
+        :return: `Dict[str, Any]` - the output directory and the validation errors found.
+        """
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+
+        try:
+            _, validation_errors = build(
+                csv_path=(
+                    self.csv_paths[0] if len(self.csv_paths) == 1 else self.csv_paths
+                ),
+                config_path=self.config_path,
+                output_directory=self.output_directory,
+                fail_when_validation_error_occurs=self.fail_when_validation_error,
+                validation_errors_file_name=(
+                    "validation-errors.json" if self.validation_errors_to_file else None
+                ),
+                csv_writer_engine=self.csv_writer_engine,
+                partition_by=self.partition_by,
+            )
+        except SystemExit:
+            # The build exits when validation errors occur and `fail_when_validation_error` is set.
+            raise Exception("The cube failed validation; see the server's log.")
+
+        return {
+            "output_directory": str(self.output_directory.resolve()),
+            "validation_errors": [e.message for e in validation_errors],
+        }
+
+
+@dataclass
+class InspectJob:
+    """
+    Inspects a CSV-W, accepting the same options as the inspect command.
+    """
+
+    csvw_metadata_json_path: Path
+    count_duplicates: bool = False
+    output_format: InspectOutputFormat = InspectOutputFormat.Text
+    use_cache: bool = True
+    rdf_store_backend: RdfStoreBackend = RdfStoreBackend.Rdflib
+    use_graph_cache: bool = False
+    sections: Optional[Set[InspectSection]] = None
+
+    @staticmethod
+    def from_request(request: Dict[str, Any]) -> "InspectJob":
+        """
+        Reads the job from its request.
+
+        Member of :class:`./InspectJob`.
+
+        :raises BadJobRequestException: where the request is malformed.
+        """
+        sections = _get_optional(request, "sections", list)
+        return InspectJob(
+            csvw_metadata_json_path=_to_path(
+                "csvw_metadata_json_path",
+                _get_required(request, "csvw_metadata_json_path"),
+            ),
+            count_duplicates=_get_optional(request, "count_duplicates", bool, False),
+            output_format=_get_enum(
+                request, "output_format", InspectOutputFormat, InspectOutputFormat.Text
+            ),
+            use_cache=_get_optional(request, "use_cache", bool, True),
+            rdf_store_backend=_get_enum(
+                request, "rdf_store", RdfStoreBackend, RdfStoreBackend.Rdflib
+            ),
+            use_graph_cache=_get_optional(request, "use_graph_cache", bool, False),
+            sections=(
+                None
+                if sections is None
+                else {_to_enum("sections", InspectSection, s) for s in sections}
+            ),
+        )
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Member of :class:`./InspectJob`.
+
+        :return: `Dict[str, Any]` - the output the inspect command prints (or `None` for an unsupported CSV-W).
+        """
+        output = get_inspect_output(
+            self.csvw_metadata_json_path,
+            count_duplicates=self.count_duplicates,
+            output_format=self.output_format,
+            use_cache=self.use_cache,
+            rdf_store_backend=self.rdf_store_backend,
+            use_graph_cache=self.use_graph_cache,
+            sections=self.sections,
+        )
+
+        return {"output": output}
+
+
+_JOB_TYPES: Dict[str, Callable[[Dict[str, Any]], Union[BuildJob, InspectJob]]] = {
+    "/jobs/build": BuildJob.from_request,
+    "/jobs/inspect": InspectJob.from_request,
+}
+
+
+@dataclass
+class CsvcubedServer:
+    """
+    A local HTTP server running build and inspect jobs on a bounded pool of workers.
+    """
+
+    host: str = DEFAULT_HOST
+    port: int = DEFAULT_PORT
+    max_workers: int = DEFAULT_MAX_WORKERS
+    token: str = field(default_factory=lambda: secrets.token_urlsafe(32), repr=False)
+    """
+    The token each job request must carry in its `Authorization: Bearer <token>` header.
+    """
+
+    _http_server: ThreadingHTTPServer = field(init=False, repr=False)
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="csvcubed-job"
+        )
+        self._http_server = ThreadingHTTPServer(
+            (self.host, self.port),
+            _get_request_handler_class(
+                self._run_job, self.token, _LOOPBACK_HOST_NAMES | {self.host.lower()}
+            ),
+        )
+        self._http_server.daemon_threads = True
+
+    @property
+    def listening_port(self) -> int:
+        """
+        Returns the port the server is listening on (which is chosen by the OS when `port` is 0).
+
+        Member of :class:`./CsvcubedServer`.
+        """
+        return self._http_server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL the server is listening on.
+
+        Member of :class:`./CsvcubedServer`.
+        """
+        return f"http://{self._http_server.server_address[0]}:{self.listening_port}"
+
+    def serve_forever(self) -> None:
+        """
+        Handles requests until :meth:`shutdown` is called (or the process is interrupted).
+
+        Member of :class:`./CsvcubedServer`.
+        """
+        _logger.info(
+            "csvcubed %s serving on %s with %s worker(s)",
+            __version__,
+            self.url,
+            self.max_workers,
+        )
+        try:
+            self._http_server.serve_forever()
+        finally:
+            self._http_server.server_close()
+            self._executor.shutdown(wait=True)
+
+    def shutdown(self) -> None:
+        """
+        Stops the server; jobs which are already running finish first.
+
+        Member of :class:`./CsvcubedServer`.
+        """
+        self._http_server.shutdown()
+
+    def _run_job(
+        self, path: str, request: Dict[str, Any]
+    ) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        job_type = _JOB_TYPES.get(path)
+        if job_type is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown job type '{path}'."}
+
+        try:
+            job = job_type(request)
+        except BadJobRequestException as e:
+            _logger.warning("Job %s was invalid: %s", path, e)
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+
+        _logger.info("Running job %s", path)
+        try:
+            # The request's thread waits for a worker, which bounds the number of jobs running at once.
+            result = self._executor.submit(job.run).result()
+        except Exception as e:
+            _logger.exception("Job %s failed", path)
+            error: Dict[str, Any] = {"error": str(e)}
+            if isinstance(e, HasErrorUrl):
+                error["error_url"] = e.get_error_url()
+            return HTTPStatus.INTERNAL_SERVER_ERROR, error
+
+        _logger.info("Finished job %s", path)
+        return HTTPStatus.OK, result
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> None:
+    """
+    Runs the csvcubed server until the process is interrupted.
+
+    Member of :file:`./server.py`
+
+    :return: `None`
+    """
+    server = CsvcubedServer(host, port, max_workers)
+    token_file_path = get_server_token_file_path(server.listening_port)
+    _write_token_file(token_file_path, server.token)
+    print(f"csvcubed server listening on {server.url} (press Ctrl+C to stop)")
+    print(f"Jobs must be authorised with the token in {token_file_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        _logger.info("Stopping the csvcubed server")
+    finally:
+        token_file_path.unlink(missing_ok=True)
+
+
+def _write_token_file(token_file_path: Path, token: str) -> None:
+    """
+    Writes the token to a file only the user may read.
+    """
+    token_file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor = os.open(
+        token_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+    )
+    # The file may already have existed with other permissions.
+    os.chmod(token_file_path, 0o600)
+    with os.fdopen(file_descriptor, "w") as token_file:
+        token_file.write(token)
+
+
+def _get_required(request: Dict[str, Any], key: str) -> Any:
+    if request.get(key) is None:
+        raise BadJobRequestException(f"The job request must include '{key}'.")
+
+    return request[key]
+
+
+def _get_optional(
+    request: Dict[str, Any], key: str, value_type: type, default: Any = None
+) -> Any:
+    value = request.get(key)
+    if value is None:
+        return default
+
+    if not isinstance(value, value_type):
+        raise BadJobRequestException(
+            f"The job request's '{key}' must be a {value_type.__name__}."
+        )
+
+    return value
+
+
+def _get_enum(
+    request: Dict[str, Any], key: str, enum_type: Type[TEnum], default: TEnum
+) -> TEnum:
+    value = request.get(key)
+    return default if value is None else _to_enum(key, enum_type, value)
+
+
+def _to_enum(key: str, enum_type: Type[TEnum], value: Any) -> TEnum:
+    try:
+        return enum_type(str(value).lower())
+    except ValueError:
+        raise BadJobRequestException(
+            f"The job request's '{key}' must be one of: "
+            + ", ".join(str(e.value) for e in enum_type)
+        )
+
+
+def _to_path(key: str, value: Any) -> Path:
+    if not isinstance(value, str):
+        raise BadJobRequestException(f"The job request's '{key}' must be a path.")
+
+    return Path(value)
+
+
+def _get_request_handler_class(
+    run_job: Callable[[str, Dict[str, Any]], Tuple[HTTPStatus, Dict[str, Any]]],
+    token: str,
+    allowed_host_names: Set[str],
+) -> type:
+    class _JobRequestHandler(BaseHTTPRequestHandler):
+        server_version = f"csvcubed/{__version__}"
+
+        def do_GET(self) -> None:
+            if not self._is_allowed_host():
+                self._respond(HTTPStatus.FORBIDDEN, {"error": "Host not allowed."})
+            elif self.path == "/status":
+                self._respond(
+                    HTTPStatus.OK, {"status": "ok", "csvcubed_version": __version__}
+                )
+            else:
+                self._respond(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+
+        def do_POST(self) -> None:
+            if not self._is_allowed_host():
+                self._respond(HTTPStatus.FORBIDDEN, {"error": "Host not allowed."})
+                return
+
+            content_type = self.headers.get("Content-Type", "")
+            if content_type.split(";")[0].strip().lower() != "application/json":
+                self._respond(
+                    HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                    {"error": "The job request must be sent as application/json."},
+                )
+                return
+
+            if not self._is_authorised():
+                self._respond(
+                    HTTPStatus.UNAUTHORIZED,
+                    {"error": "The job request must carry the server's token."},
+                )
+                return
+
+            try:
+                content_length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(content_length) or b"{}")
+                if not isinstance(request, dict):
+                    raise ValueError("The job request must be a JSON object.")
+            except ValueError as e:
+                self._respond(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+                return
+
+            self._respond(*run_job(self.path, request))
+
+        def _is_allowed_host(self) -> bool:
+            host_name = urlsplit(f"//{self.headers.get('Host', '')}").hostname
+            return host_name is not None and host_name in allowed_host_names
+
+        def _is_authorised(self) -> bool:
+            scheme, _, request_token = self.headers.get("Authorization", "").partition(
+                " "
+            )
+            return scheme.lower() == "bearer" and hmac.compare_digest(
+                request_token.strip().encode("utf-8"), token.encode("utf-8")
+            )
+
+        def log_message(self, format: str, *args: Any) -> None:
+            _logger.debug("%s - %s", self.address_string(), format % args)
+
+        def _respond(self, status: HTTPStatus, body: Dict[str, Any]) -> None:
+            response = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+    return _JobRequestHandler
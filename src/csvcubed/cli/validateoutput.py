@@ -0,0 +1,40 @@
+"""
+Validate Output Command
+-----------------------
+Check that the data in a CSV-W generated by csvcubed satisfy its primary key and foreign key constraints.
+"""
+import logging
+from pathlib import Path
+from typing import List
+
+from csvcubed.models.errorurl import HasErrorUrl
+from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.csvwconstraints import validate_csvw_constraints
+
+_logger = logging.getLogger(__name__)
+
+
+def validate_output(csvw_metadata_json_path: Path) -> List[ValidationError]:
+    """
+    Checks the `primaryKey` and `foreignKeys` constraints of every local table in the CSV-W, logging any violations.
+
+    :return: `List[ValidationError]` - the constraint violations found.
+    """
+    _logger.info(f"Validating the constraints of {csvw_metadata_json_path}")
+    errors = validate_csvw_constraints(csvw_metadata_json_path)
+
+    for error in errors:
+        _logger.error(error.message)
+        if isinstance(error, HasErrorUrl):
+            _logger.error("More information: %s", error.get_error_url())
+
+    if len(errors) == 0:
+        print(
+            f"Validation Complete: {csvw_metadata_json_path} satisfies its constraints."
+        )
+    else:
+        print(
+            f"Validation Failed: {len(errors)} constraint violation(s) found in {csvw_metadata_json_path}."
+        )
+
+    return errors
@@ -54,6 +54,17 @@ class CsvcubedExceptionMsges(Enum):
         "The definition for column with name {column_title} is not supported."
     )
 
+    InvalidPartitionColumn = "Unable to partition the observations by column '{column_title}'; it must be a dimension column."
+
+    RdfStoreBackendUnavailable = (
+        "The '{backend}' RDF store is unavailable; the '{package_name}' package is not installed or is incompatible "
+        "with the installed rdflib. Install a compatible version with `pip install csvcubed[{backend}]`."
+    )
+
+    ServerJobFailed = (
+        "The {job_type} job failed on the csvcubed server at {server_url}: {reason}"
+    )
+
 
 class CsvcubedExceptionUrls(Enum):
     """
@@ -94,6 +105,12 @@ class CsvcubedExceptionUrls(Enum):
         "http://purl.org/csv-cubed/err/column-definition-not-supported"
     )
 
+    InvalidPartitionColumn = "http://purl.org/csv-cubed/err/invalid-partition-column"
+
+    RdfStoreBackendUnavailable = "http://purl.org/csv-cubed/err/rdf-store-unavailable"
+
+    ServerJobFailed = "http://purl.org/csv-cubed/err/server-job-failed"
+
 
 class CsvcubedException(Exception, HasErrorUrl, ABC):
     """Abstract class representing csvcubed exception model."""
@@ -312,3 +329,48 @@ class UnsupportedColumnDefinitionException(CsvcubedException):
     @classmethod
     def get_error_url(cls) -> str:
         return CsvcubedExceptionUrls.UnsupportedColumnDefinition.value
+
+
+class InvalidPartitionColumnException(CsvcubedException):
+    """Class representing the InvalidPartitionColumnException model."""
+
+    def __init__(self, column_title: str):
+        super().__init__(
+            CsvcubedExceptionMsges.InvalidPartitionColumn.value.format(
+                column_title=column_title
+            )
+        )
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return CsvcubedExceptionUrls.InvalidPartitionColumn.value
+
+
+class RdfStoreBackendUnavailableException(CsvcubedException):
+    """Class representing the RdfStoreBackendUnavailableException model."""
+
+    def __init__(self, backend: str, package_name: str):
+        super().__init__(
+            CsvcubedExceptionMsges.RdfStoreBackendUnavailable.value.format(
+                backend=backend, package_name=package_name
+            )
+        )
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return CsvcubedExceptionUrls.RdfStoreBackendUnavailable.value
+
+
+class ServerJobFailedException(CsvcubedException):
+    """Class representing the ServerJobFailedException model."""
+
+    def __init__(self, job_type: str, server_url: str, reason: str):
+        super().__init__(
+            CsvcubedExceptionMsges.ServerJobFailed.value.format(
+                job_type=job_type, server_url=server_url, reason=reason
+            )
+        )
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return CsvcubedExceptionUrls.ServerJobFailed.value
@@ -0,0 +1,73 @@
+"""
+CSV-W Validation Errors
+-----------------------
+
+:obj:`ValidationError <csvcubed.models.validationerror.ValidationError>` models describing CSV-W outputs whose data
+do not satisfy the constraints declared in their table schemas.
+"""
+from dataclasses import dataclass
+from typing import List
+
+from csvcubed.models.validationerror import SpecificValidationError
+
+
+def _describe_rows(num_of_rows: int, row_numbers: List[int]) -> str:
+    row_nums_str = ", ".join([str(i) for i in row_numbers])
+    if num_of_rows > len(row_numbers):
+        row_nums_str += f" (and {num_of_rows - len(row_numbers)} more)"
+
+    return f"{row_nums_str} (counting the header as row 1)"
+
+
+@dataclass
+class DuplicatePrimaryKeyError(SpecificValidationError):
+    """
+    An error to inform the user that multiple rows in a CSV-W table share the same primary key values.
+    """
+
+    table_url: str
+    csv_column_titles: List[str]
+    num_of_rows: int
+    """The total number of rows which share their primary key values with another row."""
+    row_numbers: List[int]
+    """The (first few) offending row numbers, counting the CSV's header as row 1."""
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/dupe-primary-key"
+
+    def __post_init__(self):
+        column_titles_str = ", ".join([f"'{t}'" for t in self.csv_column_titles])
+        self.message = (
+            f"Duplicate values of the primary key ({column_titles_str}) found in '{self.table_url}' in row(s) "
+            f"{_describe_rows(self.num_of_rows, self.row_numbers)}."
+        )
+
+
+@dataclass
+class ForeignKeyViolationError(SpecificValidationError):
+    """
+    An error to inform the user that a column in a CSV-W table contains values which cannot be found in the table
+    (e.g. the code list) which it references.
+    """
+
+    table_url: str
+    csv_column_title: str
+    referenced_table_url: str
+    undefined_values: List[str]
+    num_of_rows: int
+    """The total number of rows containing an undefined value."""
+    row_numbers: List[int]
+    """The (first few) offending row numbers, counting the CSV's header as row 1."""
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/foreign-key-violation"
+
+    def __post_init__(self):
+        undefined_values_str = ", ".join([f"'{v}'" for v in self.undefined_values])
+        self.message = (
+            f"The value(s) {undefined_values_str} in column '{self.csv_column_title}' of '{self.table_url}' are not "
+            f"defined in '{self.referenced_table_url}'. Found in row(s) "
+            f"{_describe_rows(self.num_of_rows, self.row_numbers)}."
+        )
@@ -4,7 +4,18 @@ Cube
 """
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, TypeVar, Generic, Iterable, Tuple
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Generic,
+    Iterable,
+    Tuple,
+)
 
 import pandas as pd
 import uritemplate
@@ -35,13 +46,111 @@ _logger = logging.getLogger(__name__)
 TMetadata = TypeVar("TMetadata", bound=CatalogMetadataBase, covariant=True)
 
 
+class _IndexedColumnsList(list):
+    """
+    A list of columns which maintains an index of its columns by the type of their `structural_definition`.
+
+    The index is discarded whenever the list is changed.
+    """
+
+    def __init__(self, columns: Iterable[CsvColumn]):
+        super().__init__(columns)
+        self.columns_of_dsd_type_index: Dict[Type, List[QbColumn]] = {}
+
+    def _invalidate_index(self) -> None:
+        # n.b. items are appended to unpickled lists before their attributes are restored.
+        self.columns_of_dsd_type_index = {}
+
+    def __setitem__(self, *args):
+        super().__setitem__(*args)
+        self._invalidate_index()
+
+    def __delitem__(self, *args):
+        super().__delitem__(*args)
+        self._invalidate_index()
+
+    def __iadd__(self, *args):
+        result = super().__iadd__(*args)
+        self._invalidate_index()
+        return result
+
+    def __imul__(self, *args):
+        result = super().__imul__(*args)
+        self._invalidate_index()
+        return result
+
+    def append(self, *args):
+        super().append(*args)
+        self._invalidate_index()
+
+    def extend(self, *args):
+        super().extend(*args)
+        self._invalidate_index()
+
+    def insert(self, *args):
+        super().insert(*args)
+        self._invalidate_index()
+
+    def remove(self, *args):
+        super().remove(*args)
+        self._invalidate_index()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._invalidate_index()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._invalidate_index()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_index()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_index()
+
+
 @dataclass
 class Cube(Generic[TMetadata], PydanticModel):
     metadata: TMetadata
     data: Optional[pd.DataFrame] = field(default=None, repr=False)
     columns: List[CsvColumn] = field(default_factory=lambda: [], repr=False)
     uri_style: URIStyle = URIStyle.Standard
-    
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "columns" and isinstance(value, list):
+            value = _IndexedColumnsList(value)
+        super().__setattr__(name, value)
+
+    def get_columns_of_dsd_type(self, t: Type) -> List[QbColumn]:
+        """
+        :return: The :class:`QbColumn <csvcubed.models.cube.qb.columns.QbColumn>` s in this cube which have a
+            :attr:`structural_definition` of the requested type :obj:`t`.
+
+        The columns of each type are indexed the first time they are requested; the index is discarded whenever
+        :attr:`columns` is changed.
+        """
+        if isinstance(self.columns, _IndexedColumnsList):
+            columns_of_dsd_type_index = self.columns.columns_of_dsd_type_index
+        else:
+            columns_of_dsd_type_index = {}
+
+        columns_of_type = columns_of_dsd_type_index.get(t)
+        if columns_of_type is None:
+            columns_of_type = [
+                c
+                for c in self.columns
+                if isinstance(c, QbColumn) and isinstance(c.structural_definition, t)
+            ]
+            columns_of_dsd_type_index[t] = columns_of_type
+            _logger.debug(
+                "Indexed %d column(s) of type %s", len(columns_of_type), t.__name__
+            )
+
+        return list(columns_of_type)
 
     def validate(self) -> List[ValidationError]:
         errors: List[ValidationError] = []
@@ -110,12 +219,13 @@ class Cube(Generic[TMetadata], PydanticModel):
             defined_names = safe_column_names + URI_TEMPLATE_SPECIAL_PROPERTIES
             for name in names:
                 if name not in defined_names:
-                    _logger.debug('Unable to find name %s in %s', name, safe_column_names)
+                    _logger.debug(
+                        "Unable to find name %s in %s", name, safe_column_names
+                    )
                     errors.append(UriTemplateNameError(safe_column_names, uri_template))
 
         return errors
 
-
     def _csv_column_uri_templates_to_names(self) -> Iterable[Tuple]:
         """
         Generates tuples of any configured and not None csv column
@@ -139,8 +249,7 @@ class Cube(Generic[TMetadata], PydanticModel):
         ]
 
         template_to_name_map = {
-            c: uritemplate.variables(c)
-            for c in csv_column_uri_templates if c
+            c: uritemplate.variables(c) for c in csv_column_uri_templates if c
         }
 
         return template_to_name_map.items()
@@ -129,7 +129,7 @@ class NewQbDimension(QbDimension, UriIdentifiable):
         csv_column_uri_template: str,
         column_csv_title: str,
     ) -> List[ValidationError]:
-        # Leave csv-lint to do the validation here. It will enforce Foreign Key constraints on code lists.
+        # Foreign Key constraints on code lists are enforced against the output by `csvcubed validate-output`.
         if isinstance(self.code_list, NewQbCodeList):
             return self.code_list.validate_data(data, column_csv_title)
 
@@ -4,7 +4,7 @@ Cube Validation Errors
 """
 from collections.abc import Set
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List
 
 from csvcubed.models.validationerror import SpecificValidationError
 
@@ -25,6 +25,28 @@ class DuplicateColumnTitleError(SpecificValidationError):
         self.message = f"Duplicate column title '{self.csv_column_title}'"
 
 
+@dataclass
+class InconsistentShardColumnsError(SpecificValidationError):
+    """
+    An error to inform the user that one of the CSV shards making up a cube does not have the same columns as the
+    first shard.
+    """
+
+    csv_path: str
+    expected_column_titles: List[str]
+    actual_column_titles: List[str]
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/inconsistent-shard-cols"
+
+    def __post_init__(self):
+        self.message = (
+            f"The CSV shard '{self.csv_path}' has the columns {self.actual_column_titles} but the columns "
+            + f"{self.expected_column_titles} were expected."
+        )
+
+
 @dataclass
 class ColumnNotFoundInDataError(SpecificValidationError):
     """
@@ -95,6 +117,38 @@ class ObservationValuesMissing(SpecificValidationError):
         self.message = f"Missing value(s) found for '{self.csv_column_title}' in row(s) {row_nums_str}."
 
 
+@dataclass
+class DuplicateObservationsError(SpecificValidationError):
+    """
+    An error to inform the user that multiple observations share the same combination of dimension (and measure)
+    values, i.e. the same primary key.
+    """
+
+    csv_column_titles: List[str]
+    num_of_duplicate_keys: int
+    """The total number of combinations of values which are shared by multiple observations."""
+    duplicate_key_row_numbers: Dict[str, List[int]]
+    """Map of (the first few) duplicated combinations of values to the row numbers they are found in."""
+
+    @classmethod
+    def get_error_url(cls) -> str:
+        return "http://purl.org/csv-cubed/err/dupe-obs"
+
+    def __post_init__(self):
+        column_titles_str = ", ".join([f"'{t}'" for t in self.csv_column_titles])
+        duplicate_keys_str = "; ".join(
+            f"({key}) in row(s) {', '.join([str(i) for i in row_numbers])}"
+            for key, row_numbers in self.duplicate_key_row_numbers.items()
+        )
+        if self.num_of_duplicate_keys > len(self.duplicate_key_row_numbers):
+            duplicate_keys_str += f" (and {self.num_of_duplicate_keys - len(self.duplicate_key_row_numbers)} more)"
+
+        self.message = (
+            f"Found {self.num_of_duplicate_keys} combination(s) of values for {column_titles_str} shared by multiple "
+            f"observations: {duplicate_keys_str}."
+        )
+
+
 @dataclass
 class UriTemplateNameError(SpecificValidationError):
     """
@@ -4,14 +4,17 @@ Inspect Dataframe query results
 """
 
 from os import linesep
-from typing import Optional
+from typing import Any, Dict, Optional
 import pandas as pd
 from dataclasses import dataclass
 
 from treelib import Tree
 
 from csvcubed.cli.inspect.metadatainputvalidator import CSVWType
-from csvcubed.utils.printable import get_printable_tabuler_str_from_dataframe
+from csvcubed.utils.printable import (
+    get_printable_tabuler_str_from_dataframe,
+    get_records_from_dataframe,
+)
 
 HIERARCHY_TREE_CONCEPTS_LIMIT = 100
 DATASET_HEAD_TAIL_LIMIT = 10
@@ -25,7 +28,8 @@ class DatasetObservationsInfoResult:
 
     csvw_type: CSVWType
     num_of_observations: int
-    num_of_duplicates: int
+    num_of_duplicates: Optional[int]
+    """`None` where duplicate rows have not been counted."""
     dataset_head: pd.DataFrame
     dataset_tail: pd.DataFrame
 
@@ -50,12 +54,26 @@ class DatasetObservationsInfoResult:
             observations_str = f"""- First 10 {obs_or_concepts_str}: {linesep}{formatted_dataset_head}
         - Last 10 {obs_or_concepts_str}: {linesep}{formatted_dataset_tail}"""
 
+        if self.num_of_duplicates is None:
+            duplicates_str = ""
+        else:
+            duplicates_str = f"""
+        - Number of Duplicates: {self.num_of_duplicates}"""
+
         return f"""
-        - Number of {obs_or_concepts_str}: {self.num_of_observations}
-        - Number of Duplicates: {self.num_of_duplicates}
+        - Number of {obs_or_concepts_str}: {self.num_of_observations}{duplicates_str}
         {observations_str}
         """
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return {
+            "num_of_observations": self.num_of_observations,
+            "num_of_duplicates": self.num_of_duplicates,
+            "head": get_records_from_dataframe(self.dataset_head),
+            "tail": get_records_from_dataframe(self.dataset_tail),
+        }
+
 
 @dataclass
 class DatasetSingleMeasureResult:
@@ -83,6 +101,17 @@ class DatasetObservationsByMeasureUnitInfoResult:
         - Value counts broken-down by measure and unit (of measure):{linesep}{formatted_by_measure_and_unit_val_counts}
         """
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return {
+            "value_counts": [
+                {"measure": measure, "unit": unit, "count": int(count)}
+                for measure, unit, count in self.by_measure_and_unit_val_counts_df.itertuples(
+                    index=False
+                )
+            ]
+        }
+
 
 @dataclass
 class CodelistHierarchyInfoResult:
@@ -103,3 +132,10 @@ class CodelistHierarchyInfoResult:
         - Concepts hierarchy depth: {self.tree.depth()}
         - Concepts hierarchy:{hierarchy_output}
         """
+
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return {
+            "depth": self.tree.depth(),
+            "hierarchy": self.tree.to_dict(sort=False),
+        }
@@ -6,7 +6,7 @@ SPARQL query results
 from os import linesep
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, field
 
 from rdflib.query import ResultRow
 from csvcubedmodels.dataclassbase import DataClassBase
@@ -68,6 +68,10 @@ class CatalogMetadataResult:
         - Description: {formatted_description}
         """
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
 @dataclass
 class DSDLabelURIResult:
@@ -83,6 +87,10 @@ class DSDLabelURIResult:
         return f"""
         - Dataset Label: {self.dataset_label}"""
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
 @dataclass
 class QubeComponentResult(DataClassBase):
@@ -122,6 +130,10 @@ class QubeComponentsResult:
         - Number of Components: {self.num_components}
         - Components:{linesep}{formatted_components}"""
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
 @dataclass
 class ColsWithSuppressOutputTrueResult:
@@ -136,6 +148,10 @@ class ColsWithSuppressOutputTrueResult:
         return f"""
         - Columns where suppress output is true: {get_printable_list_str(self.columns)}"""
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
 @dataclass
 class CodelistResult(DataClassBase):
@@ -179,6 +195,16 @@ class CodelistsResult:
         - Number of Code Lists: {self.num_codelists}
         - Code Lists:{linesep}{formatted_codelists}"""
 
+    @property
+    def output_dict(self) -> Dict[str, Any]:
+        return {
+            "codelists": [
+                codelist.as_dict()
+                for codelist in sorted(self.codelists, key=lambda c: c.code_list)
+            ],
+            "num_codelists": self.num_codelists,
+        }
+
 
 @dataclass
 class DatasetURLResult:
@@ -187,6 +213,15 @@ class DatasetURLResult:
     """
 
     dataset_url: str
+    dataset_urls: List[str] = field(default_factory=list)
+    """
+    The urls of every table holding the dataset's rows. There are several where the observations are partitioned
+    across CSVs; `dataset_url` is the first of these.
+    """
+
+    def __post_init__(self):
+        if len(self.dataset_urls) == 0:
+            self.dataset_urls = [self.dataset_url]
 
 
 @dataclass
@@ -241,6 +276,27 @@ class TableSchemaPropertiesResult:
     table_url: str
 
 
+@dataclass
+class TableColumnDataTypeResult(DataClassBase):
+    """
+    Model to represent the title and datatype of a column defined in a table schema.
+    """
+
+    column_title: str
+    data_type: Optional[str]
+    """The base datatype of the column (e.g. `decimal`), or `None` where the column uses the default (`string`)."""
+    column_value_url: Optional[str]
+
+
+@dataclass
+class TableColumnDataTypesResult:
+    """
+    Model to represent the columns (and their datatypes) of the table with the given table url.
+    """
+
+    columns: List[TableColumnDataTypeResult]
+
+
 def map_catalog_metadata_result(sparql_result: ResultRow) -> CatalogMetadataResult:
     """
     Maps sparql query result to `CatalogMetadataResult`
@@ -291,49 +347,89 @@ def map_dataset_label_dsd_uri_sparql_result(
 
 
 def map_qube_component_sparql_result(
-    sparql_result: ResultRow, json_path: Path
+    component_result: Dict[str, Any],
+    column_result: Optional[Dict[str, Any]],
+    json_path: Path,
 ) -> QubeComponentResult:
     """
-    Maps sparql query result to `QubeComponentResult`
+    Maps a component's sparql query result (and that of the CSV-W column representing it) to `QubeComponentResult`
 
     Member of :file:`./models/sparqlresults.py`
 
     :return: `QubeComponentResult`
     """
-    result_dict = sparql_result.asdict()
+    column_result = column_result or {}
 
     result = QubeComponentResult(
         property=get_component_property_as_relative_path(
-            json_path, str(result_dict["componentProperty"])
+            json_path, str(component_result["componentProperty"])
         ),
         property_label=(
-            none_or_map(result_dict.get("componentPropertyLabel"), str) or ""
+            none_or_map(component_result.get("componentPropertyLabel"), str) or ""
         ),
         property_type=get_component_property_type(
-            str(result_dict["componentPropertyType"])
+            str(component_result["componentPropertyType"])
         ),
-        csv_col_title=none_or_map(result_dict.get("csvColumnTitle"), str) or "",
-        required=none_or_map(result_dict.get("required"), bool) or False,
+        csv_col_title=none_or_map(column_result.get("csvColumnTitle"), str) or "",
+        required=bool(column_result.get("csvColumnRequired"))
+        or bool(component_result.get("componentRequired")),
     )
     return result
 
 
 def map_qube_components_sparql_result(
-    sparql_results: List[ResultRow], json_path: Path
+    component_results: List[ResultRow],
+    column_results: List[ResultRow],
+    json_path: Path,
 ) -> QubeComponentsResult:
     """
-    Maps sparql query result to `QubeComponentsResult`
+    Maps sparql query results to `QubeComponentsResult`
+
+    Each component is joined to the CSV-W columns whose `propertyUrl` its property ends with. The columns are indexed
+    by property URL so that the join scales linearly with the number of columns.
 
     Member of :file:`./models/sparqlresults.py`
 
     :return: `QubeComponentsResult`
     """
-    components = list(
-        map(
-            lambda result: map_qube_component_sparql_result(result, json_path),
-            sparql_results,
-        )
-    )
+    columns_by_property_url: Dict[str, List[Dict[str, Any]]] = {}
+    for column_result in column_results:
+        column_dict = column_result.asdict()
+        columns_by_property_url.setdefault(
+            str(column_dict["csvColumnPropertyUrl"]), []
+        ).append(column_dict)
+    property_url_lengths = sorted({len(url) for url in columns_by_property_url})
+
+    components: List[QubeComponentResult] = []
+    distinct_results = set()
+    for component_result in component_results:
+        component_dict = component_result.asdict()
+        component_property = str(component_dict["componentProperty"])
+        matching_columns: List[Optional[Dict[str, Any]]] = [
+            column_dict
+            for length in property_url_lengths
+            if length <= len(component_property)
+            for column_dict in columns_by_property_url.get(
+                component_property[len(component_property) - length :], []
+            )
+        ]
+
+        for column_dict in matching_columns or [None]:
+            component = map_qube_component_sparql_result(
+                component_dict, column_dict, json_path
+            )
+            distinct_key = (
+                component_property,
+                component.property_label,
+                str(component_dict.get("componentOrder")),
+                component.property_type,
+                component.csv_col_title,
+                component.required,
+            )
+            if distinct_key not in distinct_results:
+                distinct_results.add(distinct_key)
+                components.append(component)
+
     result = QubeComponentsResult(
         qube_components=components, num_components=len(components)
     )
@@ -439,6 +535,24 @@ def map_dataset_url_result(
     return result
 
 
+def map_dataset_urls_result(
+    sparql_results: List[ResultRow],
+) -> DatasetURLResult:
+    """
+    Maps the sparql query results, one for each of the tables holding the dataset's rows, to `DatasetURLResult`
+
+    Member of :file:`./models/sparqlresults.py`
+
+    :return: `DatasetURLResult`
+    """
+    dataset_urls = sorted(
+        str(sparql_result.asdict()["tableUrl"]) for sparql_result in sparql_results
+    )
+
+    result = DatasetURLResult(dataset_url=dataset_urls[0], dataset_urls=dataset_urls)
+    return result
+
+
 def map_single_unit_from_dsd_result(
     sparql_result: ResultRow, json_path: Path
 ) -> DSDSingleUnitResult:
@@ -531,3 +645,41 @@ def map_table_schema_properties_result(
         table_url=str(result_dict["csvUrl"]),
     )
     return result
+
+
+def _get_data_type_name(data_type: str) -> str:
+    """
+    Returns the name of the given datatype, e.g. `http://www.w3.org/2001/XMLSchema#decimal` becomes `decimal`.
+    """
+    for separator in ["#", "/", ":"]:
+        if separator in data_type:
+            return data_type.rsplit(separator, 1)[-1]
+    return data_type
+
+
+def map_table_column_datatypes_result(
+    sparql_results: List[ResultRow],
+) -> TableColumnDataTypesResult:
+    """
+    Maps sparql query result to `TableColumnDataTypesResult`
+
+    Member of :file:`./models/sparqlresults.py`
+
+    :return: `TableColumnDataTypesResult`
+    """
+    columns: List[TableColumnDataTypeResult] = []
+    for sparql_result in sparql_results:
+        result_dict = sparql_result.asdict()
+        # Derived datatypes are represented by a node holding the `csvw:base` datatype.
+        data_type = result_dict.get("columnDataTypeBase") or result_dict.get(
+            "columnDataType"
+        )
+        columns.append(
+            TableColumnDataTypeResult(
+                column_title=str(result_dict["columnTitle"]),
+                data_type=none_or_map(data_type, lambda d: _get_data_type_name(str(d))),
+                column_value_url=none_or_map(result_dict.get("columnValueUrl"), str),
+            )
+        )
+
+    return TableColumnDataTypesResult(columns=columns)
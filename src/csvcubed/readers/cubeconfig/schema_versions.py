@@ -8,8 +8,9 @@ Contains an enum listing the qube-config.json schema versions recognised by csvc
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Callable, Tuple, List
+from typing import Optional, Callable, Tuple, List, Union
 
+import pandas as pd
 from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
 
 from csvcubed.models.cube import QbCube
@@ -19,7 +20,18 @@ from csvcubed.readers.cubeconfig.v1 import configdeserialiser as v1_configdeseri
 _logger = logging.getLogger(__name__)
 
 QubeConfigDeserialiser = Callable[
-    [Path, Optional[Path]],
+    [Union[Path, List[Path]], Optional[Path]],
+    Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]],
+]
+
+QubeConfigDataFrameDeserialiser = Callable[
+    [
+        pd.DataFrame,
+        Optional[dict],
+        Optional[Path],
+        Optional[str],
+        Optional[v1_configdeserialiser.ColumnMappingCache],
+    ],
     Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]],
 ]
 
@@ -78,12 +90,8 @@ def get_deserialiser_for_schema(
     """
     Provides a versioned deserialiser function appropriate to the referenced schema.
     """
-    # Default to the latest version of the schema.
-    schema_path = _LATEST_SCHEMA_URL if maybe_schema_path is None else maybe_schema_path
-
-    schema_version_major, schema_version_minor = _get_schema_version(schema_path)
-    _logger.info(
-        f"Using schema version {schema_version_major.value}.{schema_version_minor.value}"
+    schema_path, schema_version_major, schema_version_minor = _get_versioned_schema(
+        maybe_schema_path
     )
 
     if schema_version_major == QubeConfigJsonSchemaMajorVersion.v1:
@@ -94,6 +102,39 @@ def get_deserialiser_for_schema(
         raise ValueError(f"Unhandled major schema version {schema_version_major}")
 
 
+def get_dataframe_deserialiser_for_schema(
+    maybe_schema_path: Optional[str],
+) -> QubeConfigDataFrameDeserialiser:
+    """
+    Provides a versioned deserialiser function, appropriate to the referenced schema, which builds a cube from a
+    dataframe held in memory.
+    """
+    schema_path, schema_version_major, schema_version_minor = _get_versioned_schema(
+        maybe_schema_path
+    )
+
+    if schema_version_major == QubeConfigJsonSchemaMajorVersion.v1:
+        return v1_configdeserialiser.get_dataframe_deserialiser(
+            schema_path, schema_version_minor.value
+        )
+    else:
+        raise ValueError(f"Unhandled major schema version {schema_version_major}")
+
+
+def _get_versioned_schema(
+    maybe_schema_path: Optional[str],
+) -> Tuple[str, QubeConfigJsonSchemaMajorVersion, QubeConfigJsonSchemaMinorVersion]:
+    # Default to the latest version of the schema.
+    schema_path = _LATEST_SCHEMA_URL if maybe_schema_path is None else maybe_schema_path
+
+    schema_version_major, schema_version_minor = _get_schema_version(schema_path)
+    _logger.info(
+        f"Using schema version {schema_version_major.value}.{schema_version_minor.value}"
+    )
+
+    return schema_path, schema_version_major, schema_version_minor
+
+
 def _get_schema_version(
     schema_path: str,
 ) -> Tuple[QubeConfigJsonSchemaMajorVersion, QubeConfigJsonSchemaMinorVersion]:
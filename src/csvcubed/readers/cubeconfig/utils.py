@@ -1,11 +1,32 @@
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
+
+import jsonschema
+import pandas as pd
 from pandas import DataFrame
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_string_dtype,
+    pandas_dtype,
+)
 
 from csvcubed.utils.json import load_json_document
 from csvcubed.utils.uri import looks_like_uri
+from csvcubed.models.cube.validationerrors import DuplicateColumnTitleError
 from csvcubed.models.validationerror import ValidationError
-from csvcubed.utils.pandas import read_csv
+from csvcubed.utils.pandas import read_csv, read_csv_shards
+from csvcubed.utils.validators.schema import create_schema_validator
+
+_schema_validator_cache = threading.local()
+"""
+Per-thread cache of the validators for remote JSON schemas, keyed by the schema's URI.
+
+A validator's `RefResolver` tracks the scope of the `$ref` it is resolving whilst validating, so validators must not be
+shared between threads (e.g. the `serve` command's workers).
+"""
 
 
 def load_resource(resource_path: Union[str, Path]) -> dict:
@@ -23,6 +44,27 @@ def load_resource(resource_path: Union[str, Path]) -> dict:
     return load_json_document(resource_path)
 
 
+def load_schema_validator(schema_path: Union[str, Path]) -> jsonschema.Draft7Validator:
+    """
+    Loads a json schema document from either a File or URI and returns a validator for it.
+
+    Remote schemas (e.g. the published cube-config schemas) are assumed not to change, so their validators (along
+    with any remote schemas they refer to) are cached for the life of the thread.
+    """
+    if isinstance(schema_path, str) and looks_like_uri(schema_path):
+        if not hasattr(_schema_validator_cache, "validators"):
+            _schema_validator_cache.validators = {}
+        validators = _schema_validator_cache.validators
+
+        validator = validators.get(schema_path)
+        if validator is None:
+            validator = create_schema_validator(load_resource(schema_path))
+            validators[schema_path] = validator
+        return validator
+
+    return create_schema_validator(load_resource(schema_path))
+
+
 def generate_title_from_file_name(csv_path: Path) -> str:
     """
     Formats a file Path, stripping -_ and returning the capitalised file name without extn
@@ -37,13 +79,16 @@ def generate_title_from_file_name(csv_path: Path) -> str:
 
 
 def read_and_check_csv(
-    csv_path: Path, dtype: Optional[Dict[str, str]] = None
+    csv_path: Union[Path, List[Path]], dtype: Optional[Dict[str, str]] = None
 ) -> Tuple[DataFrame, List[ValidationError]]:
     """
-    Reads the csv data file and performs rudimentary checks.
+    Reads the csv data file (or the csv shards which together hold the data) and performs rudimentary checks.
     """
 
-    data, data_errors = read_csv(csv_path, dtype=dtype)
+    if isinstance(csv_path, Path):
+        data, data_errors = read_csv(csv_path, dtype=dtype)
+    else:
+        data, data_errors = read_csv_shards(csv_path, dtype=dtype)
 
     if isinstance(data, DataFrame):
         if len(data) == 0:
@@ -55,3 +100,68 @@ def read_and_check_csv(
         raise TypeError("There was a problem reading the csv file as a dataframe")
 
     return data, data_errors
+
+
+def coerce_and_check_dataframe(
+    data: DataFrame, dtype: Optional[Dict[str, str]] = None
+) -> Tuple[DataFrame, List[ValidationError]]:
+    """
+    Coerces an in-memory dataframe's columns to the given datatypes and performs the same rudimentary checks as
+    :func:`read_and_check_csv`.
+
+    Columns which already hold compatible data (e.g. categorical or string columns where a string is expected) are left
+    untouched. The dataframe passed in is never modified; a shallow copy holding the coerced columns is returned, with
+    a default (`0..n-1`) index whatever the index of the dataframe passed in.
+    """
+    if not isinstance(data, DataFrame):
+        raise TypeError(f"Expected a pandas dataframe, value was {type(data)}")
+
+    if len(data) == 0:
+        raise ValueError("The dataframe must contain at least one row of data.")
+
+    data = data.copy(deep=False)
+    data.index = pd.RangeIndex(len(data))
+
+    dtype = dtype or {}
+    columns = [data.iloc[:, column_index] for column_index in range(len(data.columns))]
+    coerced_any_column = False
+    for column_index, column in enumerate(columns):
+        if column.name in dtype and not _is_compatible_dtype(
+            column, dtype[column.name]
+        ):
+            columns[column_index] = column.astype(dtype[column.name])
+            coerced_any_column = True
+
+    if coerced_any_column:
+        # Columns are replaced by position (rather than title) since titles may be duplicated.
+        data = pd.concat(columns, axis=1)
+
+    duplicate_titles = data.columns[data.columns.duplicated()].unique()
+    return data, [
+        DuplicateColumnTitleError(csv_column_title=dupe_title)
+        for dupe_title in duplicate_titles
+    ]
+
+
+def _is_compatible_dtype(column: pd.Series, expected_dtype: str) -> bool:
+    """
+    Whether the column's values can be used as they are where values of the `expected_dtype` are expected.
+    """
+    expected = pandas_dtype(expected_dtype)
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return is_string_dtype(expected)
+
+    if is_string_dtype(expected):
+        # Object columns may hold values of any type, so are converted to strings as they would be read from a CSV.
+        return isinstance(column.dtype, pd.StringDtype)
+
+    if is_integer_dtype(expected):
+        return is_integer_dtype(column.dtype)
+
+    if is_float_dtype(expected):
+        return is_float_dtype(column.dtype)
+
+    if is_bool_dtype(expected):
+        return is_bool_dtype(column.dtype)
+
+    return column.dtype == expected
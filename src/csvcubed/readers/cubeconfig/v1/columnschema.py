@@ -52,7 +52,7 @@ from csvcubed.utils.uri import (
 )
 from csvcubed.models.codelistconfig.code_list_config import CodeListConfig
 from csvcubed.utils.file import code_list_config_json_exists
-from csvcubed.readers.cubeconfig.utils import load_resource
+from csvcubed.readers.cubeconfig.utils import load_schema_validator
 
 _logger = logging.getLogger(__name__)
 
@@ -138,7 +138,7 @@ class NewDimension(SchemaBaseClass):
                 code_list_config, code_list_config_dict = CodeListConfig.from_json_file(
                     code_list_config_path
                 )
-                schema = load_resource(code_list_config.schema)
+                schema = load_schema_validator(code_list_config.schema)
 
                 code_list_schema_validation_errors = validate_dict_against_schema(
                     value=code_list_config_dict, schema=schema
@@ -183,7 +183,7 @@ class NewDimension(SchemaBaseClass):
             and isinstance(self.code_list, dict)
         ):
             code_list_config = CodeListConfig.from_dict(self.code_list)
-            schema = load_resource(code_list_config.schema)
+            schema = load_schema_validator(code_list_config.schema)
 
             code_list_schema_validation_errors = validate_dict_against_schema(
                 value=code_list_config.as_dict(), schema=schema
@@ -4,11 +4,14 @@ __________________
 
 A loader for the v1.* config.json.
 """
+import copy
+import json
 import logging
+from dataclasses import dataclass, field
 from json import JSONDecodeError
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List, Callable
+from typing import Any, Dict, Optional, Tuple, List, Callable, Union
 
 from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
 
@@ -20,10 +23,13 @@ from csvcubed.models.cube.cube import Cube
 from csvcubed.models.cube.qb.catalog import CatalogMetadata
 from csvcubed.models.validationerror import ValidationError
 from csvcubed.utils.iterables import first
+from csvcubed.utils.uri import looks_like_uri
 from csvcubed.utils.validators.schema import validate_dict_against_schema
 from csvcubed.readers.cubeconfig.utils import (
+    coerce_and_check_dataframe,
     generate_title_from_file_name,
     load_resource,
+    load_schema_validator,
     read_and_check_csv,
 )
 from csvcubed.readers.catalogmetadata.v1.catalog_metadata_reader import (
@@ -33,6 +39,7 @@ from csvcubed.readers.cubeconfig.v1.mapcolumntocomponent import (
     map_column_to_qb_component,
 )
 from csvcubed.readers.cubeconfig.v1 import datatypes
+from csvcubed.readers.cubeconfig.v1.prefetch import prefetch_remote_resources
 
 from .constants import CONVENTION_NAMES
 
@@ -42,70 +49,249 @@ from ...preconfiguredtemplates import apply_preconfigured_values_from_template
 
 _logger = logging.getLogger(__name__)
 
+_MappedColumn = Tuple[QbColumn, Optional[List[JsonSchemaValidationError]]]
+
+
+@dataclass
+class ColumnMappingCache:
+    """
+    Retains the component each column was mapped to, along with the configuration it was mapped from, so that
+    deserialising a config again (e.g. whilst watching it for changes) only re-maps the columns whose configuration
+    has changed.
+
+    The mapping depends upon the column's data too, so the cache must be cleared whenever the data changes.
+    """
+
+    _mapped_columns: Dict[str, Tuple[str, _MappedColumn]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def get_mapped_column(
+        self,
+        column_title: str,
+        column_config: dict,
+        cube_config_minor_version: int,
+        config_path: Optional[Path],
+        map_column: Callable[[], _MappedColumn],
+    ) -> _MappedColumn:
+        """
+        Returns the column's previously mapped component if its configuration is unchanged, otherwise maps it.
+
+        Member of :class:`./ColumnMappingCache`.
+        """
+        # N.B. the key is generated before mapping the column since mapping updates the config in place.
+        key = json.dumps(
+            [
+                column_config,
+                cube_config_minor_version,
+                str(config_path),
+                _get_code_list_file_signature(column_config, config_path),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        cached_key, mapped_column = self._mapped_columns.get(column_title, (None, None))
+        if cached_key == key and mapped_column is not None:
+            _logger.debug(
+                "Column '%s' is unchanged; reusing its mapping.", column_title
+            )
+            return mapped_column
+
+        mapped_column = map_column()
+        self._mapped_columns[column_title] = (key, mapped_column)
+        return mapped_column
+
+    def clear(self) -> None:
+        """
+        Forgets every column's mapping.
+
+        Member of :class:`./ColumnMappingCache`.
+        """
+        self._mapped_columns.clear()
+
+
+def _get_code_list_file_signature(
+    column_config: dict, config_path: Optional[Path]
+) -> Optional[List[Any]]:
+    """
+    Identifies the version of the local code list config file the column refers to (if any), so that a column is
+    re-mapped when the code list's file changes.
+    """
+    code_list = column_config.get("code_list")
+    if not isinstance(code_list, str) or looks_like_uri(code_list):
+        return None
+
+    code_list_path = Path(code_list)
+    if not code_list_path.is_absolute() and config_path is not None:
+        code_list_path = config_path.parent / code_list_path
+    if not code_list_path.is_file():
+        return None
+
+    stat = code_list_path.stat()
+    return [str(code_list_path.resolve()), stat.st_mtime_ns, stat.st_size]
+
 
 def get_deserialiser(
     schema_path: str,
     cube_config_minor_version: int,
 ) -> Callable[
-    [Path, Optional[Path]],
+    [Union[Path, List[Path]], Optional[Path]],
     Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]],
 ]:
     """Generates a deserialiser function which validates the JSON file against the schema at :obj:`schema_path`"""
 
     def get_cube_from_config_json(
-        csv_path: Path,
+        csv_path: Union[Path, List[Path]],
         config_path: Optional[Path],
     ) -> Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]]:
         """
         Generates a Cube structure from a config.json input.
+
+        :param csv_path: the tidy CSV, or a list of the CSV shards which together hold the cube's data. The title and
+            datatypes are determined from the first shard.
         :return: tuple of cube and json schema errors (if any)
         """
+        if not isinstance(csv_path, Path) and len(csv_path) == 1:
+            csv_path = csv_path[0]
+        first_csv_path = csv_path if isinstance(csv_path, Path) else csv_path[0]
 
         # If we have a config json file then load it and validate against its reference schema
         if config_path:
             config = load_resource(config_path.resolve())
             # Update loaded config's title if not defined, setting title from csv data file path.
             if config.get("title") is None:
-                config["title"] = generate_title_from_file_name(csv_path)
-            try:
-                schema = load_resource(schema_path)
-                schema_validation_errors = validate_dict_against_schema(
-                    value=config, schema=schema
-                )
-            except JSONDecodeError:
-                _logger.warning(
-                    "Validation of the config json is not currently available, continuing without validation."
-                )
-                schema_validation_errors = []
+                config["title"] = generate_title_from_file_name(first_csv_path)
+            prefetch_remote_resources(config, schema_path, config_path)
+            schema_validation_errors = _validate_config(config, schema_path)
 
         # Create a default config, setting title from csv data file path.
         else:
-            config = {"title": generate_title_from_file_name(csv_path)}
+            config = {"title": generate_title_from_file_name(first_csv_path)}
             schema_validation_errors = []
 
-        dtype = datatypes.get_pandas_datatypes(csv_path, config=config)
+        dtype = datatypes.get_pandas_datatypes(first_csv_path, config=config)
         _logger.info(f"csv {csv_path} has mapping of columns to datatypes: {dtype}")
         data, data_errors = read_and_check_csv(csv_path, dtype=dtype)
 
-        (cube, code_list_schema_validation_errors) = _get_cube_from_config_json_dict(
-            data,
-            config,
-            cube_config_minor_version,
-            config_path=config_path,
+        cube, code_list_schema_validation_errors = _get_cube_from_data_and_config(
+            data, config, cube_config_minor_version, config_path=config_path
         )
         schema_validation_errors += code_list_schema_validation_errors
 
-        code_list_schema_validation_errors = _configure_remaining_columns_by_convention(
-            cube,
+        return cube, schema_validation_errors, data_errors
+
+    return get_cube_from_config_json
+
+
+def get_dataframe_deserialiser(
+    schema_path: str,
+    cube_config_minor_version: int,
+) -> Callable[
+    [
+        pd.DataFrame,
+        Optional[dict],
+        Optional[Path],
+        Optional[str],
+        Optional[ColumnMappingCache],
+    ],
+    Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]],
+]:
+    """
+    Generates a deserialiser function which builds a cube from a dataframe held in memory, validating the config
+    against the schema at :obj:`schema_path`.
+    """
+
+    def get_cube_from_dataframe(
+        data: pd.DataFrame,
+        config: Optional[dict],
+        config_path: Optional[Path],
+        title: Optional[str],
+        column_mapping_cache: Optional[ColumnMappingCache] = None,
+    ) -> Tuple[QbCube, List[JsonSchemaValidationError], List[ValidationError]]:
+        """
+        Generates a Cube structure from a dataframe and an (optional) config dictionary.
+
+        :param config_path: the location the config was loaded from (if any); code list files referenced in the config
+            are resolved relative to it.
+        :param title: the cube's title, used when the config does not define one.
+        :param column_mapping_cache: optionally, the mappings of the columns from a previous deserialisation of the
+            same data; only columns whose configuration has changed are re-mapped.
+        :return: tuple of cube, json schema errors and data errors (if any)
+        """
+        config_provided = config is not None
+        # Deserialising the config (e.g. applying column templates) updates it in place.
+        config = copy.deepcopy(config) if config_provided else {}
+        if config.get("title") is None:
+            if title is None:
+                raise ValueError(
+                    "A title must be provided when the config does not define one."
+                )
+            config["title"] = title
+
+        if config_provided:
+            prefetch_remote_resources(config, schema_path, config_path)
+            schema_validation_errors = _validate_config(config, schema_path)
+        else:
+            schema_validation_errors = []
+
+        dtype = datatypes.get_pandas_datatypes_for_columns(
+            list(data.columns), config=config
+        )
+        _logger.info(f"dataframe has mapping of columns to datatypes: {dtype}")
+        data, data_errors = coerce_and_check_dataframe(data, dtype=dtype)
+
+        cube, code_list_schema_validation_errors = _get_cube_from_data_and_config(
             data,
+            config,
             cube_config_minor_version,
             config_path=config_path,
+            column_mapping_cache=column_mapping_cache,
         )
         schema_validation_errors += code_list_schema_validation_errors
 
         return cube, schema_validation_errors, data_errors
 
-    return get_cube_from_config_json
+    return get_cube_from_dataframe
+
+
+def _validate_config(config: dict, schema_path: str) -> List[JsonSchemaValidationError]:
+    try:
+        schema_validator = load_schema_validator(schema_path)
+        return validate_dict_against_schema(value=config, schema=schema_validator)
+    except JSONDecodeError:
+        _logger.warning(
+            "Validation of the config json is not currently available, continuing without validation."
+        )
+        return []
+
+
+def _get_cube_from_data_and_config(
+    data: pd.DataFrame,
+    config: Dict,
+    cube_config_minor_version: int,
+    config_path: Optional[Path] = None,
+    column_mapping_cache: Optional[ColumnMappingCache] = None,
+) -> Tuple[QbCube, List[JsonSchemaValidationError]]:
+    """
+    Maps the columns defined in the config and then those configured by convention.
+    """
+    (cube, code_list_schema_validation_errors) = _get_cube_from_config_json_dict(
+        data,
+        config,
+        cube_config_minor_version,
+        config_path=config_path,
+        column_mapping_cache=column_mapping_cache,
+    )
+
+    code_list_schema_validation_errors += _configure_remaining_columns_by_convention(
+        cube,
+        data,
+        cube_config_minor_version,
+        config_path=config_path,
+        column_mapping_cache=column_mapping_cache,
+    )
+
+    return cube, code_list_schema_validation_errors
 
 
 def _get_cube_from_config_json_dict(
@@ -113,6 +299,7 @@ def _get_cube_from_config_json_dict(
     config: Dict,
     cube_config_minor_version: int,
     config_path: Optional[Path] = None,
+    column_mapping_cache: Optional[ColumnMappingCache] = None,
 ) -> Tuple[QbCube, list[JsonSchemaValidationError]]:
     columns: List[CsvColumn] = []
     metadata: CatalogMetadata = metadata_from_dict(config)
@@ -123,13 +310,24 @@ def _get_cube_from_config_json_dict(
         if type(column_config) is bool and not column_config:
             columns.append(SuppressedCsvColumn(column_title))
         elif isinstance(column_config, dict):
-            (qb_column, validation_errors) = _get_qb_column_from_json(
+            map_column = lambda: _get_qb_column_from_json(
                 column_config,
                 column_title,
                 data,
                 cube_config_minor_version,
                 config_path=config_path,
             )
+            (qb_column, validation_errors) = (
+                map_column()
+                if column_mapping_cache is None
+                else column_mapping_cache.get_mapped_column(
+                    column_title,
+                    column_config,
+                    cube_config_minor_version,
+                    config_path,
+                    map_column,
+                )
+            )
             columns.append(qb_column)
             if validation_errors:
                 code_list_schema_validation_errors += validation_errors
@@ -172,6 +370,7 @@ def _configure_remaining_columns_by_convention(
     data: pd.DataFrame,
     cube_config_minor_version: int,
     config_path: Optional[Path] = None,
+    column_mapping_cache: Optional[ColumnMappingCache] = None,
 ) -> list[JsonSchemaValidationError]:
     """Update columns from csv where appropriate, i.e. config did not define the column."""
     configured_columns = {col.csv_column_title: col for col in cube.columns}
@@ -186,13 +385,24 @@ def _configure_remaining_columns_by_convention(
         elif column_title not in configured_columns:
             column_dict = _get_conventional_column_definition_for_title(column_title)
 
-            (qb_column, validation_errors) = map_column_to_qb_component(
+            map_column = lambda: map_column_to_qb_component(
                 column_title=column_title,
                 column=column_dict,
                 data=data[column_title].astype("category"),
                 cube_config_minor_version=cube_config_minor_version,
                 config_path=config_path,
             )
+            (qb_column, validation_errors) = (
+                map_column()
+                if column_mapping_cache is None
+                else column_mapping_cache.get_mapped_column(
+                    column_title,
+                    column_dict,
+                    cube_config_minor_version,
+                    config_path,
+                    map_column,
+                )
+            )
             if validation_errors:
                 code_list_schema_validation_errors += validation_errors
             ordered_columns.append(qb_column)
@@ -101,6 +101,16 @@ def get_pandas_datatypes(
     """
     Creates a dictionary of column_label:datatype for all columns in the dataframe.
     """
+    column_list: List[str] = pd.read_csv(csv_path, nrows=0).columns.tolist()  # type: ignore
+    return get_pandas_datatypes_for_columns(column_list, config=config)
+
+
+def get_pandas_datatypes_for_columns(
+    column_list: List[str], config: Optional[dict] = None
+) -> Dict[str, str]:
+    """
+    Creates a dictionary of column_label:datatype for each of the given columns.
+    """
 
     dtype = {}  # Mapping of column name to pandas datatype
 
@@ -110,7 +120,6 @@ def get_pandas_datatypes(
             dtype = pandas_datatypes_from_columns_config(config["columns"])
 
     # Columns configured by convention
-    column_list: List[str] = pd.read_csv(csv_path, nrows=0).columns.tolist()  # type: ignore
     untyped_column_list: List[str] = [x for x in column_list if x not in dtype]
     for uc in untyped_column_list:
         if _is_conventional_measures_column(uc.lower()):
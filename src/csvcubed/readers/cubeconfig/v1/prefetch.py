@@ -0,0 +1,150 @@
+"""
+Remote Resource Prefetch
+------------------------
+
+Fetches the remote resources a v1.* qube-config refers to (its schema, the column templates and code list config
+schemas, along with the remote schemas those schemas refer to) concurrently, before the config is deserialised.
+
+Deserialisation loads each resource at the point it's used; once prefetched, they're served from memory (see
+:func:`~csvcubed.utils.json.prefetch_json_documents`). Resources which only become known once another resource has
+been fetched (e.g. the template files listed in the template lookup) are fetched in a subsequent wave, so a cold
+cache costs one round-trip per level of references rather than one per resource.
+"""
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set, Union
+from urllib.parse import urldefrag
+
+from csvcubed.models.codelistconfig.code_list_config import (
+    CODE_LIST_CONFIG_DEFAULT_URL,
+)
+from csvcubed.readers.preconfiguredtemplates import (
+    TEMPLATE_LOOKUP_URL,
+    get_template_url,
+)
+from csvcubed.utils.json import load_json_document, prefetch_json_documents
+from csvcubed.utils.uri import looks_like_uri
+
+_logger = logging.getLogger(__name__)
+
+
+def prefetch_remote_resources(
+    config: dict, schema_path: Union[str, Path], config_path: Optional[Path] = None
+) -> None:
+    """
+    Fetches the remote resources the qube-config refers to concurrently so that deserialising it doesn't wait on
+    each of them in turn.
+
+    Member of :file:`./prefetch.py`
+
+    :return: `None`
+    """
+    urls = _get_remote_resource_urls(config, schema_path, config_path)
+    fetched_urls: Set[str] = set()
+    while any(urls):
+        fetched_urls |= urls
+        documents = prefetch_json_documents(urls)
+
+        urls = set()
+        for url, document in documents.items():
+            if url == TEMPLATE_LOOKUP_URL:
+                urls |= _get_template_urls(config, document)
+            urls |= _get_remote_schema_references(document)
+        urls -= fetched_urls
+
+
+def _get_remote_resource_urls(
+    config: dict, schema_path: Union[str, Path], config_path: Optional[Path]
+) -> Set[str]:
+    urls = (
+        {schema_path}
+        if isinstance(schema_path, str) and looks_like_uri(schema_path)
+        else set()
+    )
+
+    for column_config in _get_column_configs(config):
+        if "from_template" in column_config:
+            urls.add(TEMPLATE_LOOKUP_URL)
+
+        code_list_schema = _get_code_list_config_schema(
+            column_config.get("code_list"), config_path
+        )
+        if code_list_schema is not None and looks_like_uri(code_list_schema):
+            urls.add(code_list_schema)
+
+    return urls
+
+
+def _get_template_urls(config: dict, template_lookup: Dict[str, Any]) -> Set[str]:
+    return {
+        get_template_url(template_lookup[column_config["from_template"]])
+        for column_config in _get_column_configs(config)
+        if isinstance(column_config.get("from_template"), str)
+        and isinstance(template_lookup.get(column_config["from_template"]), str)
+    }
+
+
+def _get_code_list_config_schema(
+    code_list: Any, config_path: Optional[Path]
+) -> Optional[str]:
+    """
+    Returns the schema of a code list config which is defined inline or in a local file.
+    """
+    if isinstance(code_list, dict):
+        return code_list.get("$schema", CODE_LIST_CONFIG_DEFAULT_URL)
+
+    if (
+        not isinstance(code_list, str)
+        or looks_like_uri(code_list)
+        or not code_list.endswith(".json")
+        or config_path is None
+    ):
+        return None
+
+    code_list_config_path = config_path.parent / code_list
+    if not code_list_config_path.is_file():
+        return None
+
+    try:
+        code_list_config = load_json_document(code_list_config_path.resolve())
+    except Exception:
+        # Deserialisation reports the problem with the file.
+        _logger.debug("Unable to read code list config %s", code_list_config_path)
+        return None
+
+    return (
+        code_list_config.get("$schema", CODE_LIST_CONFIG_DEFAULT_URL)
+        if isinstance(code_list_config, dict)
+        else None
+    )
+
+
+def _get_remote_schema_references(document: Any) -> Set[str]:
+    """
+    Returns the URLs of the remote documents the (JSON schema) document refers to with `$ref`.
+    """
+    if isinstance(document, dict):
+        references = set()
+        reference = document.get("$ref")
+        if isinstance(reference, str) and looks_like_uri(reference):
+            references.add(urldefrag(reference).url)
+
+        for value in document.values():
+            references |= _get_remote_schema_references(value)
+        return references
+    elif isinstance(document, list):
+        return {
+            reference
+            for value in document
+            for reference in _get_remote_schema_references(value)
+        }
+
+    return set()
+
+
+def _get_column_configs(config: dict) -> Iterable[dict]:
+    columns = config.get("columns")
+    if not isinstance(columns, dict):
+        return []
+
+    return [c for c in columns.values() if isinstance(c, dict)]
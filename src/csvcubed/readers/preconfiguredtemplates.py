@@ -10,18 +10,51 @@ from typing import Dict, Any
 from requests.exceptions import JSONDecodeError, HTTPError
 
 from csvcubed.utils.cache import session
+from csvcubed.utils.json import get_prefetched_json_document
 from csvcubed.utils.uri import csvw_column_name_safe
 
 TEMPLATE_BASE_URL = "https://purl.org/csv-cubed/qube-config/templates"
 
+TEMPLATE_LOOKUP_URL = f"{TEMPLATE_BASE_URL}/preset_column_config.json"
+
 _logger = logging.getLogger(__name__)
 
+_template_cache: Dict[str, Any] = {}
+"""
+Per-process cache of the template lookup and template files, keyed by their URL.
+"""
+
 
 def _get_template_file_from_template_lookup(template_value: str) -> str:
     """
     Given the `from_template` value, look up the template in the git repo
     """
-    template_lookup_url = f"{TEMPLATE_BASE_URL}/preset_column_config.json"
+    template_lookup_url = TEMPLATE_LOOKUP_URL
+    if template_lookup_url in _template_cache:
+        template_lookup = _template_cache[template_lookup_url]
+    else:
+        template_lookup = _fetch_template_lookup(template_lookup_url)
+        _template_cache[template_lookup_url] = template_lookup
+
+    template_file = template_lookup.get(template_value)
+    if not template_file:
+        raise Exception(f"Couldn't find template your looking for '{template_value}'.")
+
+    return template_file
+
+
+def get_template_url(template_file: str) -> str:
+    """
+    Given the template's file path (from the template lookup), returns the URL of the template.
+    """
+    return f"{TEMPLATE_BASE_URL}/{template_file}"
+
+
+def _fetch_template_lookup(template_lookup_url: str) -> Dict[str, str]:
+    prefetched_template_lookup = get_prefetched_json_document(template_lookup_url)
+    if prefetched_template_lookup is not None:
+        return prefetched_template_lookup
+
     template_lookup_response = session.get(template_lookup_url)
     _logger.debug("The template lookup/index file: %s", template_lookup_url)
 
@@ -37,18 +70,22 @@ def _get_template_file_from_template_lookup(template_value: str) -> str:
             f"Could not decode response {linesep}{template_lookup_response}{linesep} from {template_lookup_url}"
         ) from e
 
-    template_file = template_lookup.get(template_value)
-    if not template_file:
-        raise Exception(f"Couldn't find template your looking for '{template_value}'.")
-
-    return template_file
+    return template_lookup
 
 
 def _get_properties_from_template_file(template_file: str) -> dict:
     """
     Given the file path to the template, read in all the propeties of that particular template
     """
-    template_url = f"{TEMPLATE_BASE_URL}/{template_file}"
+    template_url = get_template_url(template_file)
+    if template_url in _template_cache:
+        return _template_cache[template_url]
+
+    prefetched_template = get_prefetched_json_document(template_url)
+    if prefetched_template is not None:
+        _template_cache[template_url] = prefetched_template
+        return prefetched_template
+
     template_response = session.get(template_url)
 
     if not template_response.ok:
@@ -63,6 +100,7 @@ def _get_properties_from_template_file(template_file: str) -> dict:
             f"Could not decode response {linesep}{template_response}{linesep} from {template_url}"
         ) from e
 
+    _template_cache[template_url] = fetch_template
     return fetch_template
 
 
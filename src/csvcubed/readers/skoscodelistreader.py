@@ -4,13 +4,16 @@ SKOS Codelist Reader
 
 Read some information from a CSV-W `skos:ConceptScheme`.
 """
+import json
 import logging
 import re
-from typing import Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 
 from pathlib import Path
 from uritemplate import variables
 
+from csvcubed.models.sparqlresults import TableSchemaPropertiesResult
+from csvcubed.utils.csvw import defines_base_uri, load_local_table_schema
 from csvcubed.utils.iterables import first
 from csvcubed.utils.sparql_handler.sparqlmanager import select_table_schema_properties
 from csvcubed.utils.tableschema import CsvwRdfManager
@@ -18,6 +21,18 @@ from csvcubed.utils.tableschema import CsvwRdfManager
 
 _logger = logging.getLogger(__name__)
 
+_SKOS_IN_SCHEME_PROPERTY_URLS = {
+    "skos:inScheme",
+    "http://www.w3.org/2004/02/skos/core#inScheme",
+}
+
+_concept_scheme_info_cache: Dict[Tuple[Path, int], Tuple[str, str, str]] = {}
+"""
+Per-process cache of the concept scheme info, keyed by the CSV-W's path and modification time.
+
+Errors aren't cached since they may be transient (e.g. failing to fetch a remote JSON-LD context).
+"""
+
 
 def extract_code_list_concept_scheme_info(
     code_list_csvw_path: Path,
@@ -28,9 +43,37 @@ def extract_code_list_concept_scheme_info(
 
       `concept_uri_template` uses the standard `notation` uri template variable even if the underlying file uses a
        different column name.
+
+      The result is cached so that each CSV-W is only read once per process (unless it is modified).
     """
-    csvw_rdf_manager = CsvwRdfManager(code_list_csvw_path)
-    result = select_table_schema_properties(csvw_rdf_manager.rdf_graph)
+    if not code_list_csvw_path.is_file():
+        return _extract_code_list_concept_scheme_info(code_list_csvw_path)
+
+    cache_key = (
+        code_list_csvw_path.resolve(),
+        code_list_csvw_path.stat().st_mtime_ns,
+    )
+    cached_result = _concept_scheme_info_cache.get(cache_key)
+    if cached_result is not None:
+        _logger.debug("Using cached concept scheme info for %s", code_list_csvw_path)
+        return cached_result
+
+    result = _extract_code_list_concept_scheme_info(code_list_csvw_path)
+    _concept_scheme_info_cache[cache_key] = result
+    return result
+
+
+def _extract_code_list_concept_scheme_info(
+    code_list_csvw_path: Path,
+) -> Tuple[str, str, str]:
+    result = _get_table_schema_properties_from_json(code_list_csvw_path)
+    if result is None:
+        _logger.debug(
+            "Falling back to querying the RDF graph of %s for the table schema properties.",
+            code_list_csvw_path,
+        )
+        csvw_rdf_manager = CsvwRdfManager(code_list_csvw_path)
+        result = select_table_schema_properties(csvw_rdf_manager.rdf_graph)
 
     about_url = result.about_url
     concept_scheme_uri = result.value_url
@@ -58,3 +101,63 @@ def extract_code_list_concept_scheme_info(
             about_url,
         )
     return table_url, concept_scheme_uri, about_url
+
+
+def _get_table_schema_properties_from_json(
+    code_list_csvw_path: Path,
+) -> Optional[TableSchemaPropertiesResult]:
+    """
+    Reads the table schema properties directly from the structure of the CSV-W's JSON, avoiding the cost of
+    building its RDF graph.
+
+    :return: `None` where the properties can't be unambiguously identified from the JSON alone, in which case the
+      RDF graph must be queried.
+    """
+    try:
+        with open(code_list_csvw_path, "r") as f:
+            metadata = json.load(f)
+    except ValueError:
+        return None
+
+    if not isinstance(metadata, dict) or defines_base_uri(metadata.get("@context")):
+        return None
+
+    tables = metadata.get("tables", [metadata])
+    if not isinstance(tables, list):
+        return None
+
+    results: List[TableSchemaPropertiesResult] = []
+    for table in tables:
+        if not isinstance(table, dict):
+            return None
+
+        table_schema = load_local_table_schema(
+            code_list_csvw_path.parent, table.get("tableSchema")
+        )
+        if table_schema is None:
+            return None
+
+        columns = table_schema.get("columns", [])
+        if not isinstance(columns, list):
+            return None
+
+        for column in columns:
+            if (
+                isinstance(column, dict)
+                and column.get("propertyUrl") in _SKOS_IN_SCHEME_PROPERTY_URLS
+                and "valueUrl" in column
+            ):
+                table_url = table.get("url")
+                about_url = table_schema.get("aboutUrl")
+                value_url = column["valueUrl"]
+                if not all(
+                    isinstance(v, str) for v in [table_url, about_url, value_url]
+                ):
+                    return None
+                results.append(
+                    TableSchemaPropertiesResult(
+                        about_url=about_url, value_url=value_url, table_url=table_url
+                    )
+                )
+
+    return results[0] if len(results) == 1 else None
@@ -1,4 +1,272 @@
+"""
+HTTP Cache
+----------
+
+The cached HTTP session used to fetch remote documents (e.g. the qube-config schemas, column templates and JSON-LD
+contexts).
+
+The cache is configured from the environment when this module is first imported (see
+:func:`get_http_cache_settings_from_environment`) and may be reconfigured with :func:`configure_http_cache`. The
+`session` object is reconfigured in place, so modules which have already imported it use the new configuration.
+"""
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, MutableMapping, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests_cache import CachedSession
+from requests_cache.backends import BaseCache, FileCache, SQLiteCache
+from requests_cache.backends.sqlite import SQLiteDict
+
+_logger = logging.getLogger(__name__)
+
+_CACHE_NAME = "http_cache"
+
+_SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+"""
+How long a process waits for another process writing to the SQLite cache before failing.
+"""
+
+HTTP_CACHE_BACKEND_ENV_VAR = "CSVCUBED_HTTP_CACHE_BACKEND"
+HTTP_CACHE_DIR_ENV_VAR = "CSVCUBED_HTTP_CACHE_DIR"
+HTTP_CACHE_READ_ONLY_ENV_VAR = "CSVCUBED_HTTP_CACHE_READ_ONLY"
+HTTP_CACHE_OFFLINE_ENV_VAR = "CSVCUBED_HTTP_CACHE_OFFLINE"
+HTTP_CACHE_EXPIRE_AFTER_ENV_VAR = "CSVCUBED_HTTP_CACHE_EXPIRE_AFTER"
+
+
+class HttpCacheBackend(Enum):
+    """
+    Where the responses to HTTP requests are cached.
+    """
+
+    SQLite = "sqlite"
+    """
+    A SQLite database in write-ahead logging (WAL) mode, so processes reading the cache don't wait for one writing to
+    it.
+    """
+
+    Filesystem = "filesystem"
+    """
+    One file per response.
+    """
+
+    Memory = "memory"
+    """
+    The process's memory; nothing is shared between processes.
+    """
+
+
+@dataclass
+class HttpCacheSettings:
+    """
+    How HTTP requests are cached.
+    """
+
+    backend: HttpCacheBackend = HttpCacheBackend.SQLite
+    cache_dir: Optional[Path] = None
+    """
+    The directory holding the cache; defaults to the user's cache directory.
+    """
+    read_only: bool = False
+    """
+    Use the cache's existing responses without writing to it, e.g. where parallel CI jobs share one pre-populated
+    cache.
+    """
+    offline: bool = False
+    """
+    Only respond with cached responses (even where they have expired); requests for anything else fail.
+    """
+    urls_expire_after: Dict[str, int] = field(default_factory=dict)
+    """
+    The number of seconds responses from URLs matching each glob pattern are cached for (`-1` never expires); these
+    take precedence over the responses' `Cache-Control` headers.
+    """
+
+
+class _ReadOnlyStorage(MutableMapping):
+    """
+    Reads from one of another cache's storages (e.g. its responses) without ever writing to it.
+    """
+
+    def __init__(self, storage: MutableMapping):
+        self._storage = storage
+
+    def __getitem__(self, key: str) -> Any:
+        return self._storage[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._storage)
+
+    def __len__(self) -> int:
+        return len(self._storage)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        pass
+
+    def __delitem__(self, key: str) -> None:
+        pass
+
+    def bulk_delete(self, keys: Iterable[str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class _ReadOnlyCache(BaseCache):
+    """
+    Reads responses from another cache without ever writing to it.
+
+    The cache's storages are wrapped (rather than its methods overridden) so that every way of modifying the cache,
+    e.g. the session deleting an expired response it failed to fetch again, leaves the underlying cache unchanged.
+    """
+
+    def __init__(self, cache: BaseCache):
+        super().__init__(
+            cache.cache_name,
+            match_headers=cache.match_headers,
+            ignored_parameters=cache.ignored_parameters,
+            key_fn=cache.key_fn,
+        )
+        self.responses = _ReadOnlyStorage(cache.responses)
+        self.redirects = _ReadOnlyStorage(cache.redirects)
+
+    def save_response(
+        self,
+        response: requests.Response,
+        cache_key: Optional[str] = None,
+        expires: Optional[datetime] = None,
+    ):
+        _logger.debug("The HTTP cache is read-only; not caching %s", response.url)
+
+
+class _OfflineAdapter(BaseAdapter):
+    """
+    Fails every request which reaches it; only responses from the cache are available.
+    """
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs):
+        raise requests.ConnectionError(
+            f"Unable to fetch {request.url}; the HTTP cache is offline and holds no response for it.",
+            request=request,
+        )
+
+    def close(self):
+        pass
+
+
+def get_http_cache_settings_from_environment() -> HttpCacheSettings:
+    """
+    Reads the HTTP cache's settings from the environment variables:
+
+    * `CSVCUBED_HTTP_CACHE_BACKEND` - `sqlite` (the default), `filesystem` or `memory`.
+    * `CSVCUBED_HTTP_CACHE_DIR` - the directory holding the cache.
+    * `CSVCUBED_HTTP_CACHE_READ_ONLY` - `true` to never write to the cache.
+    * `CSVCUBED_HTTP_CACHE_OFFLINE` - `true` to only use cached responses.
+    * `CSVCUBED_HTTP_CACHE_EXPIRE_AFTER` - a JSON object mapping URL glob patterns to the number of seconds their
+      responses are cached for, e.g. `{"purl.org/csv-cubed/*": 86400}`.
+
+    Member of :file:`./cache.py`
+
+    :return: `HttpCacheSettings`
+    """
+    cache_dir = os.environ.get(HTTP_CACHE_DIR_ENV_VAR)
+    urls_expire_after = os.environ.get(HTTP_CACHE_EXPIRE_AFTER_ENV_VAR)
+
+    return HttpCacheSettings(
+        backend=HttpCacheBackend(
+            os.environ.get(
+                HTTP_CACHE_BACKEND_ENV_VAR, HttpCacheBackend.SQLite.value
+            ).lower()
+        ),
+        cache_dir=None if not cache_dir else Path(cache_dir),
+        read_only=_is_true(os.environ.get(HTTP_CACHE_READ_ONLY_ENV_VAR)),
+        offline=_is_true(os.environ.get(HTTP_CACHE_OFFLINE_ENV_VAR)),
+        urls_expire_after=(
+            {} if not urls_expire_after else dict(json.loads(urls_expire_after))
+        ),
+    )
+
+
+def configure_http_cache(settings: HttpCacheSettings) -> None:
+    """
+    Reconfigures the (shared) cached HTTP `session`.
+
+    This isn't thread-safe; configure the cache before making any requests.
+
+    Member of :file:`./cache.py`
+
+    :return: `None`
+    """
+    _logger.debug("Configuring the HTTP cache: %s", settings)
+    cache = _create_backend(settings)
+    session.cache = _ReadOnlyCache(cache) if settings.read_only else cache
+    session.urls_expire_after = dict(settings.urls_expire_after)
+    # Offline, expired responses are still better than none.
+    session.stale_if_error = settings.offline
+
+    adapter = _OfflineAdapter() if settings.offline else HTTPAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def _create_backend(settings: HttpCacheSettings) -> BaseCache:
+    if settings.backend == HttpCacheBackend.Memory:
+        return BaseCache(_CACHE_NAME)
+
+    cache_name = (
+        _CACHE_NAME
+        if settings.cache_dir is None
+        else str(settings.cache_dir / _CACHE_NAME)
+    )
+    use_cache_dir = settings.cache_dir is None
+
+    if settings.backend == HttpCacheBackend.Filesystem:
+        cache: BaseCache = FileCache(cache_name, use_cache_dir=use_cache_dir)
+    elif settings.backend == HttpCacheBackend.SQLite:
+        cache = SQLiteCache(
+            cache_name,
+            use_cache_dir=use_cache_dir,
+            timeout=_SQLITE_BUSY_TIMEOUT_SECONDS,
+        )
+    else:
+        raise ValueError(f"Unhandled HTTP cache backend {settings.backend}")
+
+    if not settings.read_only:
+        for storage in [cache.responses, cache.redirects]:
+            if isinstance(storage, SQLiteDict):
+                _enable_write_ahead_logging(storage)
+
+    return cache
+
+
+def _enable_write_ahead_logging(storage: SQLiteDict) -> None:
+    """
+    In WAL mode, processes reading the database don't wait for (or block) a process writing to it. The mode is
+    persisted in the database file.
+    """
+    try:
+        with storage.connection() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.OperationalError as e:
+        _logger.warning(
+            "Unable to enable write-ahead logging on the HTTP cache %s: %s",
+            storage.db_path,
+            e,
+        )
+
+
+def _is_true(value: Optional[str]) -> bool:
+    return value is not None and value.strip().lower() in {"1", "true", "yes"}
+
 
+session = CachedSession(backend=BaseCache(_CACHE_NAME), cache_control=True)
 
-session = CachedSession(cache_control=True, use_cache_dir=True)
+configure_http_cache(get_http_cache_settings_from_environment())
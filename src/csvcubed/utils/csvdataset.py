@@ -7,7 +7,7 @@ Utilities for CSV Datasets
 
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid1
 
 import pandas as pd
@@ -29,15 +29,20 @@ def transform_dataset_to_canonical_shape(
     dataset_uri: str,
     csvw_metadata_rdf_graph: rdflib.ConjunctiveGraph,
     csvw_metadata_json_path: Path,
-) -> Tuple[pd.DataFrame, str, str]:
+) -> Tuple[pd.DataFrame, str, str, Dict[str, str]]:
     """
     Transforms the given dataset into canonical shape if it is not in the canonical shape already.
 
+    The dataset is not copied. Where the measure or unit is defined once for the whole dataset (rather than in a
+    column), a name is generated for the virtual column and its constant value is returned alongside it so that it
+    can be attached after any grouping has taken place.
+
     Member of :class:`./csvdataset`.
 
-    :return: `Tuple[pd.DataFrame, str, str]` - canonical dataframe, measure column name, unit column name.
+    :return: `Tuple[pd.DataFrame, str, str, Dict[str, str]]` - dataset, measure column name, unit column name and
+        the map of virtual column names to their constant values.
     """
-    canonical_shape_dataset = dataset.copy()
+    constant_columns: Dict[str, str] = {}
 
     measure_col: Optional[str] = get_measure_col_name_from_dsd(qube_components)
     unit_col: Optional[str] = get_unit_col_name_from_dsd(qube_components)
@@ -49,16 +54,16 @@ def transform_dataset_to_canonical_shape(
             dataset_uri,
             csvw_metadata_json_path,
         )
-        canonical_shape_dataset[unit_col] = (
+        constant_columns[unit_col] = (
             result.unit_label if result.unit_label is not None else result.unit_uri
         )
 
     if measure_col is None:
         measure_col = f"Measure_{str(uuid1())}"
         result = get_single_measure_from_dsd(qube_components, csvw_metadata_json_path)
-        canonical_shape_dataset[measure_col] = (
+        constant_columns[measure_col] = (
             result.measure_label
             if result.measure_label is not None
             else result.measure_uri
         )
-    return (canonical_shape_dataset, measure_col, unit_col)
+    return (dataset, measure_col, unit_col, constant_columns)
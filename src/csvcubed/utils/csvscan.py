@@ -0,0 +1,103 @@
+"""
+CSV Scanning
+------------
+
+Utilities which scan through CSV files without parsing them into memory.
+"""
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, List
+
+_SCAN_CHUNK_SIZE = 4 * 1024 * 1024
+_QUOTE = b'"'
+_NEW_LINE = b"\n"
+
+
+@dataclass(frozen=True)
+class CsvRowsScanResult:
+    """
+    The result of scanning the records in a CSV file.
+    """
+
+    num_of_rows: int
+    """The number of rows in the CSV, excluding the header row."""
+    tail_offset: int
+    """The byte offset at which the last `num_tail_rows` rows begin."""
+
+
+def scan_csv_rows(csv_path: Path, num_tail_rows: int) -> CsvRowsScanResult:
+    """
+    Counts the rows in the CSV file and locates the byte offset at which its last :obj:`num_tail_rows` rows begin.
+
+    The file is read in chunks and new lines are counted using a fast byte scan. New lines which occur inside quoted
+    values do not end a record and so are not counted. Since an escaped quote (`""`) toggles the quoted state twice,
+    tracking the parity of the quote characters is sufficient to identify them.
+
+    Member of :file:`./csvscan.py`
+
+    :return: `CsvRowsScanResult`
+    """
+    # The offsets immediately after each of the most recent record-terminating new lines.
+    record_end_offsets: Deque[int] = deque([0], maxlen=num_tail_rows + 1)
+    num_of_new_lines = 0
+    in_quotes = False
+    offset = 0
+    last_byte = b""
+
+    with open(csv_path, "rb") as f:
+        while True:
+            chunk = f.read(_SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            segment_offset = offset
+            # Segments alternate between being outside and inside of quotes.
+            for segment_index, segment in enumerate(chunk.split(_QUOTE)):
+                if segment_index > 0:
+                    in_quotes = not in_quotes
+
+                if not in_quotes:
+                    num_of_new_lines += segment.count(_NEW_LINE)
+                    record_end_offsets.extend(
+                        segment_offset + position + 1
+                        for position in _get_last_new_line_positions(
+                            segment, num_tail_rows + 1
+                        )
+                    )
+
+                segment_offset += len(segment) + 1
+
+            offset += len(chunk)
+            last_byte = chunk[-1:]
+
+    num_of_records = num_of_new_lines
+    if last_byte not in [b"", _NEW_LINE]:
+        # The final record isn't terminated by a new line.
+        num_of_records += 1
+        record_end_offsets.append(offset)
+
+    num_of_rows = max(num_of_records - 1, 0)
+    tail_row_index = max(
+        len(record_end_offsets) - 1 - min(num_of_rows, num_tail_rows), 0
+    )
+
+    return CsvRowsScanResult(
+        num_of_rows=num_of_rows, tail_offset=record_end_offsets[tail_row_index]
+    )
+
+
+def _get_last_new_line_positions(segment: bytes, max_positions: int) -> List[int]:
+    """
+    Returns (in ascending order) the positions of the last :obj:`max_positions` new lines in the segment.
+    """
+    positions: List[int] = []
+    end = len(segment)
+    while len(positions) < max_positions:
+        position = segment.rfind(_NEW_LINE, 0, end)
+        if position == -1:
+            break
+        positions.append(position)
+        end = position
+
+    return list(reversed(positions))
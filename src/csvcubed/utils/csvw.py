@@ -6,8 +6,9 @@ Utils for working with CSV-Ws.
 """
 import json
 import logging
-from typing import Set, List, Union
+from typing import Any, Dict, Optional, Set, List, Union
 from pathlib import Path
+from urllib.parse import urldefrag
 from rdflib import Graph
 
 from .json import load_json_document
@@ -17,6 +18,8 @@ from csvcubed.utils.rdf import parse_graph_retain_relative
 
 _logger = logging.getLogger(__name__)
 
+_VOID_DATA_DUMP_KEYS = {"void:dataDump", "http://rdfs.org/ns/void#dataDump"}
+
 
 def get_dependent_local_files(csvw_metadata_file: Path) -> Set[Path]:
     """
@@ -50,6 +53,104 @@ def get_dependent_local_files(csvw_metadata_file: Path) -> Set[Path]:
     return dependent_local_files
 
 
+def get_local_metadata_dependencies(csvw_metadata_file: Path) -> Set[Path]:
+    """
+    Returns the local RDF files which the CSV-W declares as dependencies (`void:dataDump`s, e.g. the metadata files
+    of the code lists a cube uses), along with the local dependencies of those which are JSON(-LD) files.
+
+    N.B. like :func:`get_dependent_local_files`, this only reads the JSON documents rather than their RDF, so it
+    works for the style of CSV-Ws that csvcubed generates.
+
+    :return: the paths of the dependencies (which may not exist).
+    """
+    dependencies: Set[Path] = set()
+    files_to_search = [csvw_metadata_file]
+    while any(files_to_search):
+        file_path = files_to_search.pop()
+        if not file_path.suffix == ".json" or not file_path.is_file():
+            continue
+
+        try:
+            document = load_json_document(file_path)
+        except Exception as ex:
+            _logger.debug("Unable to read dependencies of %s: %s", file_path, ex)
+            continue
+
+        base_path = _get_base_path(file_path.parent, document)
+        if not isinstance(base_path, Path):
+            continue
+
+        for data_dump in _get_void_data_dumps(document):
+            if looks_like_uri(data_dump):
+                continue
+
+            dependency_path = (base_path / urldefrag(data_dump).url).resolve()
+            if dependency_path not in dependencies:
+                _logger.debug("Found RDF dependency %s", dependency_path)
+                dependencies.add(dependency_path)
+                files_to_search.append(dependency_path)
+
+    return dependencies
+
+
+def _get_void_data_dumps(document: Any) -> List[str]:
+    if isinstance(document, list):
+        return [
+            data_dump for value in document for data_dump in _get_void_data_dumps(value)
+        ]
+
+    if not isinstance(document, dict):
+        return []
+
+    data_dumps: List[str] = []
+    for key, value in document.items():
+        if key in _VOID_DATA_DUMP_KEYS:
+            for data_dump in value if isinstance(value, list) else [value]:
+                if isinstance(data_dump, dict):
+                    data_dump = data_dump.get("@id")
+                if isinstance(data_dump, str):
+                    data_dumps.append(data_dump)
+        else:
+            data_dumps += _get_void_data_dumps(value)
+
+    return data_dumps
+
+
+def defines_base_uri(context: Any) -> bool:
+    """
+    :return: whether the JSON-LD `@context` (a single context or a list of them) overrides the base URI, in which
+      case relative URLs are resolved against it rather than the metadata file's location.
+    """
+    return _get_base(context) is not None
+
+
+def load_local_table_schema(
+    base_path: Path, table_schema: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    :return: the table's `tableSchema`, loading it from a local file where it is referenced by (relative) path.
+      `None` where the table schema is remote or can't be read.
+    """
+    if isinstance(table_schema, dict):
+        return table_schema
+
+    if not isinstance(table_schema, str) or looks_like_uri(table_schema):
+        return None
+
+    table_schema_path = base_path / table_schema
+    if not table_schema_path.is_file():
+        return None
+
+    try:
+        with open(table_schema_path, "r") as f:
+            loaded_table_schema = json.load(f)
+    except ValueError as ex:
+        _logger.debug("Unable to read table schema %s: %s", table_schema_path, ex)
+        return None
+
+    return loaded_table_schema if isinstance(loaded_table_schema, dict) else None
+
+
 def _load_table_group(csvw_metadata_file: Path) -> dict:
     with open(csvw_metadata_file, "r") as f:
         table_group = json.load(f)
@@ -84,23 +185,31 @@ def _get_base_path(preliminary_base_path: Path, table_group: dict) -> Union[Path
     """
     :return: :obj:`pathlib.Path` (local file path) OR :obj:`str` (URI path)
     """
-    context = table_group["@context"]
-    if isinstance(context, list) and len(context) > 1:
-        context_obj = context[1]
-        assert isinstance(context_obj, dict)
-        base = context_obj.get("@base")
-        if base is not None and isinstance(base, str) and len(base.strip()) > 0:
-            if looks_like_uri(base):
-                # base path is a URI, so none of the files will be local.
-                return base
-            base_path = Path(base)
-            if base_path.is_absolute():
-                return base_path
-            else:
-                return preliminary_base_path / base
+    base = _get_base(table_group.get("@context"))
+    if base is not None and isinstance(base, str) and len(base.strip()) > 0:
+        if looks_like_uri(base):
+            # base path is a URI, so none of the files will be local.
+            return base
+        base_path = Path(base)
+        if base_path.is_absolute():
+            return base_path
+        else:
+            return preliminary_base_path / base
     return preliminary_base_path
 
 
+def _get_base(context: Any) -> Optional[Any]:
+    """
+    :return: the `@base` defined in the JSON-LD `@context`, which may be a single context or a list of them.
+    """
+    contexts = context if isinstance(context, list) else [context]
+    for c in contexts:
+        if isinstance(c, dict) and "@base" in c:
+            return c["@base"]
+
+    return None
+
+
 def load_table_schema_file_to_graph(
     table_schema_file_path: Union[str, Path],
     table_schema_file_identifier: str,
@@ -0,0 +1,310 @@
+"""
+CSV-W Constraints
+-----------------
+
+Checks that the data in a CSV-W's tables satisfy the `primaryKey` and `foreignKeys` constraints declared in their
+table schemas.
+
+The checks are vectorised over the whole table: only the columns taking part in a constraint are loaded (as
+categoricals), primary keys are checked for uniqueness using the rows' categorical codes and foreign keys are checked
+by joining each column's (small) set of categories against the values in the referenced table.
+"""
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from csvcubed.models.csvwvalidationerrors import (
+    DuplicatePrimaryKeyError,
+    ForeignKeyViolationError,
+)
+from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.csvw import defines_base_uri, load_local_table_schema
+from csvcubed.utils.pandas import SPECIFIED_NA_VALUES, get_duplicate_rows_mask
+from csvcubed.utils.uri import looks_like_uri
+
+_logger = logging.getLogger(__name__)
+
+MAX_REPORTED_ROW_NUMBERS = 10
+"""The maximum number of offending row numbers recorded against each error."""
+
+_MAX_REPORTED_VALUES = 10
+
+
+@dataclass
+class CsvwTable:
+    """
+    The parts of a CSV-W table (and its table schema) needed to check its constraints.
+    """
+
+    url: str
+    csv_path: Path
+    column_titles: Dict[str, str]
+    """Map of (non-virtual) column name to the column's title in the CSV."""
+    primary_key: List[str]
+    """The names of the columns making up the primary key."""
+    foreign_keys: List[dict]
+
+
+def validate_csvw_constraints(csvw_metadata_json_path: Path) -> List[ValidationError]:
+    """
+    Checks that the data in each of the tables in the CSV-W satisfy their `primaryKey` and `foreignKeys` constraints.
+
+    Constraints which cannot be checked locally (e.g. those referencing remote tables or table schemas) are skipped
+    with a warning.
+
+    Member of :file:`./csvwconstraints.py`
+
+    :return: `List[ValidationError]` - the constraint violations found.
+    """
+    tables = get_csvw_tables(csvw_metadata_json_path)
+    tables_by_path = {table.csv_path.resolve(): table for table in tables}
+
+    errors: List[ValidationError] = []
+    for table in tables:
+        errors += _validate_table_constraints(table, tables_by_path)
+
+    return errors
+
+
+def get_csvw_tables(csvw_metadata_json_path: Path) -> List[CsvwTable]:
+    """
+    Reads the local tables (and their table schemas) defined in the CSV-W metadata file.
+
+    Member of :file:`./csvwconstraints.py`
+
+    :return: `List[CsvwTable]`
+    """
+    with open(csvw_metadata_json_path, "r") as f:
+        table_group = json.load(f)
+
+    if defines_base_uri(table_group.get("@context")):
+        _logger.warning(
+            "The CSV-W %s defines a base URL; its constraints cannot be checked.",
+            csvw_metadata_json_path,
+        )
+        return []
+
+    base_path = csvw_metadata_json_path.parent
+    tables: List[CsvwTable] = []
+    for table in table_group.get("tables", [table_group]):
+        url = table.get("url")
+        if not isinstance(url, str) or looks_like_uri(url):
+            _logger.warning("Skipping table %s as it is not local.", url)
+            continue
+
+        table_schema = load_local_table_schema(base_path, table.get("tableSchema"))
+        if table_schema is None:
+            _logger.warning(
+                "Skipping table %s as its table schema %s is not local or could not be read.",
+                url,
+                table.get("tableSchema"),
+            )
+            continue
+
+        tables.append(
+            CsvwTable(
+                url=url,
+                csv_path=base_path / url,
+                column_titles=_get_column_titles(table_schema.get("columns", [])),
+                primary_key=_as_list(table_schema.get("primaryKey")),
+                foreign_keys=table_schema.get("foreignKeys", []),
+            )
+        )
+
+    return tables
+
+
+def _validate_table_constraints(
+    table: CsvwTable, tables_by_path: Dict[Path, CsvwTable]
+) -> List[ValidationError]:
+    foreign_keys = [
+        foreign_key
+        for foreign_key in table.foreign_keys
+        if _can_check_foreign_key(table, foreign_key, tables_by_path)
+    ]
+    primary_key_titles = _get_titles(table, table.primary_key)
+
+    key_column_titles = set(primary_key_titles or [])
+    for foreign_key in foreign_keys:
+        key_column_titles |= set(
+            _get_titles(table, _as_list(foreign_key["columnReference"])) or []
+        )
+
+    if len(key_column_titles) == 0:
+        return []
+
+    _logger.info("Checking constraints of table %s", table.url)
+    data = _read_columns(table.csv_path, key_column_titles)
+
+    errors: List[ValidationError] = []
+    if primary_key_titles is not None and len(primary_key_titles) > 0:
+        duplicated_rows_mask = get_duplicate_rows_mask(data[primary_key_titles])
+        if duplicated_rows_mask.any():
+            errors.append(
+                DuplicatePrimaryKeyError(
+                    table_url=table.url,
+                    csv_column_titles=primary_key_titles,
+                    **_get_rows_summary(duplicated_rows_mask),
+                )
+            )
+
+    for foreign_key in foreign_keys:
+        errors += _validate_foreign_key(table, data, foreign_key, tables_by_path)
+
+    return errors
+
+
+def _validate_foreign_key(
+    table: CsvwTable,
+    data: pd.DataFrame,
+    foreign_key: dict,
+    tables_by_path: Dict[Path, CsvwTable],
+) -> List[ValidationError]:
+    reference = foreign_key["reference"]
+    referenced_table = tables_by_path[_get_referenced_csv_path(table, reference)]
+    referenced_values = _get_referenced_values(
+        referenced_table, _as_list(reference["columnReference"])
+    )
+
+    errors: List[ValidationError] = []
+    # N.B. composite foreign keys are checked column by column.
+    for column_title in _get_titles(table, _as_list(foreign_key["columnReference"])):
+        column = data[column_title]
+        categories = column.cat.categories
+        undefined_categories_mask = ~categories.isin(referenced_values)
+        if not undefined_categories_mask.any():
+            continue
+
+        undefined_codes = np.flatnonzero(undefined_categories_mask)
+        undefined_rows_mask = np.isin(column.cat.codes.to_numpy(), undefined_codes)
+        errors.append(
+            ForeignKeyViolationError(
+                table_url=table.url,
+                csv_column_title=column_title,
+                referenced_table_url=referenced_table.url,
+                undefined_values=sorted(
+                    str(v) for v in categories[undefined_categories_mask]
+                )[:_MAX_REPORTED_VALUES],
+                **_get_rows_summary(undefined_rows_mask),
+            )
+        )
+
+    return errors
+
+
+def _can_check_foreign_key(
+    table: CsvwTable, foreign_key: dict, tables_by_path: Dict[Path, CsvwTable]
+) -> bool:
+    reference = foreign_key.get("reference", {})
+    resource = reference.get("resource")
+    if not isinstance(resource, str) or looks_like_uri(resource):
+        _logger.warning(
+            "Unable to check foreign key on %s in %s: the referenced resource %s is not local.",
+            foreign_key.get("columnReference"),
+            table.url,
+            resource,
+        )
+        return False
+
+    referenced_table = tables_by_path.get(_get_referenced_csv_path(table, reference))
+    if referenced_table is None:
+        _logger.warning(
+            "Unable to check foreign key on %s in %s: the referenced table %s is not defined.",
+            foreign_key.get("columnReference"),
+            table.url,
+            resource,
+        )
+        return False
+
+    if (
+        _get_titles(table, _as_list(foreign_key.get("columnReference"))) is None
+        or _get_titles(referenced_table, _as_list(reference.get("columnReference")))
+        is None
+    ):
+        _logger.warning(
+            "Unable to check foreign key on %s in %s: a referenced column is not defined.",
+            foreign_key.get("columnReference"),
+            table.url,
+        )
+        return False
+
+    return True
+
+
+def _get_referenced_csv_path(table: CsvwTable, reference: dict) -> Path:
+    return (table.csv_path.parent / reference["resource"]).resolve()
+
+
+def _get_referenced_values(
+    referenced_table: CsvwTable, column_names: List[str]
+) -> Set[str]:
+    referenced_values: Set[str] = set()
+    for column_title in _get_titles(referenced_table, column_names):
+        referenced_column = _read_columns(referenced_table.csv_path, {column_title})[
+            column_title
+        ]
+        referenced_values |= set(referenced_column.cat.categories)
+
+    return referenced_values
+
+
+def _read_columns(csv_path: Path, column_titles: Set[str]) -> pd.DataFrame:
+    """
+    Reads the given columns from the CSV as categoricals. Empty cells are read as missing values.
+    """
+    return pd.read_csv(
+        csv_path,
+        usecols=list(column_titles),
+        dtype="category",
+        keep_default_na=False,
+        na_values=SPECIFIED_NA_VALUES,
+    )
+
+
+def _get_rows_summary(rows_mask: np.ndarray) -> Dict[str, Any]:
+    """
+    Row numbers are reported as csv-lint and spreadsheet editors number them, i.e. the (single) header row is
+    row 1 and the first data row is row 2.
+    """
+    row_numbers = np.flatnonzero(rows_mask) + 2
+    return {
+        "num_of_rows": len(row_numbers),
+        "row_numbers": [int(i) for i in row_numbers[:MAX_REPORTED_ROW_NUMBERS]],
+    }
+
+
+def _get_titles(table: CsvwTable, column_names: List[str]) -> Optional[List[str]]:
+    """
+    :return: the titles of the named columns, or `None` if any of the columns are not defined.
+    """
+    if any(name not in table.column_titles for name in column_names):
+        return None
+
+    return [table.column_titles[name] for name in column_names]
+
+
+def _get_column_titles(columns: List[dict]) -> Dict[str, str]:
+    column_titles: Dict[str, str] = {}
+    for column in columns:
+        if column.get("virtual", False):
+            continue
+
+        titles = column.get("titles")
+        title = titles[0] if isinstance(titles, list) and len(titles) > 0 else titles
+        name = column.get("name", title)
+        if isinstance(name, str) and isinstance(title, str):
+            column_titles[name] = title
+
+    return column_titles
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+
+    return value if isinstance(value, list) else [value]
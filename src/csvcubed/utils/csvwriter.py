@@ -0,0 +1,152 @@
+"""
+CSV Writer
+----------
+
+Writes dataframes to CSV files using a selectable writer engine.
+
+All engines produce byte-for-byte the same output as :meth:`pandas.DataFrame.to_csv` (with `index=False`).
+"""
+import csv
+import io
+import logging
+import os
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+from csvcubed.utils.csvwriterengine import CsvWriterEngine
+
+_logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 100_000
+_NA_REP = ""
+
+
+def write_csv(
+    data: pd.DataFrame,
+    csv_file_path: Path,
+    engine: CsvWriterEngine = CsvWriterEngine.Pandas,
+) -> None:
+    """
+    Writes the dataframe (without its index) to a CSV file using the given engine.
+
+    Dataframes which the chunked engine can't format identically to pandas are written by pandas instead.
+    """
+    if engine == CsvWriterEngine.Chunked and _can_write_chunked(data):
+        _write_csv_chunked(data, csv_file_path)
+    else:
+        data.to_csv(csv_file_path, index=False)
+
+
+def _can_write_chunked(data: pd.DataFrame) -> bool:
+    if isinstance(data.columns, pd.MultiIndex) or len(data.columns) < 2:
+        # N.B. rows with a single (empty) field are quoted by the csv module; leave those for pandas.
+        return False
+
+    for column_label in data.columns:
+        dtype = data[column_label].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+
+        if not (
+            is_bool_dtype(dtype)
+            or is_float_dtype(dtype)
+            or is_integer_dtype(dtype)
+            or is_object_dtype(dtype)
+            or is_string_dtype(dtype)
+        ):
+            _logger.debug(
+                "Column '%s' has dtype %s which the chunked writer does not support.",
+                column_label,
+                dtype,
+            )
+            return False
+
+    return True
+
+
+def _write_csv_chunked(data: pd.DataFrame, csv_file_path: Path) -> None:
+    _logger.debug("Writing CSV to %s using the chunked writer.", csv_file_path)
+
+    # Matches the file handling and line terminator used by `DataFrame.to_csv`.
+    with open(csv_file_path, "w", encoding="utf-8", newline="") as f:
+        header = _format_values(np.array(list(data.columns), dtype=object))
+        f.write(",".join(header) + os.linesep)
+
+        for start in range(0, len(data.index), _CHUNK_SIZE):
+            chunk = data.iloc[start : start + _CHUNK_SIZE]
+            columns_fields = [
+                _format_column(chunk.iloc[:, column_index])
+                for column_index in range(len(chunk.columns))
+            ]
+            f.write(os.linesep.join(map(",".join, zip(*columns_fields))) + os.linesep)
+
+
+def _format_column(column: pd.Series) -> Sequence[str]:
+    """
+    :return: the CSV field for each of the column's values.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Format each category once, then look the fields up by code (missing values have the code -1).
+        fields = np.array(
+            _format_values(np.asarray(column.cat.categories, dtype=object)) + [_NA_REP],
+            dtype=object,
+        )
+        return fields[column.cat.codes.to_numpy()]
+
+    if is_float_dtype(column.dtype) and isinstance(column.dtype, np.dtype):
+        # pandas formats float columns using numpy's string conversion.
+        values = column.to_numpy()
+        fields = values.astype(str).astype(object)
+        fields[np.isnan(values)] = _NA_REP
+        return fields
+
+    if is_integer_dtype(column.dtype) or is_bool_dtype(column.dtype):
+        # Integers and booleans never need quoting.
+        if column.hasnans:
+            values = column.to_numpy(dtype=object, na_value=_NA_REP)
+        else:
+            values = column.to_numpy()
+        return list(map(str, values.tolist()))
+
+    if pd.api.types.infer_dtype(column, skipna=True) not in ["string", "empty"]:
+        # Values of mixed types may compare equal (e.g. `1 == True`) despite being written differently, so format
+        # each value individually.
+        return _format_values(
+            column.to_numpy(dtype=object, na_value=_NA_REP).astype(object)
+        )
+
+    # String columns; each distinct value is formatted once.
+    codes, uniques = pd.factorize(column)
+    fields = np.array(
+        _format_values(np.asarray(uniques, dtype=object)) + [_NA_REP], dtype=object
+    )
+    return fields[codes]
+
+
+def _format_values(values: np.ndarray) -> List[str]:
+    """
+    Formats each (non-missing) value as a CSV field, quoting it exactly as the csv module (used by pandas) would.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=os.linesep)
+    # Each value is written beside an empty field, since a lone empty field would be quoted.
+    row_suffix_length = len(os.linesep) + 1
+
+    fields: List[str] = []
+    for value in values:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow([value, ""])
+        fields.append(buffer.getvalue()[:-row_suffix_length])
+
+    return fields
@@ -0,0 +1,22 @@
+"""
+CSV Writer Engine
+-----------------
+
+The engines available to write CSV files (see :mod:`~csvcubed.utils.csvwriter`).
+"""
+from enum import Enum
+
+
+class CsvWriterEngine(Enum):
+    """
+    The engines available to write CSV files.
+    """
+
+    Pandas = "pandas"
+    """Writes the CSV using :meth:`pandas.DataFrame.to_csv`."""
+
+    Chunked = "chunked"
+    """
+    Writes the CSV in chunks of rows, formatting each column as a whole. Categorical (and other textual) columns are
+    formatted once per distinct value and then expanded using their codes.
+    """
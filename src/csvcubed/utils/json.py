@@ -6,7 +6,8 @@ Utilities for working with JSON
 """
 import json
 import os.path
-from typing import Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Optional, Union
 from pathlib import Path
 import logging
 from urllib.parse import urlparse
@@ -15,6 +16,16 @@ from .cache import session
 
 _logger = logging.getLogger(__name__)
 
+DEFAULT_PREFETCH_WORKERS = 8
+"""
+The number of remote JSON documents fetched at once by :func:`prefetch_json_documents`.
+"""
+
+_prefetched_json_documents: Dict[str, Dict[str, Any]] = {}
+"""
+Per-process store of the remote JSON documents fetched by :func:`prefetch_json_documents`, keyed by their URL.
+"""
+
 
 def load_json_document(file_uri_or_path: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -35,19 +46,70 @@ def load_json_document(file_uri_or_path: Union[str, Path]) -> Dict[str, Any]:
             return _load_json_from_path(file_path)
         else:
             # Treat it as a URL
-            _logger.debug("Loading JSON from URL %s", file_uri_or_path)
-            http_response = session.get(file_uri_or_path)
-            if not http_response.ok:
-                raise Exception(
-                    f"Error loading JSON from URL '{file_uri_or_path}'. HTTP response: {http_response}."
-                )
-
-            try:
-                return http_response.json()
-            except Exception as e:
-                raise Exception(
-                    f"Error loading JSON from URL '{file_uri_or_path}'"
-                ) from e
+            prefetched_document = get_prefetched_json_document(file_uri_or_path)
+            if prefetched_document is not None:
+                return prefetched_document
+
+            return _load_json_from_url(file_uri_or_path)
+
+
+def prefetch_json_documents(
+    urls: Iterable[str], max_workers: int = DEFAULT_PREFETCH_WORKERS
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches the remote JSON documents concurrently so that subsequent loads of them are served from memory.
+
+    Documents which can't be fetched are skipped; the error is raised when the document is next loaded.
+
+    :return: :obj:`Dict[str, Dict[str, Any]]` - the documents which are available, keyed by their URL.
+    """
+    urls = set(urls)
+    urls_to_fetch = sorted(urls - _prefetched_json_documents.keys())
+    if any(urls_to_fetch):
+        _logger.debug("Prefetching JSON from URLs %s", ", ".join(urls_to_fetch))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="csvcubed-prefetch"
+        ) as executor:
+            for url, document in zip(
+                urls_to_fetch, executor.map(_try_load_json_from_url, urls_to_fetch)
+            ):
+                if document is not None:
+                    _prefetched_json_documents[url] = document
+
+    return {
+        url: _prefetched_json_documents[url]
+        for url in urls
+        if url in _prefetched_json_documents
+    }
+
+
+def get_prefetched_json_document(url: str) -> Optional[Dict[str, Any]]:
+    """
+    :return: :obj:`Optional[Dict[str, Any]]` - the remote JSON document, if it has been prefetched.
+    """
+    return _prefetched_json_documents.get(url)
+
+
+def _load_json_from_url(url: str) -> Dict[str, Any]:
+    _logger.debug("Loading JSON from URL %s", url)
+    http_response = session.get(url)
+    if not http_response.ok:
+        raise Exception(
+            f"Error loading JSON from URL '{url}'. HTTP response: {http_response}."
+        )
+
+    try:
+        return http_response.json()
+    except Exception as e:
+        raise Exception(f"Error loading JSON from URL '{url}'") from e
+
+
+def _try_load_json_from_url(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        return _load_json_from_url(url)
+    except Exception as e:
+        _logger.debug("Unable to prefetch JSON from URL %s: %s", url, e)
+        return None
 
 
 def _load_json_from_path(path: Path) -> Dict[str, Any]:
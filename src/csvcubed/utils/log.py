@@ -2,14 +2,20 @@
 Log
 ---
 Utilities to help with logging.
+
+Records are passed to the console and the log file through a queue so that formatting and writing them happens on a
+background thread rather than slowing down the code doing the logging.
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 import io
 import traceback
 
-from typing import Union
+from dataclasses import dataclass
+from typing import Dict, Union
 from pathlib import Path
 from appdirs import AppDirs
 
@@ -34,17 +40,48 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: bold_red + formatting + reset,
     }
 
+    def __init__(self):
+        super().__init__(self.formatting)
+        self._formatters = {
+            level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self._formatters.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
         return formatter.format(record)
 
 
+@dataclass
+class _LoggingSetup:
+    """
+    The handlers :func:`start_logging` installed on a logger.
+    """
+
+    logger: logging.Logger
+    queue_handler: logging.handlers.QueueHandler
+    queue_listener: logging.handlers.QueueListener
+    log_queue: queue.Queue
+
+
+_logging_setups: Dict[str, _LoggingSetup] = {}
+"""
+The logging installed by :func:`start_logging`, keyed by the name of the logger it's installed on.
+"""
+
+
 def start_logging(
     log_dir_name: str,
     selected_logging_level: Union[str, int, None],
     root_logger_name: str = "csvcubed",
 ) -> None:
+    """
+    Logs to the console and to a log file (rotated weekly) in the user's log directory.
+
+    Calling this again (e.g. when running several commands in one process) replaces the handlers previously
+    installed on the logger rather than adding more of them.
+    """
     logging_level = _get_logging_level(selected_logging_level)
 
     dirs = AppDirs(log_dir_name, "csvcubed")
@@ -69,8 +106,51 @@ def start_logging(
         logging.Formatter(f"%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     )
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    stop_logging(root_logger_name)
+
+    log_queue: queue.Queue = queue.Queue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    queue_listener.start()
+    logger.addHandler(queue_handler)
+
+    if not any(_logging_setups):
+        atexit.register(_stop_all_logging)
+    _logging_setups[root_logger_name] = _LoggingSetup(
+        logger, queue_handler, queue_listener, log_queue
+    )
+
+
+def flush_logging() -> None:
+    """
+    Waits until the records logged so far have been written to the console and the log file.
+    """
+    for logging_setup in _logging_setups.values():
+        logging_setup.log_queue.join()
+
+
+def stop_logging(root_logger_name: str = "csvcubed") -> None:
+    """
+    Writes any records still queued and removes the handlers :func:`start_logging` installed on the logger.
+    """
+    logging_setup = _logging_setups.pop(root_logger_name, None)
+    if logging_setup is None:
+        return
+
+    logging_setup.logger.removeHandler(logging_setup.queue_handler)
+    logging_setup.queue_listener.stop()
+    for handler in logging_setup.queue_listener.handlers:
+        handler.close()
+
+    if not any(_logging_setups):
+        atexit.unregister(_stop_all_logging)
+
+
+def _stop_all_logging() -> None:
+    for root_logger_name in list(_logging_setups):
+        stop_logging(root_logger_name)
 
 
 def _get_logging_level(selected_logging_level: Union[int, str, None]) -> int:
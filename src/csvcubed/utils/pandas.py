@@ -5,15 +5,22 @@ Pandas Utils
 This file provides additional utilities for pandas typoe commands
 """
 import logging
-from typing import List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from pathlib import Path
 
 from csvcubed.models.validationerror import ValidationError
 
-from csvcubed.models.cube.validationerrors import DuplicateColumnTitleError
+from csvcubed.models.cube.validationerrors import (
+    DuplicateColumnTitleError,
+    InconsistentShardColumnsError,
+)
 
 
 _logger = logging.getLogger(__name__)
@@ -24,14 +31,16 @@ SPECIFIED_NA_VALUES = {
 }
 
 
-def read_csv(csv_path: Path, keep_default_na=False, na_values=SPECIFIED_NA_VALUES, dtype=None) -> Tuple[pd.DataFrame, List[ValidationError]]:
+def read_csv(csv_path: Path, keep_default_na=False, na_values=SPECIFIED_NA_VALUES, dtype=None, usecols=None, nrows=None) -> Tuple[pd.DataFrame, List[ValidationError]]:
     """
+    :param usecols: optionally, the titles of the only columns which should be loaded.
+    :param nrows: optionally, the number of rows (from the start of the file) which should be loaded.
     :returns: a tuple of
         pd.DataFrame without the default na values being changes into NaN
         list of ValidationExceptions
     """
 
-    df = pd.read_csv(csv_path, keep_default_na=keep_default_na, na_values=na_values, dtype=dtype)
+    df = pd.read_csv(csv_path, keep_default_na=keep_default_na, na_values=na_values, dtype=dtype, usecols=usecols, nrows=nrows)
     if not isinstance(df, pd.DataFrame):
         _logger.debug(
             "Expected a pandas dataframe when reading from CSV, value was %s", df
@@ -48,3 +57,112 @@ def read_csv(csv_path: Path, keep_default_na=False, na_values=SPECIFIED_NA_VALUE
         DuplicateColumnTitleError(csv_column_title=dupe_title)
         for dupe_title in duplicate_titles
     ]
+
+
+def read_csv_shards(
+    csv_paths: List[Path],
+    keep_default_na=False,
+    na_values=SPECIFIED_NA_VALUES,
+    dtype: Optional[Dict[str, str]] = None,
+    usecols: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, List[ValidationError]]:
+    """
+    Reads, in parallel, the CSV shards which together hold a single table's data into one dataframe.
+
+    Every shard is read with the same dtypes. Columns holding strings are read as categoricals so that each shard's
+    values are parsed once; the shards' categories are then unioned without the values being converted back into
+    strings.
+
+    :param usecols: optionally, the titles of the only columns which should be loaded.
+    :returns: a tuple of
+        pd.DataFrame holding the rows of each of the shards (in the order the shards were given)
+        list of ValidationExceptions
+    """
+    shard_dtype = (
+        None
+        if dtype is None
+        else {
+            column_title: "category" if column_dtype == "string" else column_dtype
+            for column_title, column_dtype in dtype.items()
+        }
+    )
+
+    def _read_shard(csv_path: Path) -> Tuple[pd.DataFrame, List[ValidationError]]:
+        _logger.debug("Reading CSV shard %s", csv_path)
+        return read_csv(
+            csv_path,
+            keep_default_na=keep_default_na,
+            na_values=na_values,
+            dtype=shard_dtype,
+            usecols=usecols,
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(csv_paths), os.cpu_count() or 1)
+    ) as executor:
+        shards_and_errors = list(executor.map(_read_shard, csv_paths))
+
+    column_titles = list(shards_and_errors[0][0].columns)
+    shards: List[pd.DataFrame] = []
+    errors: List[ValidationError] = []
+    for csv_path, (shard, shard_errors) in zip(csv_paths, shards_and_errors):
+        # Each shard repeats the header row, so only report its errors once.
+        errors += [error for error in shard_errors if error not in errors]
+
+        shard_column_titles = list(shard.columns)
+        if shard_column_titles != column_titles:
+            errors.append(
+                InconsistentShardColumnsError(
+                    csv_path=str(csv_path),
+                    expected_column_titles=column_titles,
+                    actual_column_titles=shard_column_titles,
+                )
+            )
+            shard = shard.reindex(columns=column_titles)
+
+        shards.append(shard)
+
+    data = pd.concat(
+        [
+            _concat_shard_columns([shard.iloc[:, i] for shard in shards])
+            for i in range(len(column_titles))
+        ],
+        axis=1,
+    )
+
+    return data, errors
+
+
+def _concat_shard_columns(columns: List[pd.Series]) -> pd.Series:
+    if all(isinstance(column.dtype, pd.CategoricalDtype) for column in columns):
+        return pd.Series(
+            union_categoricals([column.array for column in columns], ignore_order=True),
+            name=columns[0].name,
+        )
+
+    return pd.concat(columns, ignore_index=True)
+
+
+def get_duplicate_rows_mask(data: pd.DataFrame) -> np.ndarray:
+    """
+    Identifies every row whose values are shared with another row.
+
+    Each row's categorical codes are combined into a single integer key which is unique to the combination of values
+    in the row. Where there are too many categories for the key to fit into 64 bits, rows are hashed instead.
+
+    :returns: boolean mask of the duplicated rows.
+    """
+    row_keys = np.zeros(len(data.index), dtype=np.int64)
+    key_range = 1
+    for column_label in data.columns:
+        column = data[column_label].astype("category")
+        # Missing values have the code -1, so shift the codes to be non-negative.
+        num_of_codes = len(column.cat.categories) + 1
+        if key_range * num_of_codes >= np.iinfo(np.int64).max:
+            row_keys = pd.util.hash_pandas_object(data, index=False).to_numpy()
+            break
+
+        row_keys += (column.cat.codes.to_numpy().astype(np.int64) + 1) * key_range
+        key_range *= num_of_codes
+
+    return pd.Series(row_keys).duplicated(keep=False).to_numpy()
@@ -1,6 +1,7 @@
+import json
 from os import linesep
 from pandas import DataFrame
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from csvcubed.models.csvcubedexception import FailedToConvertDataFrameToStringException
 
@@ -73,3 +74,14 @@ def get_printable_tabuler_str_from_dataframe(df: DataFrame, column_names=None) -
     if output_str:
         return output_str
     raise FailedToConvertDataFrameToStringException()
+
+
+def get_records_from_dataframe(df: DataFrame) -> List[Dict[str, Any]]:
+    """
+    Converts the given dataframe into a list of JSON-serialisable records (one per row).
+
+    Member of :file:`./utils/printable`.
+
+    :return: `List[Dict[str, Any]]` - the rows of the dataframe, with missing values as `None`.
+    """
+    return json.loads(df.to_json(orient="records"))
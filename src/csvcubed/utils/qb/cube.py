@@ -36,16 +36,10 @@ def get_columns_of_dsd_type(
 
     :return: The :class:`QbColumn <csvcubed.models.cube.qb.columns.QbColumn>` s in :obj:`cube` which have
         :attr:`components` of the requested type :obj:`t`.
-    """
-    columns_of_type = [
-        c
-        for c in cube.columns
-        if isinstance(c, QbColumn) and isinstance(c.structural_definition, t)
-    ]
-
-    _logger.debug("Found columns of type %s: %s", t, columns_of_type)
 
-    return columns_of_type
+    Reads from the cube's index of columns by type, see :meth:`Cube.get_columns_of_dsd_type`.
+    """
+    return cube.get_columns_of_dsd_type(t)
 
 
 def get_all_measures(cube: Cube) -> Set[QbMeasure]:
@@ -6,7 +6,9 @@ Utilities for standardising cubes and their corresponding data values.
 """
 from typing import List, Dict
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_signed_integer_dtype, is_unsigned_integer_dtype
 from pandas.core.arrays.categorical import Categorical
 
 from .cube import get_all_units, get_all_measures, get_columns_of_dsd_type
@@ -33,6 +35,9 @@ _unsigned_integer_data_types = {
     "nonNegativeInteger",
     "positiveInteger",
 }
+_csvw_boolean_values = ["false", "true"]
+"""The CSV-W representations of `False` and `True` (in that order); n.b. `True != true` and `False != false`."""
+
 _signed_integer_data_types = {
     "integer",
     "long",
@@ -57,6 +62,8 @@ def ensure_qbcube_data_is_categorical(cube: QbCube) -> None:
                 (QbDimension, QbAttribute, QbMultiMeasureDimension, QbMultiUnits),
             )
             and not isinstance(column.structural_definition, QbAttributeLiteral)
+            # The column may be missing from the data when the cube has not yet been validated.
+            and column.csv_column_title in cube.data.columns
         )
 
         if is_categorical_column:
@@ -78,10 +85,18 @@ def ensure_int_columns_are_ints(cube: QbCube) -> None:
     def _coerce_to_int_values_if_int(column_title: str, data_type: str):
         assert cube.data is not None
         try:
+            # Columns which already hold integers are left as they are, avoiding a copy of the column.
+            column_data = cube.data[column_title]
             if data_type in _signed_integer_data_types:
-                cube.data[column_title] = cube.data[column_title].astype(pd.Int64Dtype())
+                if not is_signed_integer_dtype(column_data.dtype):
+                    cube.data[column_title] = column_data.astype(
+                        pd.Int64Dtype(), copy=False
+                    )
             elif data_type in _unsigned_integer_data_types:
-                cube.data[column_title] = cube.data[column_title].astype(pd.UInt64Dtype())
+                if not is_unsigned_integer_dtype(column_data.dtype):
+                    cube.data[column_title] = column_data.astype(
+                        pd.UInt64Dtype(), copy=False
+                    )
         except Exception as err:
             raise Exception(f'Column {column_title} failing,csvw  data type was {data_type}, pandas data type was {cube.data[column_title].dtype}') from err
 
@@ -98,6 +113,32 @@ def ensure_int_columns_are_ints(cube: QbCube) -> None:
         )
 
 
+def ensure_bool_columns_are_csvw_booleans(cube: QbCube) -> None:
+    """
+    Given a :obj:`~csvcubed.models.cube.qb.QbCube`, bring the pandas representation of booleans inline with what the
+     CSV-W spec requires, i.e. `true` and `false`. Does the change in-place.
+
+    Each boolean column is replaced by a categorical whose codes are the column's (0/1) values, so no per-value
+     conversion takes place.
+    """
+    if cube.data is None:
+        return
+
+    for column_label in cube.data.columns:
+        column_data = cube.data[column_label]
+        if column_data.dtype == "bool":
+            codes = column_data.to_numpy().astype(np.int8)
+        elif column_data.dtype == "boolean":
+            # Missing values are given the code -1.
+            codes = column_data.to_numpy(dtype=np.int8, na_value=-1)
+        else:
+            continue
+
+        cube.data[column_label] = pd.Categorical.from_codes(
+            codes, categories=_csvw_boolean_values
+        )
+
+
 def convert_data_values_to_uri_safe_values(
     cube: QbCube, raise_missing_value_exceptions: bool = True
 ) -> None:
@@ -213,4 +254,8 @@ def _overwrite_labels_for_columns(
             else:
                 new_category_labels.append(new_category_label)
 
-        column_values.categories = new_category_labels
+        # Replace the column rather than renaming its categories in-place; the categorical may be shared with other
+        # dataframes (e.g. where `cube.data` is a shallow copy).
+        cube.data[column.csv_column_title] = column_values.rename_categories(
+            new_category_labels
+        )
@@ -1,7 +1,11 @@
-from typing import List
+from typing import Dict, List
+
+import pandas as pd
 
 from csvcubed.models.cube import (
     ObservationValuesMissing,
+    DuplicateObservationsError,
+    QbDimension,
     QbMultiUnits,
     QbObservationValue,
     Cube,
@@ -29,10 +33,13 @@ from csvcubed.models.cube.qb.validationerrors import CsvColumnUriTemplateMissing
 from csvcubedmodels.rdf.namespaces import SDMX_Attribute
 
 from csvcubed.models.validationerror import ValidationError
+from csvcubed.utils.pandas import get_duplicate_rows_mask
 from csvcubed.utils.qb.cube import get_columns_of_dsd_type
 
 SDMX_A_OBS_STATUS_URI: str = str(SDMX_Attribute.obsStatus)
 
+_MAX_REPORTED_DUPLICATE_KEYS = 10
+
 
 def validate_observations(cube: Cube) -> List[ValidationError]:
     errors: List[ValidationError] = []
@@ -65,9 +72,57 @@ def validate_observations(cube: Cube) -> List[ValidationError]:
 
         errors += _validate_missing_observation_values(cube, observed_value_columns[0])
 
+    errors += _validate_duplicate_observations(cube)
+
     return errors
 
 
+def _validate_duplicate_observations(cube: Cube) -> List[ValidationError]:
+    """
+    Check that no two observations share the same combination of dimension (and measure) values. These columns form
+    the CSV-W's primary key so must uniquely identify each observation.
+    """
+    if cube.data is None:
+        return []
+
+    key_column_titles = [
+        c.csv_column_title
+        for c in get_columns_of_dsd_type(cube, QbDimension)
+        + get_columns_of_dsd_type(cube, QbMultiMeasureDimension)
+        if c.csv_column_title in cube.data.columns
+    ]
+    if len(key_column_titles) == 0:
+        return []
+
+    # Rows are identified by their position; the data's index may hold any labels (e.g. when built from a dataframe).
+    key_data = cube.data[key_column_titles].reset_index(drop=True)
+    duplicated_rows_mask = get_duplicate_rows_mask(key_data)
+    if not duplicated_rows_mask.any():
+        return []
+
+    duplicate_key_groups = (
+        key_data[duplicated_rows_mask]
+        .groupby(key_column_titles, sort=False, dropna=False, observed=True)
+        .groups
+    )
+
+    duplicate_key_row_numbers: Dict[str, List[int]] = {}
+    for key, row_numbers in duplicate_key_groups.items():
+        if len(duplicate_key_row_numbers) >= _MAX_REPORTED_DUPLICATE_KEYS:
+            break
+        key_values = key if isinstance(key, tuple) else (key,)
+        key_str = ", ".join(["" if pd.isna(v) else f"'{v}'" for v in key_values])
+        duplicate_key_row_numbers[key_str] = [int(i) for i in row_numbers]
+
+    return [
+        DuplicateObservationsError(
+            csv_column_titles=key_column_titles,
+            num_of_duplicate_keys=len(duplicate_key_groups),
+            duplicate_key_row_numbers=duplicate_key_row_numbers,
+        )
+    ]
+
+
 def _validate_missing_observation_values(
     cube: Cube, observed_value_column: QbColumn[QbObservationValue]
 ) -> List[ValidationError]:
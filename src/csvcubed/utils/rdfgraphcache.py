@@ -0,0 +1,219 @@
+"""
+RDF Graph Cache
+---------------
+
+Caches the RDF graph parsed from a CSV-W metadata file on disk (as N-Quads), beside the metadata file.
+
+The cache records a hash of the content of every local file loaded into the graph (the metadata file, its table
+schemas and its RDF dependencies), so an unchanged CSV-W is loaded without re-parsing its JSON-LD. Remote
+dependencies are assumed not to change.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import rdflib
+from rdflib.exceptions import ParserError
+from rdflib.term import Node
+
+from csvcubed import __version__
+from csvcubed.utils.sparql_handler.sparql import path_to_file_uri_for_rdflib
+from csvcubed.utils.sparql_handler.store import (
+    RdfStoreBackend,
+    create_conjunctive_graph,
+)
+from csvcubed.utils.uri import looks_like_uri
+
+_logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_CACHE_HEADER_PREFIX = "# csvcubed-graph-cache "
+
+_RELATIVE_URI_PREFIX = "csvcubed-relative:"
+"""
+The graph retains relative URIs, which N-Quads can't represent; they are stored with this prefix.
+"""
+
+
+def get_graph_cache_path(csvw_metadata_json_path: Path) -> Path:
+    """
+    Returns the path of the (hidden) file holding the cached RDF graph for the given metadata file.
+
+    Member of :file:`./rdfgraphcache.py`
+
+    :return: `Path`
+    """
+    return (
+        csvw_metadata_json_path.parent
+        / f".{csvw_metadata_json_path.name}.graph-cache.nq"
+    )
+
+
+def read_cached_graph(
+    csvw_metadata_json_path: Path,
+    rdf_store_backend: RdfStoreBackend = RdfStoreBackend.Rdflib,
+) -> Optional[rdflib.ConjunctiveGraph]:
+    """
+    Returns the cached RDF graph for the metadata file, loaded into the given store, if none of the files it was
+    loaded from have changed.
+
+    Member of :file:`./rdfgraphcache.py`
+
+    :return: `Optional[rdflib.ConjunctiveGraph]` - `None` where there is no (valid) cached graph.
+    """
+    cache_path = get_graph_cache_path(csvw_metadata_json_path)
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "r") as f:
+            header = f.readline()
+        if not _is_cache_header_current(header, csvw_metadata_json_path):
+            _logger.debug("RDF graph cache %s is stale.", cache_path)
+            return None
+
+        cached_graph = rdflib.ConjunctiveGraph()
+        cached_graph.parse(str(cache_path), format="nquads")
+    except (OSError, ValueError, ParserError) as ex:
+        _logger.warning("Ignoring unreadable RDF graph cache %s: %s", cache_path, ex)
+        return None
+
+    graph = create_conjunctive_graph(rdf_store_backend)
+    graph.addN(
+        (
+            _from_cached_term(s),
+            _from_cached_term(p),
+            _from_cached_term(o),
+            graph.get_context(context.identifier),
+        )
+        for s, p, o, context in cached_graph.quads((None, None, None))
+    )
+
+    _logger.info("Loaded RDF graph from cache %s", cache_path)
+    return graph
+
+
+def write_cached_graph(
+    csvw_metadata_json_path: Path, graph: rdflib.ConjunctiveGraph
+) -> None:
+    """
+    Stores the RDF graph (along with the hashes of the files it was loaded from) beside the metadata file. Failing
+    to write the cache is not an error.
+
+    Member of :file:`./rdfgraphcache.py`
+    """
+    cache_path = get_graph_cache_path(csvw_metadata_json_path)
+    temp_cache_path = cache_path.with_name(cache_path.name + ".tmp")
+
+    cache_graph = rdflib.ConjunctiveGraph()
+    cache_graph.addN(
+        (
+            _to_cached_term(s),
+            _to_cached_term(p),
+            _to_cached_term(o),
+            cache_graph.get_context(context.identifier),
+        )
+        for s, p, o, context in graph.quads((None, None, None))
+    )
+
+    try:
+        header = {
+            "csvcubed_version": __version__,
+            "metadata_file": path_to_file_uri_for_rdflib(csvw_metadata_json_path),
+            "dependencies": _get_dependency_hashes(
+                str(context.identifier) for context in graph.contexts()
+            ),
+        }
+        with open(temp_cache_path, "w") as f:
+            f.write(_CACHE_HEADER_PREFIX + json.dumps(header) + "\n")
+        with open(temp_cache_path, "ab") as f:
+            cache_graph.serialize(f, format="nquads")
+        os.replace(temp_cache_path, cache_path)
+        _logger.debug("Written RDF graph cache to %s", cache_path)
+    except OSError as ex:
+        _logger.warning("Unable to write RDF graph cache %s: %s", cache_path, ex)
+
+
+def _is_cache_header_current(header_line: str, csvw_metadata_json_path: Path) -> bool:
+    if not header_line.startswith(_CACHE_HEADER_PREFIX):
+        return False
+
+    header = json.loads(header_line[len(_CACHE_HEADER_PREFIX) :])
+    if not isinstance(header, dict):
+        return False
+
+    if header.get("csvcubed_version") != __version__ or header.get(
+        "metadata_file"
+    ) != path_to_file_uri_for_rdflib(csvw_metadata_json_path):
+        return False
+
+    dependencies = header.get("dependencies")
+    if not isinstance(dependencies, dict):
+        return False
+
+    return _get_dependency_hashes(dependencies.keys()) == dependencies
+
+
+def _get_dependency_hashes(
+    dependency_uris: Iterable[str],
+) -> Dict[str, Optional[str]]:
+    """
+    Returns the hash of the content of each local (`file://`) dependency. Remote dependencies have no hash.
+
+    Local files which no longer exist are given the hash `missing` so that they never match a cached hash.
+    """
+    dependency_hashes: Dict[str, Optional[str]] = {}
+    for dependency_uri in dependency_uris:
+        file_path = _file_uri_to_path(dependency_uri)
+        if file_path is None:
+            dependency_hashes[dependency_uri] = None
+        elif not file_path.is_file():
+            dependency_hashes[dependency_uri] = "missing"
+        else:
+            dependency_hashes[dependency_uri] = _get_file_content_hash(file_path)
+
+    return dependency_hashes
+
+
+def _get_file_content_hash(file_path: Path) -> str:
+    content_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            content_hash.update(chunk)
+
+    return content_hash.hexdigest()
+
+
+def _file_uri_to_path(uri: str) -> Optional[Path]:
+    """
+    Inverse of :func:`~csvcubed.utils.sparql_handler.sparql.path_to_file_uri_for_rdflib`.
+    """
+    if not uri.startswith("file://"):
+        return None
+
+    path = uri[len("file://") :]
+    if re.match("^/[a-zA-Z]:", path):
+        # Windows paths, e.g. file:///C:/...
+        path = path[1:]
+
+    return Path(path)
+
+
+def _to_cached_term(term: Node) -> Node:
+    if isinstance(term, rdflib.URIRef) and not looks_like_uri(str(term)):
+        return rdflib.URIRef(_RELATIVE_URI_PREFIX + str(term))
+
+    return term
+
+
+def _from_cached_term(term: Node) -> Node:
+    if isinstance(term, rdflib.URIRef) and str(term).startswith(_RELATIVE_URI_PREFIX):
+        return rdflib.URIRef(str(term)[len(_RELATIVE_URI_PREFIX) :])
+
+    return term
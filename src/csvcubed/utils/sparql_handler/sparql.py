@@ -5,16 +5,18 @@ SPARQL
 Utilities to help when running SPARQL queries.
 """
 from pathlib import Path, PosixPath
-from typing import List, Optional, Any, Callable
+from typing import List, Mapping, Optional, Any, Callable
 import os.path
 
 from rdflib import Graph, Literal
 from rdflib.query import ResultRow
+from rdflib.term import Identifier
 
 from csvcubed.models.csvcubedexception import (
     UnexpectedSparqlAskQueryResponseTypeException,
     UnexpectedSparqlAskQueryResultsException,
 )
+from csvcubed.utils.sparql_handler.store import bind_query_variables
 
 
 def none_or_map(val: Optional[Any], map_func: Callable[[Any], Any]) -> Optional[Any]:
@@ -46,9 +48,13 @@ def ask(query_name: str, query: str, graph: Graph) -> bool:
         raise UnexpectedSparqlAskQueryResultsException(query_name, len(results))
 
 
-def select(query: str, graph: Graph, init_bindings=None) -> List[ResultRow]:
+def select(
+    query: str,
+    graph: Graph,
+    init_bindings: Optional[Mapping[str, Identifier]] = None,
+) -> List[ResultRow]:
     """
-    Executes the given SELECT query on the rdf graph.
+    Executes the given SELECT query on the rdf graph, replacing the variables in `init_bindings` with their values.
 
     Member of :file:`./sparql.py`.
 
@@ -57,7 +63,7 @@ def select(query: str, graph: Graph, init_bindings=None) -> List[ResultRow]:
     """
     results: List[ResultRow] = [
         result
-        for result in graph.query(query, initBindings=init_bindings)
+        for result in graph.query(bind_query_variables(query, init_bindings))
         if isinstance(result, ResultRow)
         and isinstance(result.labels, dict)
         and any(
@@ -25,6 +25,7 @@ from csvcubed.models.sparqlresults import (
     DatasetURLResult,
     QubeComponentsResult,
     MetadataDependenciesResult,
+    TableColumnDataTypesResult,
     TableSchemaPropertiesResult,
     map_catalog_metadata_result,
     map_codelist_cols_by_dataset_url_result,
@@ -33,9 +34,11 @@ from csvcubed.models.sparqlresults import (
     map_csvw_table_schemas_file_dependencies_result,
     map_dataset_label_dsd_uri_sparql_result,
     map_dataset_url_result,
+    map_dataset_urls_result,
     map_qube_components_sparql_result,
     map_single_unit_from_dsd_result,
     map_metadata_dependency_results,
+    map_table_column_datatypes_result,
     map_table_schema_properties_result,
 )
 from csvcubed.utils.sparql_handler.sparql import ask, select
@@ -64,6 +67,8 @@ class SPARQLQueryName(Enum):
 
     SELECT_DSD_QUBE_COMPONENTS = "select_dsd_qube_components"
 
+    SELECT_CSVW_COLUMNS_WITH_PROPERTY_URLS = "select_csvw_columns_with_property_urls"
+
     SELECT_COLS_W_SUPPRESS_OUTPUT = "select_cols_w_suppress_output"
 
     SELECT_CODELISTS_AND_COLS = "select_codelists_and_cols"
@@ -84,6 +89,8 @@ class SPARQLQueryName(Enum):
 
     SELECT_TABLE_SCHEMA_PROPERTIES = "select_table_schema_properties"
 
+    SELECT_TABLE_COLUMN_DATATYPES = "select_table_column_datatypes"
+
 
 def _get_query_string_from_file(queryType: SPARQLQueryName) -> str:
     """
@@ -203,12 +210,20 @@ def select_csvw_dsd_qube_components(
 
     :return: `QubeComponentsResult`
     """
-    results: List[ResultRow] = select(
+    component_results: List[ResultRow] = select(
         _get_query_string_from_file(SPARQLQueryName.SELECT_DSD_QUBE_COMPONENTS),
         rdf_graph,
         init_bindings={"dsd_uri": URIRef(dsd_uri)},
     )
-    return map_qube_components_sparql_result(results, json_path)
+    column_results: List[ResultRow] = select(
+        _get_query_string_from_file(
+            SPARQLQueryName.SELECT_CSVW_COLUMNS_WITH_PROPERTY_URLS
+        ),
+        rdf_graph,
+    )
+    return map_qube_components_sparql_result(
+        component_results, column_results, json_path
+    )
 
 
 def select_cols_where_suppress_output_is_true(
@@ -270,7 +285,7 @@ def select_qb_dataset_url(
     rdf_graph: rdflib.ConjunctiveGraph, dataset_uri: str
 ) -> DatasetURLResult:
     """
-    Queries the url of the given qb:dataset.
+    Queries the url(s) of the table(s) holding the given qb:dataset's observations.
 
     Member of :file:`./sparqlmanager.py`
 
@@ -286,13 +301,14 @@ def select_qb_dataset_url(
         rdf_graph,
         init_bindings={"dataset_uri": Literal(dataset_uri)},
     )
-    if len(results) != 1:
+    # N.B. there is one result for each CSV where the observations are partitioned across several.
+    if len(results) == 0:
         raise InvalidNumberOfRecordsException(
             record_description=f"result for the {SPARQLQueryName.SELECT_QB_DATASET_URL.value} sparql query",
             excepted_num_of_records=1,
             num_of_records=len(results),
         )
-    return map_dataset_url_result(results[0])
+    return map_dataset_urls_result(results)
 
 
 def select_codelist_dataset_url(rdf_graph: rdflib.ConjunctiveGraph) -> DatasetURLResult:
@@ -401,3 +417,22 @@ def select_table_schema_properties(
         )
 
     return map_table_schema_properties_result(results[0])
+
+
+def select_table_column_datatypes(
+    rdf_graph: rdflib.ConjunctiveGraph, table_url: str
+) -> TableColumnDataTypesResult:
+    """
+    Queries the titles and datatypes of the (non-virtual) columns of the table with the given table url.
+
+    Member of :file:`./sparqlmanager.py`
+
+    :return: `TableColumnDataTypesResult`
+    """
+    results: List[ResultRow] = select(
+        _get_query_string_from_file(SPARQLQueryName.SELECT_TABLE_COLUMN_DATATYPES),
+        rdf_graph,
+        init_bindings={"table_url": Literal(table_url)},
+    )
+
+    return map_table_column_datatypes_result(results)
@@ -0,0 +1,96 @@
+"""
+RDF Store
+---------
+
+Selects the store which RDF graphs are loaded into (and which SPARQL queries are executed against).
+
+Every backend is exposed as an `rdflib.ConjunctiveGraph` so that the same parsing code and the queries in
+`sparql_queries/` run unchanged whichever backend is selected.
+
+Backends don't agree on the meaning of `initBindings` (oxrdflib joins them onto the end of the query, so they're
+invisible to the `BIND`s, `FILTER`s and sub-queries which use them), so bound values are substituted into the query
+text instead (see :func:`bind_query_variables`).
+"""
+import logging
+import re
+from typing import Mapping, Optional
+
+import rdflib
+from rdflib.term import Identifier
+
+from csvcubed.models.csvcubedexception import RdfStoreBackendUnavailableException
+from csvcubed.utils.sparql_handler.storebackend import RdfStoreBackend
+
+_logger = logging.getLogger(__name__)
+
+
+_rdflib_store_plugin_names = {
+    RdfStoreBackend.Rdflib: "default",
+    RdfStoreBackend.Oxigraph: "Oxigraph",
+}
+
+_required_packages = {
+    RdfStoreBackend.Oxigraph: "oxrdflib",
+}
+
+
+def is_rdf_store_backend_available(backend: RdfStoreBackend) -> bool:
+    """
+    Member of :file:`./store.py`
+
+    :return: `bool` - whether the packages the backend requires are installed (and can be imported).
+    """
+    required_package = _required_packages.get(backend)
+    if required_package is None:
+        return True
+
+    try:
+        __import__(required_package)
+        return True
+    except ImportError as ex:
+        # N.B. an installed package can also fail to import, e.g. oxrdflib 0.3.3+ with rdflib < 6.2.
+        _logger.debug("Unable to import %s: %s", required_package, ex)
+        return False
+
+
+def bind_query_variables(
+    query: str, bindings: Optional[Mapping[str, Identifier]]
+) -> str:
+    """
+    Replaces each of the bound variables in the SPARQL query with its value, giving the same results as passing
+    them as rdflib's `initBindings` on every backend.
+
+    N.B. bound variables must only be used as terms in the query's patterns and expressions, i.e. they must not be
+    projected by a `SELECT`.
+
+    Member of :file:`./store.py`
+
+    :return: `str` - the query with the bound variables replaced.
+    """
+    for variable_name, value in (bindings or {}).items():
+        query = re.sub(
+            rf"[?$]{re.escape(variable_name)}(?!\w)",
+            lambda _: value.n3(),
+            query,
+        )
+
+    return query
+
+
+def create_conjunctive_graph(
+    backend: RdfStoreBackend = RdfStoreBackend.Rdflib,
+) -> rdflib.ConjunctiveGraph:
+    """
+    Creates an empty `rdflib.ConjunctiveGraph` backed by the given store.
+
+    Member of :file:`./store.py`
+
+    :return: `rdflib.ConjunctiveGraph`
+    """
+    if not is_rdf_store_backend_available(backend):
+        raise RdfStoreBackendUnavailableException(
+            backend.value, _required_packages[backend]
+        )
+
+    _logger.debug("Creating RDF graph using the %s store.", backend.value)
+    return rdflib.ConjunctiveGraph(store=_rdflib_store_plugin_names[backend])
@@ -0,0 +1,22 @@
+"""
+RDF Store Backend
+-----------------
+
+The stores which RDF graphs can be loaded into (see :mod:`~csvcubed.utils.sparql_handler.store`).
+"""
+from enum import Enum
+
+
+class RdfStoreBackend(Enum):
+    """
+    The stores which RDF graphs can be loaded into.
+    """
+
+    Rdflib = "rdflib"
+    """rdflib's in-memory store, queried with rdflib's (pure python) SPARQL engine."""
+
+    Oxigraph = "oxigraph"
+    """
+    The embedded (native) Oxigraph store, which evaluates SPARQL queries itself. Requires the optional `oxrdflib`
+    package (e.g. `pip install csvcubed[oxigraph]`).
+    """
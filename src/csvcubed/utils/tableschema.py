@@ -15,6 +15,7 @@ from rdflib.util import guess_format
 
 from csvcubed.utils.csvw import load_table_schema_file_to_graph
 from csvcubed.utils.rdf import parse_graph_retain_relative
+from csvcubed.utils.rdfgraphcache import read_cached_graph, write_cached_graph
 from csvcubed.utils.uri import looks_like_uri
 from csvcubed.utils.sparql_handler.sparqlmanager import (
     select_csvw_table_schema_file_dependencies,
@@ -27,6 +28,10 @@ from csvcubed.models.csvcubedexception import (
     InvalidCsvwFileContentException,
 )
 from csvcubed.utils.sparql_handler.sparql import path_to_file_uri_for_rdflib
+from csvcubed.utils.sparql_handler.store import (
+    RdfStoreBackend,
+    create_conjunctive_graph,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -35,13 +40,31 @@ _logger = logging.getLogger(__name__)
 class CsvwRdfManager:
     """
     This class handles the loading of metadata jsons to RDFLib Graphs.
+
+    The graph is loaded into the store selected by `rdf_store_backend`; rdflib's in-memory store by default.
+
+    When `use_graph_cache` is set, the parsed graph is cached beside the metadata file and reused until the metadata
+    file or any of its dependencies change.
     """
 
     csvw_metadata_file_path: Path
+    rdf_store_backend: RdfStoreBackend = RdfStoreBackend.Rdflib
+    use_graph_cache: bool = False
     rdf_graph: rdflib.ConjunctiveGraph = field(init=False)
 
     def __post_init__(self):
+        cached_rdf_graph = (
+            read_cached_graph(self.csvw_metadata_file_path, self.rdf_store_backend)
+            if self.use_graph_cache
+            else None
+        )
+        if cached_rdf_graph is not None:
+            self.rdf_graph = cached_rdf_graph
+            return
+
         self.rdf_graph = self._load_json_ld_to_rdflib_graph()
+        if self.use_graph_cache and self.rdf_graph is not None:
+            write_cached_graph(self.csvw_metadata_file_path, self.rdf_graph)
 
         if self.rdf_graph is None:
             raise FailedToLoadRDFGraphException(self.csvw_metadata_file_path)
@@ -96,7 +119,7 @@ class CsvwRdfManager:
 
         :return: `Graph` - RDFLib Graph of CSV-W metadata json.
         """
-        csvw_metadata_rdf_graph = rdflib.ConjunctiveGraph()
+        csvw_metadata_rdf_graph = create_conjunctive_graph(self.rdf_store_backend)
         csvw_file_content: str
         csvw_metadata_file_path = self.csvw_metadata_file_path.absolute()
 
@@ -0,0 +1,75 @@
+"""
+Task Graph
+----------
+
+Runs a set of interdependent tasks on a thread pool, starting each task as soon as the tasks it depends on have
+finished.
+"""
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Task:
+    """
+    A unit of work along with the names of the tasks which must finish before it can start.
+    """
+
+    func: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+
+
+def run_task_graph(
+    tasks: Dict[str, Task], max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Runs each of the tasks once all of the tasks it depends on have finished.
+
+    If a task raises an exception, no further tasks are started; the exception is re-raised once the tasks already
+    running have finished.
+
+    Member of :file:`./taskgraph.py`
+
+    :return: `Dict[str, Any]` - the value returned by each task, keyed by the task's name.
+    """
+    unknown_dependencies = {
+        dependency
+        for task in tasks.values()
+        for dependency in task.depends_on
+        if dependency not in tasks
+    }
+    if any(unknown_dependencies):
+        raise ValueError(
+            f"Unknown task dependencies: {', '.join(sorted(unknown_dependencies))}"
+        )
+
+    results: Dict[str, Any] = {}
+    pending_tasks = dict(tasks)
+    running_tasks: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while any(pending_tasks) or any(running_tasks):
+            ready_task_names = [
+                name
+                for name, task in pending_tasks.items()
+                if all(dependency in results for dependency in task.depends_on)
+            ]
+            for name in ready_task_names:
+                _logger.debug("Starting task %s", name)
+                running_tasks[executor.submit(pending_tasks.pop(name).func)] = name
+
+            if not any(running_tasks):
+                raise ValueError(
+                    f"Tasks have cyclic dependencies: {', '.join(sorted(pending_tasks))}"
+                )
+
+            finished_tasks, _ = wait(running_tasks, return_when=FIRST_COMPLETED)
+            for future in finished_tasks:
+                name = running_tasks.pop(future)
+                results[name] = future.result()
+                _logger.debug("Finished task %s", name)
+
+    return results
@@ -6,6 +6,7 @@ Functions to help when working with URIs.
 """
 import logging
 import re
+from functools import lru_cache
 from unidecode import unidecode
 from urllib.parse import urlparse
 import rdflib
@@ -16,7 +17,14 @@ _logger = logging.getLogger(__name__)
 _multiple_non_word_chars_regex = re.compile(r"[^\w]+")
 _last_uri_part_regex = re.compile(".*/(.*?)$")
 
+_SAFE_VALUE_CACHE_SIZE = 2**16
+"""
+The number of labels whose URI-safe (and CSV-W column name safe) equivalents are remembered. These functions are
+called for every value written, so the same labels are converted many times over.
+"""
+
 
+@lru_cache(maxsize=_SAFE_VALUE_CACHE_SIZE)
 def uri_safe(label: str) -> str:
     """
     Convert a label into something that can be used in a URI path segment.
@@ -32,6 +40,7 @@ def uri_safe(label: str) -> str:
     return uri_safe_value
 
 
+@lru_cache(maxsize=_SAFE_VALUE_CACHE_SIZE)
 def csvw_column_name_safe(label: str) -> str:
     """
     Converts a generic string into a string which is safe as the :attr:`name` property in a CSV-W column.
@@ -1,19 +1,43 @@
 import logging
+from typing import Any, Dict, Union
 
 import jsonschema
 from jsonschema.exceptions import ValidationError, SchemaError
 
+from csvcubed.utils.cache import session
+from csvcubed.utils.json import get_prefetched_json_document
+
 log = logging.getLogger(__name__)
 
 
-def validate_dict_against_schema(value: dict, schema: dict) -> list[ValidationError]:
+def create_schema_validator(schema: dict) -> jsonschema.Draft7Validator:
+    """
+    Creates a validator for the schema. Remote schemas it refers to (`$ref`) are fetched through the (cached)
+    requests session and are retained by the validator, so re-using a validator avoids fetching them again.
+
+    The validator's `RefResolver` changes state whilst validating, so a validator must only be used by one thread.
+    """
+    resolver = jsonschema.RefResolver.from_schema(
+        schema,
+        handlers={"http": _get_remote_schema, "https": _get_remote_schema},
+    )
+    return jsonschema.Draft7Validator(schema, resolver=resolver)
+
+
+def validate_dict_against_schema(
+    value: dict, schema: Union[dict, jsonschema.Draft7Validator]
+) -> list[ValidationError]:
     """
-    Validates a dict against a schema,
+    Validates a dict against a schema (or a validator previously created for the schema),
     """
     try:
         # Validate our JSON document against the schema
         # This will implicitly validate the schema itself.
-        v = jsonschema.Draft7Validator(schema)
+        v = (
+            schema
+            if isinstance(schema, jsonschema.Draft7Validator)
+            else create_schema_validator(schema)
+        )
         return list(sorted(v.iter_errors(value), key=lambda e: str(e.path)))
     except ValidationError as err:
         log.error(f"Validation of the supplied config cube failed: {repr(err)}")
@@ -28,3 +52,14 @@ def validate_dict_against_schema(value: dict, schema: dict) -> list[ValidationEr
     except Exception as err:
         log.error(f"Unexpected Error: {repr(err)}")
         raise err
+
+
+def _get_remote_schema(uri: str) -> Dict[str, Any]:
+    prefetched_schema = get_prefetched_json_document(uri)
+    if prefetched_schema is not None:
+        return prefetched_schema
+
+    log.debug("Loading referenced schema from URL %s", uri)
+    response = session.get(uri)
+    response.raise_for_status()
+    return response.json()
@@ -4,16 +4,19 @@ CSV-qb Writer
 
 Output writer for CSV-qb
 """
+import copy
 import itertools
 import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import field
 from pathlib import Path
-from typing import Tuple, Dict, Any, List, Iterable, Set
+from typing import Tuple, Dict, Any, List, Iterable, Set, Container
 
+import numpy as np
 import pandas as pd
-
 from csvcubedmodels.rdf.dependency import RdfGraphDependency
 from csvcubedmodels import rdf
 from csvcubedmodels.rdf import skos, rdfs
@@ -25,12 +28,16 @@ from csvcubedmodels.rdf.resource import (
 )
 
 from csvcubed.models.cube import *
+from csvcubed.models.csvcubedexception import InvalidPartitionColumnException
+from csvcubed.utils.iterables import first
 from csvcubed.utils.uri import (
     get_last_uri_part,
     csvw_column_name_safe,
     get_data_type_uri_from_str,
+    uri_safe,
 )
 from csvcubed.utils.csvw import get_dependent_local_files
+from csvcubed.utils.csvwriter import CsvWriterEngine, write_csv
 from csvcubed.utils.qb.cube import (
     get_columns_of_dsd_type,
     QbColumnarDsdType,
@@ -38,6 +45,7 @@ from csvcubed.utils.qb.cube import (
 from csvcubed.utils.dict import rdf_resource_to_json_ld
 from csvcubed.utils.qb.standardise import (
     convert_data_values_to_uri_safe_values,
+    ensure_bool_columns_are_csvw_booleans,
     ensure_int_columns_are_ints,
 )
 from csvcubed.utils.file import copy_files_to_directory_with_structure
@@ -72,12 +80,28 @@ class QbWriter(WriterBase):
     cube: QbCube
     csv_file_name: str = field(init=False)
     raise_missing_uri_safe_value_exceptions: bool = field(default=True, repr=False)
+    csv_writer_engine: CsvWriterEngine = field(
+        default=CsvWriterEngine.Pandas, repr=False
+    )
+    partition_by: Optional[str] = field(default=None, repr=False)
+    """
+    The title of a dimension column to partition the observations by; one CSV is written for each of its values.
+    """
+    unchanged_code_lists: List[NewQbCodeList] = field(default_factory=list, repr=False)
+    """
+    Code lists which were written to the output folder by a previous build; they aren't written again if their
+    files are still present.
+    """
     _new_uri_helper: QbCubeNewUriHelper = field(init=False)
 
     @property
     def csv_metadata_file_name(self) -> str:
         return f"{self.csv_file_name}-metadata.json"
 
+    @property
+    def table_schema_file_name(self) -> str:
+        return f"{self.cube.metadata.uri_safe_identifier}.table.json"
+
     def __post_init__(self):
         self.csv_file_name = f"{self.cube.metadata.uri_safe_identifier}.csv"
         _logger.debug(
@@ -90,36 +114,45 @@ class QbWriter(WriterBase):
     def write(self, output_folder: Path):
         # Map all labels to their corresponding URI-safe-values, where possible.
         # Also converts all appropriate columns to the pandas categorical format.
+        # N.B. this is done to a copy of the cube so that `self.cube` remains unchanged and can be written again.
 
         _logger.info(f"Beginning CSV-W Generation: {self.csv_file_name}")
-        
-        ensure_int_columns_are_ints(self.cube)
+
+        output_cube = self._get_cube_for_output()
+
+        ensure_int_columns_are_ints(output_cube)
 
         # Bring the pandas representation of booleans inline with what the csvw spec requires
         # True != true, False != false
-        if isinstance(self.cube.data, pd.DataFrame):
-            for pandas_column_label in self.cube.data.columns.values:
-                if self.cube.data[pandas_column_label].dtype == "bool":
-                    self.cube.data[pandas_column_label] = self.cube.data[pandas_column_label].apply(
-                        lambda x: "true" if x is True else "false" if x is False else x
-                    )
+        ensure_bool_columns_are_csvw_booleans(output_cube)
 
         _logger.info('Calling data values to uri safe values')
         convert_data_values_to_uri_safe_values(
-            self.cube, self.raise_missing_uri_safe_value_exceptions
+            output_cube, self.raise_missing_uri_safe_value_exceptions
         )
 
-        tables = [
-            {
-                "url": self.csv_file_name,
-                "tableSchema": {
-                    "columns": self._generate_csvw_columns_for_cube(),
-                    "foreignKeys": self._generate_foreign_keys_for_cube(),
-                    "primaryKey": self._get_primary_key_columns(),
-                    "aboutUrl": self._get_about_url(),
-                },
-            }
-        ]
+        table_schema = {
+            "columns": self._generate_csvw_columns_for_cube(),
+            "foreignKeys": self._generate_foreign_keys_for_cube(),
+            "primaryKey": self._get_primary_key_columns(),
+            "aboutUrl": self._get_about_url(),
+        }
+
+        partitions: Optional[Dict[str, np.ndarray]] = None
+        if self.partition_by is None:
+            tables = [{"url": self.csv_file_name, "tableSchema": table_schema}]
+        else:
+            # Every partition's table shares the one table schema, written to its own file.
+            partitions = self._get_partitions(output_cube)
+            table_schema_output_path = output_folder / self.table_schema_file_name
+            with open(table_schema_output_path, "w+") as f:
+                _logger.debug("Writing table schema to %s", table_schema_output_path)
+                json.dump(table_schema, f, indent=4)
+
+            tables = [
+                {"url": partition_file_name, "tableSchema": self.table_schema_file_name}
+                for partition_file_name in partitions.keys()
+            ]
 
         tables += self._get_table_references_needed_for_foreign_keys()
 
@@ -137,10 +170,92 @@ class QbWriter(WriterBase):
             _logger.debug("Writing CSV-W JSON-LD to %s", metadata_json_output_path)
             json.dump(csvw_metadata, f, indent=4)
 
+        if output_cube.data is not None:
+            if partitions is None:
+                csv_output_file_path = output_folder / self.csv_file_name
+                _logger.debug("Writing CSV to %s", csv_output_file_path)
+                write_csv(
+                    output_cube.data, csv_output_file_path, self.csv_writer_engine
+                )
+            else:
+                self._write_partitions(output_cube.data, partitions, output_folder)
+
+    def _get_partitions(self, output_cube: QbCube) -> Dict[str, np.ndarray]:
+        """
+        :return: map of each partition's CSV file name to the positions of the rows in the partition.
+        """
+        partition_column = first(
+            self.cube.columns, lambda c: c.csv_column_title == self.partition_by
+        )
+        if (
+            output_cube.data is None
+            or not isinstance(partition_column, QbColumn)
+            or not isinstance(partition_column.structural_definition, QbDimension)
+        ):
+            raise InvalidPartitionColumnException(column_title=str(self.partition_by))
+
+        partitions: Dict[str, np.ndarray] = {}
+        for value, row_positions in output_cube.data.groupby(
+            self.partition_by, observed=True, sort=True
+        ).indices.items():
+            partition_file_name = self._get_partition_file_name(
+                str(value), partitions.keys()
+            )
+            partitions[partition_file_name] = row_positions
+
+        _logger.debug(
+            "Partitioned observations by '%s' into %s CSVs",
+            self.partition_by,
+            len(partitions),
+        )
+        return partitions
+
+    def _get_partition_file_name(
+        self, value: str, existing_file_names: Container[str]
+    ) -> str:
+        # N.B. values may be URIs, so path separators are replaced too.
+        identifier = f"{self.cube.metadata.uri_safe_identifier}-{uri_safe(value).replace('/', '-')}"
+        partition_file_name = f"{identifier}.csv"
+        i = 1
+        while partition_file_name in existing_file_names:
+            i += 1
+            partition_file_name = f"{identifier}-{i}.csv"
+
+        return partition_file_name
+
+    def _write_partitions(
+        self,
+        data: pd.DataFrame,
+        partitions: Dict[str, np.ndarray],
+        output_folder: Path,
+    ) -> None:
+        def write_partition(partition_file_name: str) -> None:
+            csv_output_file_path = output_folder / partition_file_name
+            _logger.debug("Writing CSV partition to %s", csv_output_file_path)
+            write_csv(
+                data.iloc[partitions[partition_file_name]],
+                csv_output_file_path,
+                self.csv_writer_engine,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(partitions), os.cpu_count() or 1))
+        ) as executor:
+            # Consuming the results re-raises any exception from writing a partition.
+            list(executor.map(write_partition, partitions.keys()))
+
+    def _get_cube_for_output(self) -> QbCube:
+        """
+        :return: a shallow copy of the cube whose data can be standardised for output without affecting `self.cube`.
+
+        The data is a shallow copy too. Standardising the data replaces (rather than modifies) columns, so only the
+         columns which need to change are duplicated.
+        """
+        output_cube = copy.copy(self.cube)
         if self.cube.data is not None:
-            csv_output_file_path = output_folder / self.csv_file_name
-            _logger.debug("Writing CSV to %s", csv_output_file_path)
-            self.cube.data.to_csv(csv_output_file_path, index=False)
+            output_cube.data = self.cube.data.copy(deep=False)
+
+        return output_cube
 
     def _get_additional_rdf_metadata(self) -> List[dict]:
         """
@@ -163,11 +278,18 @@ class QbWriter(WriterBase):
         for column in get_columns_of_dsd_type(self.cube, NewQbDimension):
             code_list = column.structural_definition.code_list
             if isinstance(code_list, NewQbCodeList):
+                code_list_writer = self._get_writer_for_code_list(code_list)
+                if self._code_list_is_unchanged(
+                    code_list, code_list_writer, output_folder
+                ):
+                    _logger.debug(
+                        "Code list %s is unchanged; not writing it again.", code_list
+                    )
+                    continue
+
                 _logger.debug(
                     "Writing code list %s to '%s' directory.", code_list, output_folder
                 )
-
-                code_list_writer = self._get_writer_for_code_list(code_list)
                 code_list_writer.write(output_folder)
             elif isinstance(code_list, NewQbCodeListInCsvW):
                 # find the CSV-W codelist and all dependent relative files and copy them into the output_folder
@@ -270,7 +392,7 @@ class QbWriter(WriterBase):
                         ),
                         "reference": {
                             "resource": code_list.csv_file_relative_path_or_uri,
-                            "columnReference": "notation", # NewQbCodeListInCsvW are used for historic reasons and they always use the notation key for their primary key. External users cannot create NewQbCodeListInCsvW.
+                            "columnReference": "notation",  # NewQbCodeListInCsvW are used for historic reasons and they always use the notation key for their primary key. External users cannot create NewQbCodeListInCsvW.
                         },
                     }
                 )
@@ -679,8 +801,23 @@ class QbWriter(WriterBase):
 
         return rdf_file_dependencies
 
+    def _code_list_is_unchanged(
+        self,
+        code_list: NewQbCodeList,
+        code_list_writer: SkosCodeListWriter,
+        output_folder: Path,
+    ) -> bool:
+        # Identity (rather than equality) is deliberate; comparing code lists' concepts would cost about as much as
+        # writing them.
+        return (
+            any(code_list is unchanged for unchanged in self.unchanged_code_lists)
+            and (output_folder / code_list_writer.csv_metadata_file_name).exists()
+        )
+
     def _get_writer_for_code_list(self, code_list) -> SkosCodeListWriter:
-        return SkosCodeListWriter(code_list, self.cube.uri_style)
+        return SkosCodeListWriter(
+            code_list, self.cube.uri_style, csv_writer_engine=self.csv_writer_engine
+        )
 
     def _get_new_attribute_value_resources(self) -> List[NewAttributeValueResource]:
         """
@@ -21,6 +21,7 @@ from csvcubed.models.cube.qb.components import (
 )
 from csvcubed.models.cube.qb.components.concept import NewQbConcept
 from csvcubed.models.cube.uristyle import URIStyle
+from csvcubed.utils.csvwriter import CsvWriterEngine, write_csv
 from csvcubed.utils.dict import rdf_resource_to_json_ld
 from csvcubed.models.rdf.conceptschemeincatalog import ConceptSchemeInCatalog
 from csvcubed.writers.urihelpers.skoscodelist import SkosCodeListNewUriHelper
@@ -33,6 +34,9 @@ _logger = logging.getLogger(__name__)
 class SkosCodeListWriter(WriterBase):
     new_code_list: NewQbCodeList
     default_uri_style: URIStyle = URIStyle.Standard
+    csv_writer_engine: CsvWriterEngine = field(
+        default=CsvWriterEngine.Pandas, repr=False
+    )
     csv_file_name: str = field(init=False)
     uri_helper: SkosCodeListNewUriHelper = field(init=False)
 
@@ -82,7 +86,7 @@ class SkosCodeListWriter(WriterBase):
             json.dump(table_schema, f, indent=4)
 
         _logger.debug("Writing CSV to %s", csv_file_path)
-        data.to_csv(str(csv_file_path), index=False)
+        write_csv(data, csv_file_path, self.csv_writer_engine)
 
     def _get_csvw_table_schema(self) -> dict:
         csvw_columns = [
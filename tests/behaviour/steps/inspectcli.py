@@ -61,6 +61,7 @@ def step_impl(context):
         context.csvw_type,
         context.csvw_metadata_rdf_graph,
         context.csvw_metadata_json_path,
+        count_duplicates=True,
     )
     context.type_printable = metadata_printer.type_info_printable
     context.catalog_metadata_printable = metadata_printer.catalog_metadata_printable
@@ -89,6 +90,7 @@ def step_impl(context):
         context.csvw_type,
         context.csvw_metadata_rdf_graph,
         context.csvw_metadata_json_path,
+        count_duplicates=True,
     )
     context.type_printable = metadata_printer.type_info_printable
     context.catalog_metadata_printable = metadata_printer.catalog_metadata_printable
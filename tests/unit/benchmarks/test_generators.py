@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from benchmarks.compare import compare_results
+from benchmarks.generators import (
+    CubeShape,
+    generate_data,
+    generate_qube_config,
+    write_cube,
+    MEASURE_COLUMN_TITLE,
+    OBS_STATUS_COLUMN_TITLE,
+    OBSERVATION_COLUMN_TITLE,
+    UNIT_COLUMN_TITLE,
+)
+
+
+def test_generated_data_has_unique_dimension_keys():
+    """
+    Ensure that the first dimension grows so that every row has a unique combination of dimension values.
+    """
+    shape = CubeShape(
+        rows=5000, num_dimensions=2, codelist_cardinality=10, num_measures=3
+    )
+    data = generate_data(shape)
+
+    assert len(data) == 5000
+    assert shape.dimension_cardinalities == [167, 10]
+    key_columns = ["Dimension 1", "Dimension 2", MEASURE_COLUMN_TITLE]
+    assert not data.duplicated(subset=key_columns).any()
+
+
+def test_generated_obs_status_marks_missing_values():
+    shape = CubeShape(rows=2000, obs_status_sparsity=0.25)
+    data = generate_data(shape)
+
+    missing_values = data[OBSERVATION_COLUMN_TITLE].isna()
+    assert missing_values.any()
+    assert (missing_values == data[OBS_STATUS_COLUMN_TITLE].notna()).all()
+
+
+def test_generated_qube_config_matches_shape():
+    single_measure_config = generate_qube_config(CubeShape(rows=10))
+    assert set(single_measure_config["columns"].keys()) == {
+        "Dimension 1",
+        "Dimension 2",
+        "Dimension 3",
+        OBSERVATION_COLUMN_TITLE,
+    }
+    observations = single_measure_config["columns"][OBSERVATION_COLUMN_TITLE]
+    assert observations["measure"] == {"label": "Measure 1"}
+    assert observations["unit"] == {"label": "Unit 1"}
+
+    multi_measure_config = generate_qube_config(
+        CubeShape(rows=10, num_measures=2, num_units=3)
+    )
+    assert len(multi_measure_config["columns"][MEASURE_COLUMN_TITLE]["values"]) == 2
+    assert len(multi_measure_config["columns"][UNIT_COLUMN_TITLE]["values"]) == 3
+    assert "measure" not in multi_measure_config["columns"][OBSERVATION_COLUMN_TITLE]
+
+
+def test_hierarchical_code_list_configs_written(tmp_path):
+    generated_cube = write_cube(
+        CubeShape(
+            rows=100, num_dimensions=1, codelist_cardinality=13, hierarchy_depth=3
+        ),
+        tmp_path,
+    )
+    code_list_config_path = (
+        generated_cube.config_path.parent / "codelists" / "dimension-1.json"
+    )
+    assert code_list_config_path.exists()
+
+    with open(code_list_config_path) as f:
+        code_list_config = json.load(f)
+
+    def _depth(concepts) -> int:
+        return max((1 + _depth(c.get("children", [])) for c in concepts), default=0)
+
+    assert _depth(code_list_config["concepts"]) == 3
+
+
+def test_compare_results_flags_regressions():
+    def _results(build_s: float, validate_s: float) -> dict:
+        return {
+            "results": {
+                "10k": {
+                    "targets": {
+                        "build": {"median_s": build_s},
+                        "Cube.validate": {"median_s": validate_s},
+                    }
+                }
+            }
+        }
+
+    comparisons = compare_results(_results(1.0, 0.01), _results(1.5, 0.02))
+    statuses = {c.target: c.status for c in comparisons}
+
+    # Cube.validate doubled in time, but by less than the minimum difference so it is treated as noise.
+    assert statuses == {"build": "REGRESSION", "Cube.validate": "ok"}
+
+
+if __name__ == "__main__":
+    pytest.main()
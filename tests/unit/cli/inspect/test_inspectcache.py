@@ -0,0 +1,131 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import csvcubed.cli.inspect.inspectcache
+from csvcubed.cli.inspect.inspect import InspectOutputFormat, inspect
+from csvcubed.cli.inspect.inspectcache import (
+    get_inspect_cache_key,
+    get_inspect_cache_path,
+    read_cached_inspect_results,
+    write_cached_inspect_results,
+)
+from tests.unit.test_baseunit import get_test_cases_dir
+
+_test_case_base_dir = get_test_cases_dir() / "cli" / "inspect"
+
+
+@pytest.fixture
+def csvw_metadata_json_path(tmp_path):
+    shutil.copy(_test_case_base_dir / "codelist.csv-metadata.json", tmp_path)
+    shutil.copy(_test_case_base_dir / "alcohol-content.csv", tmp_path)
+    return tmp_path / "codelist.csv-metadata.json"
+
+
+def test_inspect_cache_key_changes_with_csv_content(csvw_metadata_json_path):
+    """
+    Should generate a different key when a CSV referred to by the metadata file changes.
+    """
+    original_key = get_inspect_cache_key(csvw_metadata_json_path, False)
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) == original_key
+    assert get_inspect_cache_key(csvw_metadata_json_path, True) != original_key
+    assert (
+        get_inspect_cache_key(csvw_metadata_json_path, False, ["metadata"])
+        != original_key
+    )
+
+    with open(csvw_metadata_json_path.parent / "alcohol-content.csv", "a") as f:
+        f.write("new,row,,99,\n")
+
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) != original_key
+
+
+def test_inspect_cache_key_changes_with_dependencies(tmp_path):
+    """
+    Should generate a different key when a code list CSV-W the metadata file depends on (or its CSV) changes.
+    """
+    shutil.copytree(_test_case_base_dir / "dependencies", tmp_path / "dependencies")
+    csvw_metadata_json_path = tmp_path / "dependencies" / "data.csv-metadata.json"
+
+    original_key = get_inspect_cache_key(csvw_metadata_json_path, False)
+
+    dimension_csv_path = tmp_path / "dependencies" / "dimension.csv"
+    dimension_csv = dimension_csv_path.read_text()
+    with open(dimension_csv_path, "a") as f:
+        f.write("new-code,New Code\n")
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) != original_key
+
+    dimension_csv_path.write_text(dimension_csv)
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) == original_key
+
+    dimension_metadata_path = tmp_path / "dependencies" / "dimension.csv-metadata.json"
+    dimension_metadata = json.loads(dimension_metadata_path.read_text())
+    dimension_metadata["rdfs:comment"] = "A changed comment."
+    dimension_metadata_path.write_text(json.dumps(dimension_metadata))
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) != original_key
+
+
+def test_inspect_cache_key_identifies_large_files_by_stat(
+    csvw_metadata_json_path, monkeypatch
+):
+    """
+    Should identify large files by their size and modification time rather than reading their content.
+    """
+    monkeypatch.setattr(
+        csvcubed.cli.inspect.inspectcache, "_MAX_CONTENT_HASHED_FILE_SIZE", 0
+    )
+    csv_path = csvw_metadata_json_path.parent / "alcohol-content.csv"
+    original_key = get_inspect_cache_key(csvw_metadata_json_path, False)
+    original_stat = csv_path.stat()
+
+    # Same size and modification time, different content.
+    csv_path.write_text(csv_path.read_text().swapcase())
+    os.utime(csv_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) == original_key
+
+    os.utime(
+        csv_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns + 10**9)
+    )
+    assert get_inspect_cache_key(csvw_metadata_json_path, False) != original_key
+
+
+def test_inspect_cache_round_trip(csvw_metadata_json_path):
+    """
+    Should only return cached results which were stored with the same key.
+    """
+    assert read_cached_inspect_results(csvw_metadata_json_path, "key") is None
+
+    write_cached_inspect_results(csvw_metadata_json_path, "key", {"type": "code list"})
+
+    assert get_inspect_cache_path(csvw_metadata_json_path).exists()
+    assert read_cached_inspect_results(csvw_metadata_json_path, "key") == {
+        "type": "code list"
+    }
+    assert read_cached_inspect_results(csvw_metadata_json_path, "other-key") is None
+
+
+def test_inspect_json_served_from_cache(csvw_metadata_json_path, capsys):
+    """
+    Should output the cached results without loading the CSV-W when its content hasn't changed.
+    """
+    cached_results = {"type": "code list", "dataset_information": {"num": 1}}
+    write_cached_inspect_results(
+        csvw_metadata_json_path,
+        get_inspect_cache_key(csvw_metadata_json_path, False),
+        cached_results,
+    )
+
+    inspect(csvw_metadata_json_path, output_format=InspectOutputFormat.Json)
+    assert json.loads(capsys.readouterr().out) == cached_results
+
+    inspect(csvw_metadata_json_path, output_format=InspectOutputFormat.NDJson)
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == [
+        {"section": "type", "results": "code list"},
+        {"section": "dataset_information", "results": {"num": 1}},
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,3 +1,4 @@
+import json
 from csvcubed.cli.inspect.metadatainputvalidator import CSVWType
 from csvcubed.cli.inspect.metadataprinter import to_absolute_rdflib_file_path
 from csvcubed.utils.skos.codelist import (
@@ -6,6 +7,7 @@ from csvcubed.utils.skos.codelist import (
 )
 import pytest
 import numpy as np
+import pandas as pd
 from pandas import DataFrame
 from pandas.util.testing import assert_frame_equal
 from typing import List, Tuple
@@ -26,10 +28,12 @@ from csvcubed.models.sparqlresults import (
     DSDLabelURIResult,
     QubeComponentResult,
     QubeComponentsResult,
+    TableColumnDataTypeResult,
 )
 from csvcubed.cli.inspect.inspectdatasetmanager import (
     get_concepts_hierarchy_info,
-    get_dataset_observations_info,
+    get_csv_observations_info,
+    get_dataset_dtypes,
     get_dataset_val_counts_info,
     get_measure_col_name_from_dsd,
     get_single_measure_from_dsd,
@@ -265,21 +269,158 @@ def test_load_csv_to_dataframe_error():
         load_csv_to_dataframe(csvw_metadata_json_path, "missing_csv_file.csv")
 
 
-def test_get_dataset_observations_info():
+def test_get_dataset_dtypes():
     """
-    Should produce the expected `DatasetObservationsInfoResult`.
+    Should load textual columns and columns with a `valueUrl` as categoricals, leaving numeric columns to pandas.
+    """
+    dtypes = get_dataset_dtypes(
+        [
+            TableColumnDataTypeResult("Label", None, None),
+            TableColumnDataTypeResult("Notation", "string", None),
+            TableColumnDataTypeResult("Year", "integer", "http://example.com/{+year}"),
+            TableColumnDataTypeResult("Value", "decimal", None),
+            TableColumnDataTypeResult("Flag", "boolean", None),
+        ]
+    )
+
+    assert dtypes == {"Label": "category", "Notation": "category", "Year": "category"}
+
+
+def test_load_csv_to_dataframe_categorical_columns_subset():
+    """
+    Should load only the requested columns, using the given dtypes.
     """
     csvw_metadata_json_path = _test_case_base_dir / "datacube.csv-metadata.json"
-    dataset = load_csv_to_dataframe(csvw_metadata_json_path, "csv_file.csv")
+    dataset = load_csv_to_dataframe(
+        csvw_metadata_json_path,
+        "csv_file.csv",
+        dtype={"Label": "category", "Notation": "category"},
+        usecols=["Label", "Sort Priority"],
+    )
+
+    assert list(dataset.columns) == ["Label", "Sort Priority"]
+    assert dataset["Label"].dtype == "category"
+    assert list(dataset["Label"]) == list(_expected_dataframe["Label"])
+
 
-    result: DatasetObservationsInfoResult = get_dataset_observations_info(
-        dataset, CSVWType.QbDataSet
+def test_get_csv_observations_info_categorical_columns():
+    """
+    Should read the head and tail with the given dtypes and count duplicate rows where the columns are categorical.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "datacube.csv-metadata.json"
+    dtype = {
+        "Label": "category",
+        "Notation": "category",
+        "Parent Notation": "category",
+        "Description": "category",
+    }
+
+    result: DatasetObservationsInfoResult = get_csv_observations_info(
+        csvw_metadata_json_path,
+        Path("csv_file.csv"),
+        CSVWType.QbDataSet,
+        dtype=dtype,
+        count_duplicates=True,
     )
 
     assert result.num_of_observations == 11
     assert result.num_of_duplicates == 2
+    assert result.dataset_head["Label"].dtype == "category"
+    assert result.dataset_tail["Label"].dtype == "category"
+    assert list(result.dataset_tail["Label"]) == list(
+        _expected_dataframe.tail(n=10)["Label"]
+    )
+
+
+def test_get_csv_observations_info():
+    """
+    Should produce the expected `DatasetObservationsInfoResult` without loading the whole csv.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "datacube.csv-metadata.json"
+
+    result: DatasetObservationsInfoResult = get_csv_observations_info(
+        csvw_metadata_json_path, Path("csv_file.csv"), CSVWType.QbDataSet
+    )
+
+    assert result.num_of_observations == 11
+    assert result.num_of_duplicates is None
+    assert "Number of Duplicates" not in result.output_str
     assert_frame_equal(result.dataset_head, _expected_dataframe.head(n=10))
-    assert_frame_equal(result.dataset_tail, _expected_dataframe.tail(n=10))
+    assert_frame_equal(
+        result.dataset_tail,
+        _expected_dataframe.tail(n=10).reset_index(drop=True),
+    )
+
+
+def test_get_csv_observations_info_count_duplicates():
+    """
+    Should count the duplicate rows in the csv when requested.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "datacube.csv-metadata.json"
+
+    result: DatasetObservationsInfoResult = get_csv_observations_info(
+        csvw_metadata_json_path,
+        Path("csv_file.csv"),
+        CSVWType.QbDataSet,
+        count_duplicates=True,
+    )
+
+    assert result.num_of_duplicates == 2
+    assert "Number of Duplicates: 2" in result.output_str
+
+
+def test_get_csv_observations_info_partitioned(tmp_path: Path):
+    """
+    Should produce the same `DatasetObservationsInfoResult` where the rows are partitioned across several csvs.
+    """
+    dataset = pd.read_csv(_test_case_base_dir / "csv_file.csv", dtype=str)
+    partition_paths = [Path("part-1.csv"), Path("part-2.csv"), Path("part-3.csv")]
+    for partition_path, (start, end) in zip(partition_paths, [(0, 4), (4, 5), (5, 11)]):
+        dataset.iloc[start:end].to_csv(tmp_path / partition_path, index=False)
+
+    expected_result = get_csv_observations_info(
+        _test_case_base_dir / "datacube.csv-metadata.json",
+        Path("csv_file.csv"),
+        CSVWType.QbDataSet,
+        count_duplicates=True,
+    )
+    result = get_csv_observations_info(
+        tmp_path / "datacube.csv-metadata.json",
+        partition_paths,
+        CSVWType.QbDataSet,
+        count_duplicates=True,
+    )
+
+    assert result.num_of_observations == expected_result.num_of_observations == 11
+    assert result.num_of_duplicates == expected_result.num_of_duplicates
+    assert_frame_equal(result.dataset_head, expected_result.dataset_head)
+    assert_frame_equal(
+        result.dataset_tail.reset_index(drop=True),
+        expected_result.dataset_tail.reset_index(drop=True),
+    )
+
+
+def test_dataset_observations_info_output_dict():
+    """
+    Should produce a JSON-serialisable representation of the `DatasetObservationsInfoResult`.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "datacube.csv-metadata.json"
+
+    result: DatasetObservationsInfoResult = get_csv_observations_info(
+        csvw_metadata_json_path, Path("csv_file.csv"), CSVWType.QbDataSet
+    )
+    output_dict = json.loads(json.dumps(result.output_dict))
+
+    assert output_dict["num_of_observations"] == 11
+    assert output_dict["num_of_duplicates"] is None
+    assert len(output_dict["head"]) == 10
+    assert output_dict["head"][0] == {
+        "Label": "All",
+        "Notation": "all",
+        "Parent Notation": None,
+        "Sort Priority": 0,
+        "Description": None,
+    }
 
 
 def test_get_measure_col_name_from_dsd_measure_col_present():
@@ -429,6 +570,7 @@ def test_get_val_counts_info_multi_unit_multi_measure_dataset():
         canonical_shape_dataset,
         measure_col,
         unit_col,
+        constant_columns,
     ) = transform_dataset_to_canonical_shape(
         dataset,
         qube_components,
@@ -438,7 +580,7 @@ def test_get_val_counts_info_multi_unit_multi_measure_dataset():
     )
 
     result: DatasetObservationsByMeasureUnitInfoResult = get_dataset_val_counts_info(
-        canonical_shape_dataset, measure_col, unit_col
+        canonical_shape_dataset, measure_col, unit_col, constant_columns
     )
 
     _expected_by_measure_and_unit_val_counts_df_multi_unit_multi_measure.rename(
@@ -475,6 +617,7 @@ def test_get_val_counts_info_multi_unit_single_measure_dataset():
         canonical_shape_dataset,
         measure_col,
         unit_col,
+        constant_columns,
     ) = transform_dataset_to_canonical_shape(
         dataset,
         qube_components,
@@ -484,7 +627,7 @@ def test_get_val_counts_info_multi_unit_single_measure_dataset():
     )
 
     result: DatasetObservationsByMeasureUnitInfoResult = get_dataset_val_counts_info(
-        canonical_shape_dataset, measure_col, unit_col
+        canonical_shape_dataset, measure_col, unit_col, constant_columns
     )
 
     _expected_by_measure_and_unit_val_counts_df_multi_unit_single_measure.rename(
@@ -521,6 +664,7 @@ def test_get_val_counts_info_single_unit_multi_measure_dataset():
         canonical_shape_dataset,
         measure_col,
         unit_col,
+        constant_columns,
     ) = transform_dataset_to_canonical_shape(
         dataset,
         qube_components,
@@ -530,7 +674,7 @@ def test_get_val_counts_info_single_unit_multi_measure_dataset():
     )
 
     result: DatasetObservationsByMeasureUnitInfoResult = get_dataset_val_counts_info(
-        canonical_shape_dataset, measure_col, unit_col
+        canonical_shape_dataset, measure_col, unit_col, constant_columns
     )
 
     _expected_by_measure_and_unit_val_counts_df_single_unit_multi_measure.rename(
@@ -567,6 +711,7 @@ def test_get_val_counts_info_single_unit_single_measure_dataset():
         canonical_shape_dataset,
         measure_col,
         unit_col,
+        constant_columns,
     ) = transform_dataset_to_canonical_shape(
         dataset,
         qube_components,
@@ -576,7 +721,7 @@ def test_get_val_counts_info_single_unit_single_measure_dataset():
     )
 
     result: DatasetObservationsByMeasureUnitInfoResult = get_dataset_val_counts_info(
-        canonical_shape_dataset, measure_col, unit_col
+        canonical_shape_dataset, measure_col, unit_col, constant_columns
     )
 
     _expected_by_measure_and_unit_val_counts_df_single_unit_single_measure.rename(
@@ -594,6 +739,53 @@ def test_get_val_counts_info_single_unit_single_measure_dataset():
     )
 
 
+def test_get_val_counts_info_constant_unit_not_materialised():
+    """
+    Should attach a constant unit to the value counts without adding a column to the dataset.
+    """
+    dataset = DataFrame(
+        {
+            "Measure": ["Imports", "Exports", "Imports"],
+            "Value": [1.0, 2.0, 3.0],
+        }
+    )
+
+    result: DatasetObservationsByMeasureUnitInfoResult = get_dataset_val_counts_info(
+        dataset, "Measure", "Unit_abc", {"Unit_abc": "GBP"}
+    )
+
+    assert list(dataset.columns) == ["Measure", "Value"]
+    assert_frame_equal(
+        result.by_measure_and_unit_val_counts_df,
+        DataFrame(
+            {
+                "Measure": ["Exports", "Imports"],
+                "Unit_abc": ["GBP", "GBP"],
+                0: [1, 2],
+            }
+        ),
+    )
+
+
+def test_get_val_counts_info_constant_measure_and_unit():
+    """
+    Should produce a single row of value counts when both the measure and unit are constant.
+    """
+    dataset = DataFrame({"Value": [1.0, 2.0, 3.0]})
+
+    result: DatasetObservationsByMeasureUnitInfoResult = get_dataset_val_counts_info(
+        dataset,
+        "Measure_abc",
+        "Unit_abc",
+        {"Measure_abc": "Energy", "Unit_abc": "GBP"},
+    )
+
+    assert_frame_equal(
+        result.by_measure_and_unit_val_counts_df,
+        DataFrame({"Measure_abc": ["Energy"], "Unit_abc": ["GBP"], 0: [3]}),
+    )
+
+
 def test_get_concepts_hierarchy_info_hierarchy_with_depth_of_one():
     """
     Should produce the expected tree structure for the given codelist.
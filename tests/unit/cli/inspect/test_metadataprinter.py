@@ -0,0 +1,64 @@
+import pytest
+
+from csvcubed.cli.inspect import metadataprinter
+from csvcubed.cli.inspect.metadatainputvalidator import CSVWType
+from csvcubed.cli.inspect.metadataprinter import InspectSection, MetadataPrinter
+from csvcubed.utils.tableschema import CsvwRdfManager
+from tests.unit.test_baseunit import get_test_cases_dir
+
+_test_case_base_dir = get_test_cases_dir() / "cli" / "inspect"
+
+
+def _fail_reading_csv(*args, **kwargs):
+    raise AssertionError("The observations CSV should not have been read.")
+
+
+def test_selected_sections_do_not_read_observations(monkeypatch):
+    """
+    Inspecting only the metadata and DSD of a data cube should never read its observations CSV.
+    """
+    monkeypatch.setattr(metadataprinter, "get_csv_observations_info", _fail_reading_csv)
+    monkeypatch.setattr(metadataprinter, "load_csv_to_dataframe", _fail_reading_csv)
+
+    csvw_metadata_json_path = _test_case_base_dir / "datacube.csv-metadata.json"
+    metadata_printer = MetadataPrinter(
+        CSVWType.QbDataSet,
+        CsvwRdfManager(csvw_metadata_json_path).rdf_graph,
+        csvw_metadata_json_path,
+        sections={InspectSection.Metadata, InspectSection.Dsd},
+    )
+
+    assert metadata_printer.applicable_sections == [
+        InspectSection.Metadata,
+        InspectSection.Dsd,
+    ]
+    assert len(metadata_printer.printables) == 2
+    assert list(metadata_printer.output_dict.keys()) == [
+        "type",
+        "catalog_metadata",
+        "data_structure_definition",
+    ]
+
+
+def test_unrequested_section_generated_on_access():
+    """
+    The results behind a section which wasn't requested should be generated when its printable is accessed.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / "codelist.csv-metadata.json"
+    metadata_printer = MetadataPrinter(
+        CSVWType.CodeList,
+        CsvwRdfManager(csvw_metadata_json_path).rdf_graph,
+        csvw_metadata_json_path,
+        sections={InspectSection.Metadata, InspectSection.Dsd},
+    )
+
+    # The DSD section doesn't apply to code lists.
+    assert metadata_printer.applicable_sections == [InspectSection.Metadata]
+    assert not hasattr(metadata_printer, "result_dataset_observations_info")
+
+    assert "Number of " in metadata_printer.dataset_observations_info_printable
+    assert hasattr(metadata_printer, "result_dataset_observations_info")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,183 @@
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+import csvcubed.cli.serve.server
+from csvcubed.cli.serve.client import (
+    SERVER_TOKEN_ENV_VAR,
+    submit_build_job,
+    submit_inspect_job,
+)
+from csvcubed.cli.serve.server import CsvcubedServer
+from csvcubed.models.csvcubedexception import ServerJobFailedException
+
+
+@pytest.fixture
+def server():
+    server = CsvcubedServer(port=0, max_workers=1)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    yield server
+
+    server.shutdown()
+    server_thread.join()
+
+
+@pytest.fixture
+def server_url(server: CsvcubedServer, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(SERVER_TOKEN_ENV_VAR, server.token)
+    return server.url
+
+
+def _post(url: str, body: bytes, headers: dict) -> int:
+    try:
+        with urllib.request.urlopen(
+            urllib.request.Request(url, data=body, headers=headers, method="POST")
+        ) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_server_status(server_url: str):
+    with urllib.request.urlopen(f"{server_url}/status") as response:
+        status = json.loads(response.read())
+
+    assert status["status"] == "ok"
+
+
+def test_build_job(server_url: str, tmp_path: Path):
+    """
+    Should build the cube in the server's process, writing the CSV-W to the requested output directory.
+    """
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Year,Location,Value,Measure,Unit\n"
+        "2020,London,1,Count,Number\n"
+        "2021,Leeds,2,Count,Number\n"
+    )
+    output_directory = tmp_path / "out"
+
+    for _ in range(2):
+        result = submit_build_job(
+            server_url, [csv_path], output_directory=output_directory
+        )
+
+        assert Path(result["output_directory"]) == output_directory.resolve()
+        assert result["validation_errors"] == []
+        assert (output_directory / "data.csv-metadata.json").exists()
+
+
+def test_failed_job_raises_exception(server_url: str, tmp_path: Path):
+    with pytest.raises(ServerJobFailedException) as ex:
+        submit_inspect_job(server_url, tmp_path / "missing.csv-metadata.json")
+
+    assert "missing.csv-metadata.json" in str(ex.value)
+
+    with pytest.raises(ServerJobFailedException) as ex:
+        submit_build_job(server_url, [])
+
+    assert "At least one CSV must be provided." in str(ex.value)
+
+
+def test_job_failures_distinguished_from_bad_requests(
+    server: CsvcubedServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Malformed requests are rejected before the job runs, whereas errors raised by the job itself are server errors.
+    """
+
+    def _build(**kwargs):
+        raise ValueError("Something went wrong whilst building.")
+
+    monkeypatch.setattr(csvcubed.cli.serve.server, "build", _build)
+    job_url = f"{server.url}/jobs/build"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {server.token}",
+    }
+    csv_path = str(tmp_path / "data.csv")
+    output_directory = str(tmp_path / "out")
+
+    for bad_request in [
+        {"out": output_directory},
+        {"csv": csv_path, "out": output_directory, "csv_writer": "unknown"},
+        {"csv": csv_path, "out": output_directory, "partition_by": 1},
+        {"csv": [1], "out": output_directory},
+    ]:
+        assert _post(job_url, json.dumps(bad_request).encode(), headers) == 400
+
+    assert not (tmp_path / "out").exists()
+    assert (
+        _post(
+            job_url,
+            json.dumps({"csv": csv_path, "out": output_directory}).encode(),
+            headers,
+        )
+        == 500
+    )
+
+
+def test_unauthorised_requests_rejected(server: CsvcubedServer, tmp_path: Path):
+    """
+    Job requests must be JSON, addressed to a loopback host and carry the server's token; otherwise any web page
+    could have the server write files.
+    """
+    output_directory = tmp_path / "out"
+    body = json.dumps(
+        {"csv": [str(tmp_path / "data.csv")], "out": str(output_directory)}
+    )
+    job_url = f"{server.url}/jobs/build"
+    json_content_type = {"Content-Type": "application/json"}
+    authorisation = {"Authorization": f"Bearer {server.token}"}
+
+    assert (
+        _post(job_url, body.encode(), {"Content-Type": "text/plain", **authorisation})
+        == 415
+    )
+    assert _post(job_url, body.encode(), json_content_type) == 401
+    assert (
+        _post(
+            job_url,
+            body.encode(),
+            {**json_content_type, "Authorization": "Bearer some-other-token"},
+        )
+        == 401
+    )
+    assert (
+        _post(
+            job_url,
+            body.encode(),
+            {**json_content_type, **authorisation, "Host": "attacker.example.com"},
+        )
+        == 403
+    )
+    assert not output_directory.exists()
+
+    with pytest.raises(ServerJobFailedException) as ex:
+        submit_build_job(server.url, [tmp_path / "data.csv"], token="some-other-token")
+
+    assert "token" in str(ex.value)
+
+
+def test_unavailable_server_raises_exception(tmp_path: Path):
+    with socket.socket() as unused_socket:
+        unused_socket.bind(("127.0.0.1", 0))
+        unused_port = unused_socket.getsockname()[1]
+
+    with pytest.raises(ServerJobFailedException) as ex:
+        submit_build_job(
+            f"http://127.0.0.1:{unused_port}", [tmp_path / "data.csv"], timeout=5
+        )
+
+    assert "build" in str(ex.value)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,91 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from csvcubed.cli.buildwatch import BuildWatcher
+
+
+def _write_and_touch(path: Path, text: str) -> None:
+    """
+    Writes the file, ensuring its modification time changes even on file systems with coarse timestamps.
+    """
+    previous_mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(previous_mtime_ns + 10**9, previous_mtime_ns + 10**9))
+
+
+def test_rebuild_only_when_csv_changes(tmp_path: Path):
+    csv_path = tmp_path / "data.csv"
+    _write_and_touch(
+        csv_path,
+        "Year,Location,Value,Measure,Unit\n"
+        "2020,London,1,Count,Number\n"
+        "2021,Leeds,2,Count,Number\n",
+    )
+    output_directory = tmp_path / "out"
+    watcher = BuildWatcher([csv_path], output_directory=output_directory)
+
+    cube, validation_errors = watcher.build()
+
+    assert cube is not None
+    assert validation_errors == []
+    assert (output_directory / "data.csv-metadata.json").exists()
+    assert not watcher.rebuild_if_changed()
+
+    _write_and_touch(
+        csv_path,
+        "Year,Location,Value,Measure,Unit\n"
+        "2020,London,1,Count,Number\n"
+        "2021,Leeds,2,Count,Number\n"
+        "2022,York,3,Count,Number\n",
+    )
+
+    assert watcher.rebuild_if_changed()
+    assert "york" in (output_directory / "data.csv").read_text()
+    assert not watcher.rebuild_if_changed()
+
+
+def test_rebuild_reuses_unchanged_columns_and_code_lists(tmp_path: Path):
+    """
+    When only one column's configuration changes, the other columns and their code lists should not be generated or
+    written again.
+    """
+    csv_path = tmp_path / "data.csv"
+    _write_and_touch(
+        csv_path,
+        "Year,Location,Value,Measure,Unit\n"
+        "2020,London,1,Count,Number\n"
+        "2021,Leeds,2,Count,Number\n",
+    )
+    config = {
+        "$schema": "https://purl.org/csv-cubed/qube-config/v1.3",
+        "title": "Some Cube",
+        "columns": {
+            "Year": {"type": "dimension"},
+            "Location": {"type": "dimension"},
+            "Value": {"type": "observations"},
+        },
+    }
+    config_path = tmp_path / "config.json"
+    _write_and_touch(config_path, json.dumps(config))
+    output_directory = tmp_path / "out"
+    watcher = BuildWatcher([csv_path], config_path, output_directory=output_directory)
+
+    cube, _ = watcher.build()
+    assert cube is not None
+    location_code_list_path = output_directory / "location.csv"
+    assert location_code_list_path.exists()
+
+    config["columns"]["Year"]["label"] = "Period"
+    _write_and_touch(config_path, json.dumps(config))
+    os.utime(location_code_list_path, ns=(0, 0))
+
+    assert watcher.rebuild_if_changed()
+    assert location_code_list_path.stat().st_mtime_ns == 0
+    assert (output_directory / "period.csv").exists()
+
+
+if __name__ == "__main__":
+    pytest.main()
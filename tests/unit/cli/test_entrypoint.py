@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def test_entrypoint_does_not_import_heavy_libraries():
+    """
+    Submitting a job to a server (`--server`) shouldn't wait on the libraries used to do the work being imported.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import csvcubed.cli.entrypoint; "
+            "print(','.join(m for m in ['pandas', 'rdflib', 'csvcubed.cli.build'] if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+if __name__ == "__main__":
+    pytest.main()
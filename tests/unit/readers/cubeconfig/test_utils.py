@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import csvcubed.utils.json
+from csvcubed.readers.cubeconfig.utils import load_schema_validator
+from csvcubed.utils.validators.schema import validate_dict_against_schema
+
+_SCHEMA_URL = "https://example.com/qube-config/schema.json"
+_REFERENCED_SCHEMA_URL = "https://example.com/resources/columns.json"
+
+
+@pytest.fixture(autouse=True)
+def prefetched_schemas(monkeypatch: pytest.MonkeyPatch):
+    # The schema mixes references to a remote schema with references to its own definitions.
+    monkeypatch.setattr(
+        csvcubed.utils.json,
+        "_prefetched_json_documents",
+        {
+            _SCHEMA_URL: {
+                "type": "object",
+                "properties": {
+                    "column": {"$ref": f"{_REFERENCED_SCHEMA_URL}#/definitions/column"},
+                    "label": {"$ref": "#/definitions/label"},
+                },
+                "definitions": {"label": {"type": "string"}},
+            },
+            _REFERENCED_SCHEMA_URL: {
+                "definitions": {
+                    "column": {
+                        "type": "object",
+                        "properties": {"type": {"$ref": "#/definitions/type"}},
+                    },
+                    "type": {"enum": ["dimension", "observations"]},
+                }
+            },
+        },
+    )
+
+
+def test_schema_validators_are_not_shared_between_threads():
+    """
+    A validator's ref resolver changes state whilst validating, so concurrent validations must each use their own.
+    """
+    assert load_schema_validator(_SCHEMA_URL) is load_schema_validator(_SCHEMA_URL)
+
+    barrier = threading.Barrier(4, timeout=5)
+
+    def _validate(label: str):
+        barrier.wait()
+        validator = load_schema_validator(_SCHEMA_URL)
+        errors = [
+            validate_dict_against_schema(
+                {"column": {"type": "dimension"}, "label": label}, validator
+            )
+            for _ in range(50)
+        ]
+        return validator, errors
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_validate, ["a", "b", "c", "d"]))
+
+    assert len({id(validator) for validator, _ in results}) == 4
+    assert all(
+        errors == [] for _, validation_errors in results for errors in validation_errors
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -34,6 +34,7 @@ from csvcubed.models.cube.qb.components.validationerrors import (
     UndefinedUnitUrisError,
     EmptyQbMultiUnitsError,
 )
+from csvcubed.utils.log import flush_logging
 
 from tests.unit.test_baseunit import assert_num_validation_errors, get_test_cases_dir
 
@@ -45,6 +46,7 @@ _log_file_path = _user_log_dir / "out.log"
 
 
 def _check_log(text: str) -> bool:
+    flush_logging()
     with open(_log_file_path) as log_file:
         lines = log_file.readlines()
     for line in lines[::-1]:
@@ -212,5 +212,31 @@ def test_unsupported_col_definition_exception():
             )
 
 
+def test_build_from_csv_shards():
+    """
+    A cube built from several CSV shards should be written exactly as the cube built from the same data in one CSV.
+    """
+    data = pd.read_csv(TEST_CASE_DIR / "cube_data_convention_ok.csv", dtype=str)
+    with TemporaryDirectory() as t:
+        temp_dir = Path(t)
+        data.to_csv(temp_dir / "data.csv", index=False)
+        data.iloc[:3].to_csv(temp_dir / "data-1.csv", index=False)
+        data.iloc[3:].to_csv(temp_dir / "data-2.csv", index=False)
+
+        cli_build(csv_path=temp_dir / "data.csv", output_directory=temp_dir / "out")
+        cube, validation_errors = cli_build(
+            csv_path=[temp_dir / "data-1.csv", temp_dir / "data-2.csv"],
+            output_directory=temp_dir / "shards-out",
+        )
+
+        assert validation_errors == []
+        assert cube.metadata.title == "Data 1"
+        assert cube.data is not None
+        assert len(cube.data) == len(data)
+        assert (temp_dir / "shards-out" / "data-1.csv").read_text() == (
+            temp_dir / "out" / "data.csv"
+        ).read_text()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,213 @@
+from pathlib import Path
+import json
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+import pytest
+
+from csvcubed.cli.build import build as cli_build, build_from_dataframe
+from csvcubed.definitions import APP_ROOT_DIR_PATH
+from csvcubed.models.cube.qb import QbColumn
+from csvcubed.models.cube.qb.components import (
+    NewQbDimension,
+    QbObservationValue,
+)
+from csvcubed.models.cube.validationerrors import DuplicateColumnTitleError
+from csvcubed.readers.cubeconfig.v1.configdeserialiser import (
+    ColumnMappingCache,
+    get_dataframe_deserialiser,
+    get_deserialiser,
+)
+from csvcubed.utils.iterables import first
+
+SCHEMA_PATH_FILE = APP_ROOT_DIR_PATH / "schema" / "cube-config" / "v1_0" / "schema.json"
+
+_cube_config = {
+    "$schema": "https://purl.org/csv-cubed/qube-config/v1.0",
+    "title": "Some Cube",
+    "columns": {
+        "Year": {"type": "dimension"},
+        "Value": {"type": "observations"},
+        "Comment": {"type": "attribute", "label": "Comment", "data_type": "string"},
+    },
+}
+
+
+def _get_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Year": [2020, 2021, 2022],
+            "Region": pd.Categorical(["A", "B", "C"]),
+            "Value": [1, 2, 3],
+            "Comment": ["x", None, "z"],
+        }
+    )
+
+
+def test_dataframe_deserialiser_matches_csv_deserialiser():
+    """
+    A cube deserialised from a dataframe should have the same columns and data as one deserialised from the same data
+    written to a CSV file.
+    """
+    data = _get_data()
+    with TemporaryDirectory() as t:
+        temp_dir = Path(t)
+        data_file_path = temp_dir / "data.csv"
+        config_file_path = temp_dir / "config.json"
+        data.to_csv(data_file_path, index=False)
+        with open(config_file_path, "w+") as config_file:
+            json.dump(_cube_config, config_file)
+
+        csv_cube, csv_schema_errors, csv_data_errors = get_deserialiser(
+            SCHEMA_PATH_FILE, 3
+        )(data_file_path, config_file_path)
+
+    cube, schema_errors, data_errors = get_dataframe_deserialiser(SCHEMA_PATH_FILE, 3)(
+        data, _cube_config, None, None
+    )
+
+    assert schema_errors == csv_schema_errors == []
+    assert data_errors == csv_data_errors == []
+    assert [type(c.structural_definition) for c in cube.columns] == [
+        type(c.structural_definition) for c in csv_cube.columns
+    ]
+    assert cube.data is not None and csv_cube.data is not None
+    pd.testing.assert_frame_equal(
+        cube.data.astype({"Region": "string"}), csv_cube.data, check_dtype=False
+    )
+
+
+def test_dataframe_deserialiser_coerces_columns_without_modifying_dataframe():
+    data = _get_data()
+    cube, _, _ = get_dataframe_deserialiser(SCHEMA_PATH_FILE, 3)(
+        data, _cube_config, None, None
+    )
+
+    assert cube.data is not None
+    assert isinstance(cube.data["Year"].dtype, pd.StringDtype)
+    assert list(cube.data["Year"]) == ["2020", "2021", "2022"]
+    # Categorical columns are compatible with the expected string datatype so are left as they are.
+    assert isinstance(cube.data["Region"].dtype, pd.CategoricalDtype)
+    assert cube.data["Value"].dtype == "float64"
+
+    assert data["Year"].dtype == "int64"
+    assert data["Value"].dtype == "int64"
+
+    year_column = first(cube.columns, lambda c: c.csv_column_title == "Year")
+    assert isinstance(year_column, QbColumn)
+    assert isinstance(year_column.structural_definition, NewQbDimension)
+
+
+def test_dataframe_deserialiser_resets_index():
+    """
+    The cube's data should have a default index whatever the index of the dataframe it was deserialised from.
+    """
+    data = _get_data()
+    data.index = pd.Index(["w", "x", "y"])
+    cube, _, _ = get_dataframe_deserialiser(SCHEMA_PATH_FILE, 3)(
+        data, _cube_config, None, None
+    )
+
+    assert cube.data is not None
+    pd.testing.assert_index_equal(cube.data.index, pd.RangeIndex(3))
+    assert list(cube.data["Year"]) == ["2020", "2021", "2022"]
+    assert list(data.index) == ["w", "x", "y"]
+
+
+def test_dataframe_deserialiser_requires_title():
+    """
+    A dataframe has no file name to generate the title from, so a title must be provided.
+    """
+    deserialiser = get_dataframe_deserialiser(SCHEMA_PATH_FILE, 3)
+    data = _get_data().drop(columns="Comment")
+    with pytest.raises(ValueError):
+        deserialiser(data, None, None, None)
+
+    cube, _, _ = deserialiser(data, None, None, "Some Title")
+    assert cube.metadata.title == "Some Title"
+
+
+def test_dataframe_deserialiser_reports_duplicate_column_titles():
+    data = pd.DataFrame([["A", 1.0, 2.0]], columns=["Dimension", "Value", "Value"])
+    _, _, data_errors = get_dataframe_deserialiser(SCHEMA_PATH_FILE, 3)(
+        data, None, None, "Some Title"
+    )
+
+    assert data_errors == [DuplicateColumnTitleError(csv_column_title="Value")]
+
+
+def test_column_mapping_cache_only_remaps_changed_columns():
+    """
+    When deserialising the same data again, only the columns whose configuration has changed should be mapped again.
+    """
+    deserialiser = get_dataframe_deserialiser(SCHEMA_PATH_FILE, 3)
+    column_mapping_cache = ColumnMappingCache()
+    data = _get_data()
+
+    cube, _, _ = deserialiser(data, _cube_config, None, None, column_mapping_cache)
+
+    changed_config = json.loads(json.dumps(_cube_config))
+    changed_config["columns"]["Comment"]["label"] = "Some Comment"
+    changed_cube, _, _ = deserialiser(
+        data, changed_config, None, None, column_mapping_cache
+    )
+
+    for column, changed_column in zip(cube.columns, changed_cube.columns):
+        if column.csv_column_title == "Comment":
+            assert changed_column is not column
+            assert changed_column.structural_definition.label == "Some Comment"
+        else:
+            assert changed_column is column
+
+    column_mapping_cache.clear()
+    uncached_cube, _, _ = deserialiser(
+        data, changed_config, None, None, column_mapping_cache
+    )
+    assert all(
+        uncached_column is not changed_column
+        for uncached_column, changed_column in zip(
+            uncached_cube.columns, changed_cube.columns
+        )
+    )
+
+
+def test_build_from_dataframe_matches_build():
+    """
+    Building a cube from a dataframe should write the same outputs as building it from the equivalent CSV file.
+    """
+    data = pd.DataFrame(
+        {
+            "Period": [2010, 2011, 2012],
+            "Geography": pd.Categorical(["London", "London", "Cardiff"]),
+            "Observation": [0, 1, 2],
+            "Measure": ["Cost of living index"] * 3,
+            "Unit": ["index"] * 3,
+        }
+    )
+    with TemporaryDirectory() as t:
+        temp_dir = Path(t)
+        data_file_path = temp_dir / "some-cube.csv"
+        data.to_csv(data_file_path, index=False)
+
+        cli_build(csv_path=data_file_path, output_directory=temp_dir / "csv-out")
+        cube, validation_errors = build_from_dataframe(
+            data, title="Some Cube", output_directory=temp_dir / "dataframe-out"
+        )
+
+        assert validation_errors == []
+        observation_column = first(
+            cube.columns, lambda c: c.csv_column_title == "Observation"
+        )
+        assert isinstance(observation_column, QbColumn)
+        assert isinstance(observation_column.structural_definition, QbObservationValue)
+
+        # N.B. the metadata files record when they were generated, so only the CSVs are compared.
+        csv_output_paths = sorted((temp_dir / "csv-out").glob("*.csv"))
+        assert len(csv_output_paths) > 0
+        for csv_output_path in csv_output_paths:
+            dataframe_output_path = temp_dir / "dataframe-out" / csv_output_path.name
+            assert dataframe_output_path.read_text() == csv_output_path.read_text()
+
+
+if __name__ == "__main__":
+    pytest.main()
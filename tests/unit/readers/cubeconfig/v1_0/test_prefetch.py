@@ -0,0 +1,95 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import csvcubed.utils.json
+from csvcubed.readers.preconfiguredtemplates import TEMPLATE_LOOKUP_URL
+from csvcubed.readers.cubeconfig.v1.prefetch import prefetch_remote_resources
+from csvcubed.utils.cache import session
+from csvcubed.utils.json import load_json_document
+
+_SCHEMA_URL = "https://example.com/qube-config/schema.json"
+_REFERENCED_SCHEMA_URL = "https://example.com/resources/licenses.json"
+_CODE_LIST_SCHEMA_URL = "https://example.com/code-list-config/schema.json"
+_TEMPLATE_URL = TEMPLATE_LOOKUP_URL.replace("preset_column_config.json", "year.json")
+
+
+@pytest.fixture(autouse=True)
+def empty_prefetched_documents(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(csvcubed.utils.json, "_prefetched_json_documents", {})
+
+
+def test_remote_resources_prefetched_concurrently(tmp_path: Path):
+    """
+    The resources referenced directly by the config should be fetched at the same time, followed by the resources
+    they refer to; loading any of them afterwards shouldn't make a request.
+    """
+    code_list_config_path = tmp_path / "code-list.json"
+    code_list_config_path.write_text(json.dumps({"$schema": _CODE_LIST_SCHEMA_URL}))
+    config = {
+        "$schema": _SCHEMA_URL,
+        "columns": {
+            "Year": {"from_template": "year"},
+            "Location": {"type": "dimension", "code_list": "code-list.json"},
+            "Value": {"type": "observations"},
+        },
+    }
+
+    # Each of the directly referenced resources waits for the others to be requested.
+    first_wave = threading.Barrier(3, timeout=5)
+
+    def _respond_after_first_wave(document: dict):
+        def _callback(request, context) -> str:
+            first_wave.wait()
+            return json.dumps(document)
+
+        return _callback
+
+    with requests_mock.Mocker(session=session) as mocker:
+        mocker.get(
+            _SCHEMA_URL,
+            text=_respond_after_first_wave(
+                {"properties": {"license": {"$ref": f"{_REFERENCED_SCHEMA_URL}#/uris"}}}
+            ),
+        )
+        mocker.get(
+            TEMPLATE_LOOKUP_URL,
+            text=_respond_after_first_wave({"year": "year.json"}),
+        )
+        mocker.get(_CODE_LIST_SCHEMA_URL, text=_respond_after_first_wave({}))
+        mocker.get(_REFERENCED_SCHEMA_URL, json={"uris": {}})
+        mocker.get(_TEMPLATE_URL, json={"type": "dimension"})
+
+        prefetch_remote_resources(config, _SCHEMA_URL, tmp_path / "config.json")
+
+        assert {r.url for r in mocker.request_history} == {
+            _SCHEMA_URL,
+            TEMPLATE_LOOKUP_URL,
+            _CODE_LIST_SCHEMA_URL,
+            _REFERENCED_SCHEMA_URL,
+            _TEMPLATE_URL,
+        }
+
+        request_count = mocker.call_count
+        assert load_json_document(_REFERENCED_SCHEMA_URL) == {"uris": {}}
+        assert load_json_document(_TEMPLATE_URL) == {"type": "dimension"}
+        assert mocker.call_count == request_count
+
+
+def test_unavailable_resource_raised_when_loaded():
+    config = {"columns": {}}
+
+    with requests_mock.Mocker(session=session) as mocker:
+        mocker.get(_SCHEMA_URL, status_code=404)
+
+        prefetch_remote_resources(config, _SCHEMA_URL)
+
+        with pytest.raises(Exception, match="Error loading JSON from URL"):
+            load_json_document(_SCHEMA_URL)
+
+
+if __name__ == "__main__":
+    pytest.main()
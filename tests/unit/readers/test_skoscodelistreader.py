@@ -1,6 +1,10 @@
+import json
+import os
+import shutil
 from pathlib import Path
 import pytest
 
+from csvcubed.readers import skoscodelistreader
 from csvcubed.readers.skoscodelistreader import (
     extract_code_list_concept_scheme_info,
 )
@@ -85,5 +89,111 @@ def test_legacy_composite_code_list():
     assert concept_uri_template == "{+notation}"
 
 
+def _fail_if_rdf_graph_loaded(monkeypatch):
+    def _csvw_rdf_manager(*args, **kwargs):
+        raise AssertionError("The RDF graph should not be loaded.")
+
+    monkeypatch.setattr(skoscodelistreader, "CsvwRdfManager", _csvw_rdf_manager)
+
+
+def test_table_schema_properties_read_from_referenced_table_schema(
+    tmp_path, monkeypatch
+):
+    """
+    Ensure that the concept scheme info is read from the JSON structure (without loading an RDF graph) where the
+    table schema is defined in a separate file.
+    """
+    _fail_if_rdf_graph_loaded(monkeypatch)
+    shutil.copy(_skos_codelist_reader_test_cases / "sector.table.json", tmp_path)
+    code_list_csvw = tmp_path / "sector.csv-metadata.json"
+    with open(code_list_csvw, "w") as f:
+        json.dump(
+            {
+                "@context": "http://www.w3.org/ns/csvw",
+                "url": "sector.csv",
+                "tableSchema": "sector.table.json",
+            },
+            f,
+        )
+
+    csv_path, cs_uri, concept_uri_template = extract_code_list_concept_scheme_info(
+        code_list_csvw
+    )
+
+    with open(_skos_codelist_reader_test_cases / "sector.table.json") as f:
+        table_schema = json.load(f)
+    in_scheme_column = [
+        c for c in table_schema["columns"] if c.get("propertyUrl") == "skos:inScheme"
+    ][0]
+
+    assert csv_path == "sector.csv"
+    assert cs_uri == in_scheme_column["valueUrl"]
+    assert concept_uri_template == table_schema["aboutUrl"]
+
+
+def test_concept_scheme_info_cached_until_modified(tmp_path, monkeypatch):
+    """
+    Ensure that each CSV-W is only read once, unless it is modified.
+    """
+    for file_name in ["code-list.csv-metadata.json", "code-list.table.json"]:
+        shutil.copy(_test_case_base_dir / "utils" / "csvw" / file_name, tmp_path)
+    code_list_csvw = tmp_path / "code-list.csv-metadata.json"
+    _fail_if_rdf_graph_loaded(monkeypatch)
+
+    reads = []
+    get_properties_from_json = skoscodelistreader._get_table_schema_properties_from_json
+
+    def _counting_get_properties_from_json(path):
+        reads.append(path)
+        return get_properties_from_json(path)
+
+    monkeypatch.setattr(
+        skoscodelistreader,
+        "_get_table_schema_properties_from_json",
+        _counting_get_properties_from_json,
+    )
+
+    first_result = extract_code_list_concept_scheme_info(code_list_csvw)
+    assert extract_code_list_concept_scheme_info(code_list_csvw) == first_result
+    assert len(reads) == 1
+
+    modified_time_ns = code_list_csvw.stat().st_mtime_ns + 1_000_000_000
+    os.utime(code_list_csvw, ns=(modified_time_ns, modified_time_ns))
+
+    assert extract_code_list_concept_scheme_info(code_list_csvw) == first_result
+    assert len(reads) == 2
+
+
+def test_concept_scheme_info_errors_not_cached(tmp_path, monkeypatch):
+    """
+    Ensure that an error (which may be transient, e.g. a remote context being unavailable) is raised afresh, rather
+    than cached, when the concept scheme info is requested again.
+    """
+    for file_name in ["code-list.csv-metadata.json", "code-list.table.json"]:
+        shutil.copy(_test_case_base_dir / "utils" / "csvw" / file_name, tmp_path)
+    code_list_csvw = tmp_path / "code-list.csv-metadata.json"
+    _fail_if_rdf_graph_loaded(monkeypatch)
+
+    get_properties_from_json = skoscodelistreader._get_table_schema_properties_from_json
+
+    def _fail_once(path):
+        monkeypatch.setattr(
+            skoscodelistreader,
+            "_get_table_schema_properties_from_json",
+            get_properties_from_json,
+        )
+        raise ConnectionError("Temporarily unavailable.")
+
+    monkeypatch.setattr(
+        skoscodelistreader, "_get_table_schema_properties_from_json", _fail_once
+    )
+
+    with pytest.raises(ConnectionError):
+        extract_code_list_concept_scheme_info(code_list_csvw)
+
+    csv_path, _, _ = extract_code_list_concept_scheme_info(code_list_csvw)
+    assert csv_path == "code-list.csv"
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -2,7 +2,11 @@ import pytest
 
 from csvcubed.models.cube import *
 from csvcubed.models.cube import QbMultiMeasureDimension, QbMultiUnits
-from csvcubed.utils.qb.cube import get_all_units, get_all_measures
+from csvcubed.utils.qb.cube import (
+    get_all_units,
+    get_all_measures,
+    get_columns_of_dsd_type,
+)
 
 
 def test_get_all_units():
@@ -70,5 +74,36 @@ def test_get_all_measures():
     }
 
 
+def test_get_columns_of_dsd_type_index_invalidated_on_change():
+    """
+    Ensure that the index of columns by type is discarded whenever the cube's columns are changed.
+    """
+    dimension_a = QbColumn("A", NewQbDimension("A"))
+    dimension_b = QbColumn("B", NewQbDimension("B"))
+    cube = Cube(
+        CatalogMetadata("Some Qube"),
+        None,
+        [dimension_a, SuppressedCsvColumn("Suppressed")],
+    )
+
+    assert get_columns_of_dsd_type(cube, NewQbDimension) == [dimension_a]
+    assert get_columns_of_dsd_type(cube, QbAttribute) == []
+
+    # Mutating the list returned must not affect the index.
+    get_columns_of_dsd_type(cube, NewQbDimension).clear()
+    assert get_columns_of_dsd_type(cube, NewQbDimension) == [dimension_a]
+
+    cube.columns.append(dimension_b)
+    assert get_columns_of_dsd_type(cube, NewQbDimension) == [dimension_a, dimension_b]
+
+    cube.columns[0] = QbColumn("A", NewQbAttribute("A"))
+    assert get_columns_of_dsd_type(cube, NewQbDimension) == [dimension_b]
+    assert len(get_columns_of_dsd_type(cube, QbAttribute)) == 1
+
+    cube.columns = [dimension_a]
+    assert get_columns_of_dsd_type(cube, NewQbDimension) == [dimension_a]
+    assert get_columns_of_dsd_type(cube, QbAttribute) == []
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -13,6 +13,7 @@ from csvcubed.models.cube import (
 from csvcubed.utils.qb.standardise import (
     ensure_qbcube_data_is_categorical,
     convert_data_values_to_uri_safe_values,
+    ensure_bool_columns_are_csvw_booleans,
     ensure_int_columns_are_ints,
 )
 
@@ -324,5 +325,67 @@ def test_coerce_attribute_value_with_missing_values():
     assert 33 in error_values_set
 
 
+def test_coerce_integer_column_already_holding_ints_is_not_copied():
+    """
+    Ensure that `ensure_int_columns_are_ints` leaves columns which already hold integers as they are.
+    """
+
+    data = pd.DataFrame({"New Dimension": ["A", "B", "C"], "Value": [1, 2, -3]})
+
+    cube = Cube(
+        CatalogMetadata("Some Dataset"),
+        data,
+        [
+            QbColumn(
+                "New Dimension",
+                NewQbDimension.from_data("Some Dimension", data["New Dimension"]),
+            ),
+            QbColumn(
+                "Value",
+                QbSingleMeasureObservationValue(
+                    NewQbMeasure("Some Measure"),
+                    NewQbUnit("Some Unit"),
+                    data_type="int",
+                ),
+            ),
+        ],
+    )
+    values_before = cube.data["Value"]
+
+    ensure_int_columns_are_ints(cube)
+
+    assert cube.data["Value"].dtype == "int64"
+    assert cube.data["Value"].values is values_before.values
+
+
+def test_bool_columns_converted_to_csvw_booleans():
+    """
+    Ensure that boolean columns (including those with missing values) are represented using `true` and `false`.
+    """
+    data = pd.DataFrame(
+        {
+            "New Dimension": ["A", "B", "C"],
+            "Flag": [True, False, True],
+            "Nullable Flag": pd.array([False, None, True], dtype="boolean"),
+        }
+    )
+    cube = Cube(CatalogMetadata("Some Dataset"), data, [])
+
+    ensure_bool_columns_are_csvw_booleans(cube)
+
+    assert list(cube.data["Flag"]) == ["true", "false", "true"]
+    assert list(cube.data["Nullable Flag"].astype(object).fillna("")) == [
+        "false",
+        "",
+        "true",
+    ]
+    assert list(cube.data["New Dimension"]) == ["A", "B", "C"]
+    assert cube.data.to_csv(index=False).splitlines()[1:] == [
+        "A,true,false",
+        "B,false,",
+        "C,true,true",
+    ]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -2,6 +2,7 @@ from csvcubed.models.cube.qb.components.measure import ExistingQbMeasure
 from csvcubed.models.cube.qb.components.measuresdimension import QbMultiMeasureDimension
 from csvcubed.models.cube.qb.components.observedvalue import QbMultiMeasureObservationValue
 from csvcubed.models.cube.qb.validationerrors import CsvColumnUriTemplateMissingError
+import pandas as pd
 import pytest
 
 
@@ -17,7 +18,12 @@ from csvcubed.models.cube import (
     Cube,
 )
 
-from csvcubed.utils.qb.validation.observations import get_observation_status_columns, _validate_multi_measure_cube
+from csvcubed.models.cube import DuplicateObservationsError
+from csvcubed.utils.qb.validation.observations import (
+    get_observation_status_columns,
+    validate_observations,
+    _validate_multi_measure_cube,
+)
 
 
 def test_find_sdmxa_obs_status_columns():
@@ -121,6 +127,84 @@ def test_value_uri_template_is_missing_in_existing_measure_dimention():
     error = errors[0]
     assert isinstance(error, CsvColumnUriTemplateMissingError)
     assert error.component_type == ExistingQbMeasure
-    
+
+
+def test_duplicate_observations_detected():
+    """
+    A validation error should be raised when multiple observations share the same dimension (and measure) values.
+    """
+    data = pd.DataFrame(
+        {
+            "Year": ["2020", "2020", "2021", "2020", "2021"],
+            "Measure": ["Count", "Count", "Count", "Total", "Count"],
+            "Values": [1, 2, 3, 4, 5],
+        }
+    )
+    qube = Cube(
+        metadata=CatalogMetadata("Some Qube"),
+        data=data,
+        columns=[
+            QbColumn("Year", NewQbDimension.from_data("Year", data["Year"])),
+            QbColumn(
+                "Measure",
+                QbMultiMeasureDimension.new_measures_from_data(data["Measure"]),
+            ),
+            QbColumn(
+                "Values", QbMultiMeasureObservationValue(unit=NewQbUnit("Some Unit"))
+            ),
+        ],
+    )
+
+    errors = [
+        e
+        for e in validate_observations(qube)
+        if isinstance(e, DuplicateObservationsError)
+    ]
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert error.csv_column_titles == ["Year", "Measure"]
+    assert error.num_of_duplicate_keys == 2
+    assert error.duplicate_key_row_numbers == {
+        "'2020', 'Count'": [0, 1],
+        "'2021', 'Count'": [2, 4],
+    }
+
+
+def test_duplicate_observations_reported_by_position():
+    """
+    Duplicate observations should be reported by their row positions whatever the data's index holds.
+    """
+    data = pd.DataFrame(
+        {
+            "Year": ["2020", "2020", "2021", "2021"],
+            "Values": [1, 2, 3, 4],
+        },
+        index=["w", "x", "y", "z"],
+    )
+    qube = Cube(
+        metadata=CatalogMetadata("Some Qube"),
+        data=data,
+        columns=[
+            QbColumn("Year", NewQbDimension.from_data("Year", data["Year"])),
+            QbColumn(
+                "Values",
+                QbSingleMeasureObservationValue(
+                    NewQbMeasure("Some Measure"), NewQbUnit("Some Unit")
+                ),
+            ),
+        ],
+    )
+
+    errors = [
+        e
+        for e in validate_observations(qube)
+        if isinstance(e, DuplicateObservationsError)
+    ]
+
+    assert len(errors) == 1
+    assert errors[0].duplicate_key_row_numbers == {"'2020'": [0, 1], "'2021'": [2, 3]}
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -16,6 +16,7 @@ from csvcubed.models.sparqlresults import (
     DatasetURLResult,
     QubeComponentsResult,
     MetadataDependenciesResult,
+    TableColumnDataTypeResult,
 )
 from csvcubed.utils.qb.components import ComponentPropertyType
 from csvcubed.utils.rdf import parse_graph_retain_relative
@@ -34,6 +35,7 @@ from csvcubed.utils.sparql_handler.sparqlmanager import (
     select_single_unit_from_dsd,
     select_metadata_dependencies,
     select_table_schema_properties,
+    select_table_column_datatypes,
 )
 from csvcubed.utils.tableschema import (
     CsvwRdfManager,
@@ -187,6 +189,69 @@ def test_select_csvw_dsd_dataset():
     assert components[0].required is True
 
 
+def test_select_csvw_dsd_qube_components_joins_columns():
+    """
+    Each component should be matched to the columns whose `propertyUrl` its property ends with.
+    """
+    graph = ConjunctiveGraph()
+    graph.parse(
+        data="""
+        @prefix csvw: <http://www.w3.org/ns/csvw#> .
+        @prefix qb: <http://purl.org/linked-data/cube#> .
+        @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+        <http://example.com/cube.csv#structure> qb:component
+            <http://example.com/cube.csv#component/period>,
+            <http://example.com/cube.csv#component/comment>,
+            <http://example.com/cube.csv#component/status>,
+            <http://example.com/cube.csv#component/measure> .
+
+        <http://example.com/cube.csv#component/period> qb:dimension <http://example.com/cube.csv#dimension/period> ;
+            qb:order 1 .
+        <http://example.com/cube.csv#dimension/period> rdfs:label "Period" .
+
+        <http://example.com/cube.csv#component/comment> qb:attribute <http://example.com/cube.csv#attribute/comment> ;
+            qb:order 2 .
+
+        <http://example.com/cube.csv#component/status> qb:attribute <http://example.com/cube.csv#attribute/status> ;
+            qb:componentRequired true ;
+            qb:order 3 .
+
+        <http://example.com/cube.csv#component/measure> qb:measure <http://example.com/cube.csv#measure/count> ;
+            qb:order 4 .
+
+        [] csvw:tableSchema [
+            csvw:column (
+                [ csvw:title "Period" ; csvw:propertyUrl "http://example.com/cube.csv#dimension/period" ; csvw:required true ]
+                [ csvw:title "Comment" ; csvw:propertyUrl "attribute/comment" ; csvw:required true ]
+                [ csvw:title "Other Comment" ; csvw:propertyUrl "cube.csv#attribute/comment" ]
+                [ csvw:title "Status" ; csvw:propertyUrl "http://example.com/cube.csv#attribute/status" ]
+                [ csvw:title "Unrelated" ; csvw:propertyUrl "http://example.com/other" ]
+            )
+        ] .
+        """,
+        format="turtle",
+    )
+
+    result = select_csvw_dsd_qube_components(
+        graph,
+        "http://example.com/cube.csv#structure",
+        Path("/tmp/cube.csv-metadata.json"),
+    )
+
+    assert result.num_components == 5
+    components = [(c.csv_col_title, c.required) for c in result.qube_components]
+    assert components[0] == ("Period", True)
+    assert result.qube_components[0].property_label == "Period"
+    assert sorted(components[1:3]) == [("Comment", True), ("Other Comment", False)]
+    assert components[3] == ("Status", True)
+    # Components which aren't represented by a column are still listed.
+    assert components[4] == ("", True)
+    assert (
+        result.qube_components[4].property_type == ComponentPropertyType.Measure.value
+    )
+
+
 def test_select_cols_when_supress_output_cols_not_present():
     """
     Should return expected `ColsWithSuppressOutputTrueResult`.
@@ -469,6 +534,42 @@ def test_rdf_load_ttl_dependency() -> None:
     ) in csvw_metadata_rdf_graph
 
 
+def test_select_table_column_datatypes():
+    """
+    Should return the title and base datatype of each column in the table with the given url.
+    """
+    graph = ConjunctiveGraph()
+    graph.parse(
+        data="""
+        @prefix csvw: <http://www.w3.org/ns/csvw#> .
+        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+        [] csvw:url <file:///tmp/cube.csv> ;
+            csvw:tableSchema [
+                csvw:column (
+                    [ csvw:title "Period" ; csvw:valueUrl "http://example.com/{+period}" ]
+                    [ csvw:title "Value" ; csvw:datatype xsd:double ]
+                    [ csvw:title "Count" ; csvw:datatype [ csvw:base "integer" ; csvw:minimum 0 ] ]
+                )
+            ] .
+
+        [] csvw:url <file:///tmp/other.csv> ;
+            csvw:tableSchema [
+                csvw:column ( [ csvw:title "Label" ; csvw:datatype xsd:string ] )
+            ] .
+        """,
+        format="turtle",
+    )
+
+    result = select_table_column_datatypes(graph, "cube.csv")
+
+    assert sorted(result.columns, key=lambda c: c.column_title) == [
+        TableColumnDataTypeResult("Count", "integer", None),
+        TableColumnDataTypeResult("Period", None, "http://example.com/{+period}"),
+        TableColumnDataTypeResult("Value", "double", None),
+    ]
+
+
 @pytest.mark.vcr
 def test_rdf_load_url_dependency() -> None:
     """
@@ -0,0 +1,191 @@
+import sys
+
+import pytest
+from rdflib import ConjunctiveGraph, Literal, URIRef
+
+from csvcubed.models.csvcubedexception import RdfStoreBackendUnavailableException
+from csvcubed.models.sparqlresults import TableColumnDataTypeResult
+from csvcubed.utils.sparql_handler.sparqlmanager import (
+    ask_is_csvw_code_list,
+    ask_is_csvw_qb_dataset,
+    select_cols_where_suppress_output_is_true,
+    select_csvw_catalog_metadata,
+    select_csvw_dsd_dataset_label_and_dsd_def_uri,
+    select_csvw_dsd_qube_components,
+    select_dsd_code_list_and_cols,
+    select_table_column_datatypes,
+)
+from csvcubed.utils.sparql_handler.store import (
+    RdfStoreBackend,
+    bind_query_variables,
+    create_conjunctive_graph,
+    is_rdf_store_backend_available,
+)
+from csvcubed.utils.tableschema import CsvwRdfManager
+from tests.unit.test_baseunit import get_test_cases_dir
+
+_test_case_base_dir = get_test_cases_dir() / "cli" / "inspect"
+
+_table_schemas_ttl = """
+    @prefix csvw: <http://www.w3.org/ns/csvw#> .
+    @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+    [] csvw:url <file:///tmp/cube.csv> ;
+        csvw:tableSchema [
+            csvw:column (
+                [ csvw:title "Period" ; csvw:valueUrl "http://example.com/{+period}" ]
+                [ csvw:title "Value" ; csvw:datatype xsd:double ]
+                [ csvw:title "Count" ; csvw:datatype [ csvw:base "integer" ; csvw:minimum 0 ] ]
+            )
+        ] .
+"""
+
+_requires_oxigraph = pytest.mark.skipif(
+    not is_rdf_store_backend_available(RdfStoreBackend.Oxigraph),
+    reason="The optional oxrdflib package is not installed.",
+)
+
+_all_backends = [
+    pytest.param(RdfStoreBackend.Rdflib, id="rdflib"),
+    pytest.param(RdfStoreBackend.Oxigraph, id="oxigraph", marks=_requires_oxigraph),
+]
+
+
+@pytest.mark.parametrize("backend", _all_backends)
+def test_create_conjunctive_graph(backend: RdfStoreBackend):
+    graph = create_conjunctive_graph(backend)
+
+    assert isinstance(graph, ConjunctiveGraph)
+    assert not any(graph)
+
+
+def test_unavailable_backend_raises_exception(monkeypatch):
+    """
+    Selecting a backend whose optional dependency isn't installed should explain which package is missing.
+    """
+    # Makes any import of oxrdflib raise an ImportError.
+    monkeypatch.setitem(sys.modules, "oxrdflib", None)
+
+    assert not is_rdf_store_backend_available(RdfStoreBackend.Oxigraph)
+    with pytest.raises(RdfStoreBackendUnavailableException) as ex:
+        create_conjunctive_graph(RdfStoreBackend.Oxigraph)
+
+    assert "oxrdflib" in str(ex.value)
+
+
+def test_bind_query_variables():
+    """
+    Bound variables should be replaced wherever they're used, including in sub-queries, without affecting other
+    variables which share a prefix with them.
+    """
+    query = """
+        SELECT ?component WHERE {
+            { SELECT ?component WHERE { ?dsd_uri qb:component ?component. } }
+            BIND (?table_url as ?tableUrlStr).
+            FILTER (?dsd_uri_label != $table_url).
+        }
+    """
+
+    assert (
+        bind_query_variables(
+            query,
+            {
+                "dsd_uri": URIRef("http://example.com/dsd"),
+                "table_url": Literal("cube.csv"),
+            },
+        )
+        == """
+        SELECT ?component WHERE {
+            { SELECT ?component WHERE { <http://example.com/dsd> qb:component ?component. } }
+            BIND ("cube.csv" as ?tableUrlStr).
+            FILTER (?dsd_uri_label != "cube.csv").
+        }
+    """
+    )
+    assert bind_query_variables(query, None) == query
+
+
+@pytest.mark.parametrize("backend", _all_backends)
+def test_select_with_init_bindings(backend: RdfStoreBackend):
+    """
+    Queries using `initBindings` should return the same results whichever backend the graph is stored in.
+    """
+    graph = create_conjunctive_graph(backend)
+    graph.get_context("file:///tmp/cube.csv-metadata.json").parse(
+        data=_table_schemas_ttl, format="turtle"
+    )
+
+    result = select_table_column_datatypes(graph, "cube.csv")
+
+    assert sorted(result.columns, key=lambda c: c.column_title) == [
+        TableColumnDataTypeResult("Count", "integer", None),
+        TableColumnDataTypeResult("Period", None, "http://example.com/{+period}"),
+        TableColumnDataTypeResult("Value", "double", None),
+    ]
+
+
+@_requires_oxigraph
+@pytest.mark.parametrize(
+    "metadata_file_name",
+    [
+        "datacube.csv-metadata.json",
+        "datacube_with_suppress_output_cols.csv-metadata.json",
+    ],
+)
+def test_qb_dataset_query_results_match_rdflib(metadata_file_name: str):
+    """
+    Ensure the inspect command's queries give identical results when the CSV-W is loaded into the Oxigraph store.
+    """
+    csvw_metadata_json_path = _test_case_base_dir / metadata_file_name
+    rdflib_graph = CsvwRdfManager(csvw_metadata_json_path).rdf_graph
+    oxigraph_graph = CsvwRdfManager(
+        csvw_metadata_json_path, RdfStoreBackend.Oxigraph
+    ).rdf_graph
+
+    assert len(oxigraph_graph) == len(rdflib_graph)
+    assert ask_is_csvw_qb_dataset(oxigraph_graph) == ask_is_csvw_qb_dataset(
+        rdflib_graph
+    )
+    assert select_csvw_catalog_metadata(oxigraph_graph) == select_csvw_catalog_metadata(
+        rdflib_graph
+    )
+    assert select_cols_where_suppress_output_is_true(
+        oxigraph_graph
+    ) == select_cols_where_suppress_output_is_true(rdflib_graph)
+
+    dsd = select_csvw_dsd_dataset_label_and_dsd_def_uri(rdflib_graph)
+    assert select_csvw_dsd_dataset_label_and_dsd_def_uri(oxigraph_graph) == dsd
+
+    oxigraph_components = select_csvw_dsd_qube_components(
+        oxigraph_graph, dsd.dsd_uri, csvw_metadata_json_path
+    ).qube_components
+    rdflib_components = select_csvw_dsd_qube_components(
+        rdflib_graph, dsd.dsd_uri, csvw_metadata_json_path
+    ).qube_components
+    assert sorted(oxigraph_components, key=repr) == sorted(rdflib_components, key=repr)
+
+    oxigraph_code_lists = select_dsd_code_list_and_cols(
+        oxigraph_graph, dsd.dsd_uri, csvw_metadata_json_path
+    ).codelists
+    rdflib_code_lists = select_dsd_code_list_and_cols(
+        rdflib_graph, dsd.dsd_uri, csvw_metadata_json_path
+    ).codelists
+    assert sorted(oxigraph_code_lists, key=repr) == sorted(rdflib_code_lists, key=repr)
+
+
+@_requires_oxigraph
+def test_code_list_query_results_match_rdflib():
+    csvw_metadata_json_path = _test_case_base_dir / "codelist.csv-metadata.json"
+    rdflib_graph = CsvwRdfManager(csvw_metadata_json_path).rdf_graph
+    oxigraph_graph = CsvwRdfManager(
+        csvw_metadata_json_path, RdfStoreBackend.Oxigraph
+    ).rdf_graph
+
+    assert ask_is_csvw_code_list(oxigraph_graph) == ask_is_csvw_code_list(rdflib_graph)
+    assert select_csvw_catalog_metadata(oxigraph_graph) == select_csvw_catalog_metadata(
+        rdflib_graph
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
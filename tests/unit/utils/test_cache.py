@@ -0,0 +1,137 @@
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+import requests_mock
+
+from csvcubed.utils.cache import (
+    HttpCacheBackend,
+    HttpCacheSettings,
+    configure_http_cache,
+    get_http_cache_settings_from_environment,
+    session,
+)
+
+_URL = "https://example.com/some-document.json"
+
+
+@pytest.fixture(autouse=True)
+def restore_http_cache():
+    yield
+
+    configure_http_cache(get_http_cache_settings_from_environment())
+
+
+def _get_with_mocked_response(url: str = _URL) -> requests.Response:
+    # N.B. the adapter is mounted (rather than mocking the session) so that requests pass through the cache.
+    adapter = requests_mock.Adapter()
+    adapter.register_uri("GET", url, json={"some": "document"})
+    session.mount("https://", adapter)
+    return session.get(url)
+
+
+def test_settings_from_environment(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("CSVCUBED_HTTP_CACHE_BACKEND", "Filesystem")
+    monkeypatch.setenv("CSVCUBED_HTTP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("CSVCUBED_HTTP_CACHE_READ_ONLY", "true")
+    monkeypatch.setenv("CSVCUBED_HTTP_CACHE_OFFLINE", "0")
+    monkeypatch.setenv(
+        "CSVCUBED_HTTP_CACHE_EXPIRE_AFTER", '{"purl.org/csv-cubed/*": 86400}'
+    )
+
+    assert get_http_cache_settings_from_environment() == HttpCacheSettings(
+        backend=HttpCacheBackend.Filesystem,
+        cache_dir=tmp_path,
+        read_only=True,
+        offline=False,
+        urls_expire_after={"purl.org/csv-cubed/*": 86400},
+    )
+
+
+def test_sqlite_cache_uses_write_ahead_logging(tmp_path: Path):
+    configure_http_cache(HttpCacheSettings(cache_dir=tmp_path))
+
+    assert not getattr(_get_with_mocked_response(), "from_cache", False)
+    assert _get_with_mocked_response().from_cache
+
+    with sqlite3.connect(tmp_path / "http_cache.sqlite") as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_read_only_cache_is_not_written_to(tmp_path: Path):
+    configure_http_cache(
+        HttpCacheSettings(backend=HttpCacheBackend.Filesystem, cache_dir=tmp_path)
+    )
+    _get_with_mocked_response()
+
+    configure_http_cache(
+        HttpCacheSettings(
+            backend=HttpCacheBackend.Filesystem, cache_dir=tmp_path, read_only=True
+        )
+    )
+
+    assert _get_with_mocked_response().from_cache
+    other_url = "https://example.com/other-document.json"
+    _get_with_mocked_response(other_url)
+    assert not session.cache.has_url(other_url)
+
+
+def test_read_only_cache_keeps_expired_responses(tmp_path: Path):
+    """
+    When an expired response can't be fetched again, the session deletes it from the cache; a read-only cache must
+    be left unchanged.
+    """
+    settings = HttpCacheSettings(
+        backend=HttpCacheBackend.Filesystem, cache_dir=tmp_path
+    )
+    configure_http_cache(settings)
+    _get_with_mocked_response()
+    cache_key = next(iter(session.cache.responses.keys()))
+    session.cache.save_response(
+        session.cache.get_response(cache_key), cache_key, expires=datetime(2000, 1, 1)
+    )
+
+    configure_http_cache(
+        HttpCacheSettings(
+            backend=HttpCacheBackend.Filesystem, cache_dir=tmp_path, read_only=True
+        )
+    )
+    adapter = requests_mock.Adapter()
+    adapter.register_uri("GET", _URL, exc=requests.ConnectionError)
+    session.mount("https://", adapter)
+
+    with pytest.raises(requests.ConnectionError):
+        session.get(_URL)
+
+    session.cache.delete(cache_key)
+    session.cache.delete(expired=True)
+    session.cache.clear()
+
+    configure_http_cache(settings)
+    assert session.cache.has_key(cache_key)
+
+
+def test_offline_cache_only_uses_cached_responses(tmp_path: Path):
+    configure_http_cache(
+        HttpCacheSettings(backend=HttpCacheBackend.Filesystem, cache_dir=tmp_path)
+    )
+    _get_with_mocked_response()
+
+    configure_http_cache(
+        HttpCacheSettings(
+            backend=HttpCacheBackend.Filesystem, cache_dir=tmp_path, offline=True
+        )
+    )
+
+    response = session.get(_URL)
+    assert response.from_cache
+    assert response.json() == {"some": "document"}
+
+    with pytest.raises(requests.ConnectionError, match="offline"):
+        session.get("https://example.com/other-document.json")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,63 @@
+import pytest
+
+from csvcubed.utils.csvscan import scan_csv_rows
+
+
+def _scan_and_read_tail(csv_path, num_tail_rows: int):
+    result = scan_csv_rows(csv_path, num_tail_rows)
+    with open(csv_path, "rb") as f:
+        f.seek(result.tail_offset)
+        tail = f.read()
+    return result.num_of_rows, tail
+
+
+def test_scan_csv_rows(tmp_path):
+    """
+    Should count the rows (excluding the header) and locate the start of the last rows.
+    """
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b"A,B\n" + b"".join(f"a{i},{i}\n".encode() for i in range(20)))
+
+    num_of_rows, tail = _scan_and_read_tail(csv_path, 3)
+
+    assert num_of_rows == 20
+    assert tail == b"a17,17\na18,18\na19,19\n"
+
+
+def test_scan_csv_rows_quoted_new_lines(tmp_path):
+    """
+    Should not treat new lines inside quoted values as the end of a row.
+    """
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(
+        b'A,B\n"first\nvalue",1\n"say ""hi""\nthere",2\nlast,3\n"multi\n\nline",4'
+    )
+
+    num_of_rows, tail = _scan_and_read_tail(csv_path, 2)
+
+    assert num_of_rows == 4
+    assert tail == b'last,3\n"multi\n\nline",4'
+
+
+def test_scan_csv_rows_fewer_rows_than_tail(tmp_path):
+    """
+    Should return all of the rows as the tail where the csv contains fewer rows than requested.
+    """
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b"A,B\r\na,1\r\nb,2\r\n")
+
+    num_of_rows, tail = _scan_and_read_tail(csv_path, 10)
+
+    assert num_of_rows == 2
+    assert tail == b"a,1\r\nb,2\r\n"
+
+
+def test_scan_csv_rows_header_only(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b"A,B\n")
+
+    assert scan_csv_rows(csv_path, 10).num_of_rows == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
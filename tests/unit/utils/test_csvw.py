@@ -1,10 +1,15 @@
+import json
+
 import pytest
 from csvcubedmodels.rdf import CSVW
 from rdflib import Graph, Literal, URIRef
 
 from tests.unit.test_baseunit import get_test_cases_dir
 from csvcubed.utils.csvw import (
+    defines_base_uri,
     get_dependent_local_files,
+    get_local_metadata_dependencies,
+    load_local_table_schema,
     load_table_schema_file_to_graph,
 )
 
@@ -40,6 +45,55 @@ def test_no_dependent_local_files_when_base_is_uri():
     dependent_files = get_dependent_local_files(csvw_file)
     assert len(dependent_files) == 0
 
+
+def test_defines_base_uri():
+    """
+    The `@base` may be defined in a single context or in any of a list of contexts.
+    """
+    assert defines_base_uri({"@base": "./some-base-path/"})
+    assert defines_base_uri(
+        ["http://www.w3.org/ns/csvw", {"@language": "en"}, {"@base": "./some-base-path/"}]
+    )
+    assert not defines_base_uri("http://www.w3.org/ns/csvw")
+    assert not defines_base_uri(["http://www.w3.org/ns/csvw", {"@language": "en"}])
+    assert not defines_base_uri(None)
+
+
+def test_load_local_table_schema(tmp_path):
+    """
+    Only table schemas which are defined inline or in readable local files should be loaded.
+    """
+    (tmp_path / "table.json").write_text(json.dumps({"columns": []}))
+    (tmp_path / "invalid.json").write_text("{")
+
+    assert load_local_table_schema(tmp_path, {"columns": [{}]}) == {"columns": [{}]}
+    assert load_local_table_schema(tmp_path, "table.json") == {"columns": []}
+    assert load_local_table_schema(tmp_path, "missing.json") is None
+    assert load_local_table_schema(tmp_path, "invalid.json") is None
+    assert load_local_table_schema(tmp_path, "http://example.com/table.json") is None
+
+
+def test_extracting_local_metadata_dependencies():
+    """
+    Should follow the `void:dataDump` dependencies declared in the CSV-W transitively, without looping forever on
+    cyclic dependencies.
+    """
+    dependencies_dir = get_test_cases_dir() / "cli" / "inspect" / "dependencies"
+
+    assert get_local_metadata_dependencies(
+        dependencies_dir / "data.csv-metadata.json"
+    ) == {(dependencies_dir / "dimension.csv-metadata.json").resolve()}
+    assert get_local_metadata_dependencies(
+        dependencies_dir / "transitive.csv-metadata.json"
+    ) == {
+        (dependencies_dir / "transitive.1.json").resolve(),
+        (dependencies_dir / "transitive.2.json").resolve(),
+    }
+    assert get_local_metadata_dependencies(
+        dependencies_dir / "cyclic.csv-metadata.json"
+    ) == {(dependencies_dir / "cyclic.csv-metadata.json").resolve()}
+
+
 def test_load_table_schema_file_to_graph():
     """
     Test that we generate sensible triples when loading a tableSchema file into a graph.
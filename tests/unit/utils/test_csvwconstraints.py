@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+import pytest
+
+from csvcubed.models.csvwvalidationerrors import (
+    DuplicatePrimaryKeyError,
+    ForeignKeyViolationError,
+)
+from csvcubed.utils.csvwconstraints import validate_csvw_constraints
+
+
+def _write_csvw(tmp_path: Path, countries: List[str], years: List[str]) -> Path:
+    """
+    Writes a CSV-W in the shape generated by `QbWriter` with a dataset-local code list for the country dimension.
+    """
+    pd.DataFrame(
+        {
+            "Country": countries,
+            "Year": years,
+            "Value": list(range(len(countries))),
+        }
+    ).to_csv(tmp_path / "cube.csv", index=False)
+
+    pd.DataFrame(
+        {"Label": ["England", "Wales"], "Notation": ["england", "wales"]}
+    ).to_csv(tmp_path / "country.csv", index=False)
+
+    with open(tmp_path / "country.table.json", "w") as f:
+        json.dump(
+            {
+                "columns": [
+                    {"titles": "Label", "name": "label"},
+                    {"titles": "Notation", "name": "uri_identifier"},
+                    {"virtual": True, "name": "virt_type"},
+                ],
+                "primaryKey": "uri_identifier",
+            },
+            f,
+        )
+
+    metadata_path = tmp_path / "cube.csv-metadata.json"
+    with open(metadata_path, "w") as f:
+        json.dump(
+            {
+                "@context": "http://www.w3.org/ns/csvw",
+                "tables": [
+                    {
+                        "url": "cube.csv",
+                        "tableSchema": {
+                            "columns": [
+                                {"titles": "Country", "name": "country"},
+                                {"titles": "Year", "name": "year"},
+                                {"titles": "Value", "name": "value"},
+                            ],
+                            "foreignKeys": [
+                                {
+                                    "columnReference": "country",
+                                    "reference": {
+                                        "resource": "country.csv",
+                                        "columnReference": "uri_identifier",
+                                    },
+                                }
+                            ],
+                            "primaryKey": ["country", "year"],
+                        },
+                    },
+                    {
+                        "url": "country.csv",
+                        "tableSchema": "country.table.json",
+                        "suppressOutput": True,
+                    },
+                ],
+            },
+            f,
+        )
+
+    return metadata_path
+
+
+def test_valid_csvw_has_no_errors(tmp_path: Path):
+    metadata_path = _write_csvw(
+        tmp_path, ["england", "wales", "england"], ["2020", "2020", "2021"]
+    )
+
+    assert validate_csvw_constraints(metadata_path) == []
+
+
+def test_duplicate_primary_key_detected(tmp_path: Path):
+    metadata_path = _write_csvw(
+        tmp_path, ["england", "wales", "england"], ["2020", "2020", "2020"]
+    )
+
+    errors = validate_csvw_constraints(metadata_path)
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert isinstance(error, DuplicatePrimaryKeyError)
+    assert error.table_url == "cube.csv"
+    assert error.csv_column_titles == ["Country", "Year"]
+    assert error.num_of_rows == 2
+    assert error.row_numbers == [2, 4]
+    assert error.message.endswith("in row(s) 2, 4 (counting the header as row 1).")
+
+
+def test_foreign_key_violation_detected(tmp_path: Path):
+    metadata_path = _write_csvw(
+        tmp_path,
+        ["england", "scotland", "france", "scotland"],
+        ["2020", "2020", "2020", "2021"],
+    )
+
+    errors = validate_csvw_constraints(metadata_path)
+
+    assert len(errors) == 1
+    error = errors[0]
+    assert isinstance(error, ForeignKeyViolationError)
+    assert error.csv_column_title == "Country"
+    assert error.referenced_table_url == "country.csv"
+    assert error.undefined_values == ["france", "scotland"]
+    assert error.num_of_rows == 3
+    assert error.row_numbers == [3, 4, 5]
+
+
+def test_remote_foreign_key_reference_skipped(tmp_path: Path):
+    metadata_path = _write_csvw(tmp_path, ["france"], ["2020"])
+    with open(metadata_path, "r") as f:
+        metadata = json.load(f)
+    metadata["tables"][0]["tableSchema"]["foreignKeys"][0]["reference"][
+        "resource"
+    ] = "http://example.com/country.csv"
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f)
+
+    assert validate_csvw_constraints(metadata_path) == []
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,105 @@
+import random
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from csvcubed.utils.csvwriter import CsvWriterEngine, write_csv
+
+_awkward_values = [
+    "plain",
+    "with, comma",
+    'with "quotes"',
+    "with\nnew line",
+    "with\rcarriage return",
+    " leading space",
+    "",
+    "ünïcödé",
+    "true",
+    None,
+]
+
+
+def _assert_engines_write_identical_csvs(data: pd.DataFrame, tmp_path: Path) -> None:
+    pandas_csv_path = tmp_path / "pandas.csv"
+    chunked_csv_path = tmp_path / "chunked.csv"
+
+    write_csv(data, pandas_csv_path, CsvWriterEngine.Pandas)
+    write_csv(data, chunked_csv_path, CsvWriterEngine.Chunked)
+
+    assert pandas_csv_path.read_bytes() == chunked_csv_path.read_bytes()
+
+
+def test_chunked_writer_matches_pandas_for_awkward_values(tmp_path: Path):
+    """
+    Ensure that the chunked writer quotes values and represents missing values exactly as pandas does.
+    """
+    random.seed(0)
+    num_rows = 500
+    data = pd.DataFrame(
+        {
+            "Object": [random.choice(_awkward_values) for _ in range(num_rows)],
+            "Categorical, with comma": pd.Categorical(
+                [random.choice(_awkward_values) for _ in range(num_rows)]
+            ),
+            "Mixed Object": [
+                random.choice(["a", 1, 2.5, None, float("nan"), True])
+                for _ in range(num_rows)
+            ],
+            "Float": [
+                random.choice([1.0, 0.1, 1e16, -2.5e-7, float("nan"), 123456.789])
+                for _ in range(num_rows)
+            ],
+            "Int": list(range(num_rows)),
+            "Nullable Int": pd.array(
+                [random.choice([1, -2, None]) for _ in range(num_rows)],
+                dtype="Int64",
+            ),
+            "Nullable Unsigned Int": pd.array(
+                [random.choice([1, 2**63, None]) for _ in range(num_rows)],
+                dtype="UInt64",
+            ),
+            "Bool": [random.choice([True, False]) for _ in range(num_rows)],
+            "Nullable Bool": pd.array(
+                [random.choice([True, False, None]) for _ in range(num_rows)],
+                dtype="boolean",
+            ),
+            "String": pd.array(
+                [random.choice(_awkward_values) for _ in range(num_rows)],
+                dtype="string",
+            ),
+            "Numeric Categorical": pd.Categorical(
+                [random.choice([1.5, 2.0, None]) for _ in range(num_rows)]
+            ),
+        }
+    )
+
+    _assert_engines_write_identical_csvs(data, tmp_path)
+
+
+def test_chunked_writer_matches_pandas_across_chunks(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("csvcubed.utils.csvwriter._CHUNK_SIZE", 7)
+    data = pd.DataFrame(
+        {
+            "Dimension": pd.Categorical([f"value-{i % 5}" for i in range(50)]),
+            "Value": np.linspace(0, 1, 50),
+        }
+    )
+
+    _assert_engines_write_identical_csvs(data, tmp_path)
+
+
+def test_chunked_writer_falls_back_to_pandas(tmp_path: Path):
+    """
+    Ensure that dataframes the chunked writer can't format are still written identically (by pandas).
+    """
+    _assert_engines_write_identical_csvs(pd.DataFrame({"Single": ["", "a"]}), tmp_path)
+    _assert_engines_write_identical_csvs(
+        pd.DataFrame({"Date": pd.to_datetime(["2020-01-01", None]), "Value": [1, 2]}),
+        tmp_path,
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,66 @@
+import logging
+from pathlib import Path
+
+import appdirs
+import pytest
+
+from csvcubed.utils.log import (
+    CustomFormatter,
+    flush_logging,
+    start_logging,
+    stop_logging,
+)
+
+_LOGGER_NAME = "csvcubed_log_test"
+
+_log_file_path = (
+    Path(appdirs.AppDirs("csvcubed_log_testing", "csvcubed").user_log_dir) / "out.log"
+)
+
+
+@pytest.fixture
+def logger():
+    yield logging.getLogger(_LOGGER_NAME)
+
+    stop_logging(_LOGGER_NAME)
+
+
+def test_start_logging_does_not_duplicate_handlers(logger: logging.Logger):
+    for _ in range(3):
+        start_logging("csvcubed_log_testing", "debug", root_logger_name=_LOGGER_NAME)
+
+    assert len(logger.handlers) == 1
+
+    stop_logging(_LOGGER_NAME)
+    assert logger.handlers == []
+
+
+def test_records_written_to_log_file(logger: logging.Logger):
+    start_logging("csvcubed_log_testing", "info", root_logger_name=_LOGGER_NAME)
+
+    logger.info("Some information about %s", "the build")
+    logger.debug("Some detail which isn't logged")
+    flush_logging()
+
+    log_lines = _log_file_path.read_text().splitlines()
+    assert log_lines[-1].endswith(
+        f"{_LOGGER_NAME} - INFO - Some information about the build"
+    )
+    assert not any("Some detail" in line for line in log_lines)
+
+
+def test_custom_formatter_colours_records_by_level():
+    formatter = CustomFormatter()
+    record = logging.LogRecord(
+        _LOGGER_NAME, logging.ERROR, __file__, 1, "Some %s", ("error",), None
+    )
+
+    formatted_record = formatter.format(record)
+
+    assert formatted_record.startswith(CustomFormatter.red)
+    assert "Some error" in formatted_record
+    assert formatted_record.endswith(CustomFormatter.reset)
+
+
+if __name__ == "__main__":
+    pytest.main()
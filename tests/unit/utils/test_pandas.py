@@ -1,7 +1,13 @@
+from pathlib import Path
+
+import pandas as pd
 import pytest
 
-from csvcubed.models.cube import DuplicateColumnTitleError
-from csvcubed.utils.pandas import read_csv
+from csvcubed.models.cube import (
+    DuplicateColumnTitleError,
+    InconsistentShardColumnsError,
+)
+from csvcubed.utils.pandas import get_duplicate_rows_mask, read_csv, read_csv_shards
 from tests.unit.test_baseunit import get_test_cases_dir
 
 _test_case_base_dir = get_test_cases_dir()
@@ -92,5 +98,57 @@ def test_duplicate_column_title_warning():
     }
 
 
+def test_duplicate_rows_mask_treats_missing_values_as_values():
+    data = pd.DataFrame(
+        {
+            "A": ["a", "a", None, None, "b"],
+            "B": ["x", "x", "y", "y", "y"],
+        },
+        dtype="category",
+    )
+
+    assert list(get_duplicate_rows_mask(data)) == [True, True, True, True, False]
+
+
+def test_read_csv_shards_unions_categories(tmp_path: Path):
+    """
+    Ensure that the shards' rows are combined in order and that string columns are read as categoricals whose
+    categories are the union of each shard's values.
+    """
+    (tmp_path / "2020.csv").write_text("Year,Region,Value\n2020,A,1\n2020,B,2\n")
+    (tmp_path / "2021.csv").write_text("Year,Region,Value\n2021,B,3\n2021,,4\n")
+
+    data, errors = read_csv_shards(
+        [tmp_path / "2020.csv", tmp_path / "2021.csv"],
+        dtype={"Year": "string", "Region": "string", "Value": "float64"},
+    )
+
+    assert errors == []
+    assert list(data.columns) == ["Year", "Region", "Value"]
+    assert isinstance(data["Region"].dtype, pd.CategoricalDtype)
+    assert set(data["Region"].cat.categories) == {"A", "B"}
+    assert list(data["Year"]) == ["2020", "2020", "2021", "2021"]
+    assert list(data["Region"].isna()) == [False, False, False, True]
+    assert list(data["Value"]) == [1.0, 2.0, 3.0, 4.0]
+    assert list(data.index) == [0, 1, 2, 3]
+
+
+def test_read_csv_shards_reports_inconsistent_columns(tmp_path: Path):
+    (tmp_path / "a.csv").write_text("Dimension,Value\nA,1\n")
+    (tmp_path / "b.csv").write_text("Dimension,Other\nB,2\n")
+
+    data, errors = read_csv_shards([tmp_path / "a.csv", tmp_path / "b.csv"])
+
+    assert errors == [
+        InconsistentShardColumnsError(
+            csv_path=str(tmp_path / "b.csv"),
+            expected_column_titles=["Dimension", "Value"],
+            actual_column_titles=["Dimension", "Other"],
+        )
+    ]
+    assert list(data.columns) == ["Dimension", "Value"]
+    assert len(data) == 2
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pytest
+import rdflib
+from rdflib import RDFS, Literal, URIRef
+from rdflib.compare import isomorphic
+
+from csvcubed.utils.rdfgraphcache import (
+    get_graph_cache_path,
+    read_cached_graph,
+    write_cached_graph,
+)
+from csvcubed.utils.sparql_handler.sparql import path_to_file_uri_for_rdflib
+
+
+@pytest.fixture
+def csvw_metadata_json_path(tmp_path: Path) -> Path:
+    metadata_file_path = tmp_path / "cube.csv-metadata.json"
+    metadata_file_path.write_text('{"url": "cube.csv"}')
+    (tmp_path / "cube.table.json").write_text('{"columns": []}')
+    return metadata_file_path
+
+
+def _get_graph(csvw_metadata_json_path: Path) -> rdflib.ConjunctiveGraph:
+    graph = rdflib.ConjunctiveGraph()
+    metadata_graph = graph.get_context(
+        path_to_file_uri_for_rdflib(csvw_metadata_json_path)
+    )
+    # The graphs loaded from CSV-Ws retain relative URIs.
+    metadata_graph.add((URIRef("cube.csv#dataset"), RDFS.label, Literal("Cube")))
+    metadata_graph.add(
+        (URIRef("cube.csv#dataset"), RDFS.comment, Literal("Comment", lang="en"))
+    )
+    metadata_graph.add((URIRef("cube.csv#dataset"), RDFS.seeAlso, rdflib.BNode()))
+
+    table_schema_graph = graph.get_context(
+        path_to_file_uri_for_rdflib(csvw_metadata_json_path.parent / "cube.table.json")
+    )
+    table_schema_graph.add(
+        (URIRef("cube.csv#table"), RDFS.label, Literal(3, datatype=rdflib.XSD.integer))
+    )
+
+    remote_graph = graph.get_context("http://example.com/dependency.json")
+    remote_graph.add((URIRef("http://example.com/a"), RDFS.label, Literal("A")))
+
+    return graph
+
+
+def test_graph_cache_round_trip(csvw_metadata_json_path: Path):
+    """
+    Should load the same quads (including relative URIs) in the same contexts as were cached.
+    """
+    assert read_cached_graph(csvw_metadata_json_path) is None
+
+    graph = _get_graph(csvw_metadata_json_path)
+    write_cached_graph(csvw_metadata_json_path, graph)
+
+    assert get_graph_cache_path(csvw_metadata_json_path).exists()
+    cached_graph = read_cached_graph(csvw_metadata_json_path)
+    assert cached_graph is not None
+    assert len(cached_graph) == len(graph)
+    assert {c.identifier for c in cached_graph.contexts()} == {
+        c.identifier for c in graph.contexts()
+    }
+    for context in graph.contexts():
+        assert isomorphic(context, cached_graph.get_context(context.identifier))
+    assert (URIRef("cube.csv#dataset"), RDFS.label, Literal("Cube")) in cached_graph
+
+
+def test_graph_cache_invalidated_when_dependency_changes(
+    csvw_metadata_json_path: Path,
+):
+    """
+    Should not use the cached graph once any of the local files it was loaded from changes.
+    """
+    write_cached_graph(csvw_metadata_json_path, _get_graph(csvw_metadata_json_path))
+    assert read_cached_graph(csvw_metadata_json_path) is not None
+
+    (csvw_metadata_json_path.parent / "cube.table.json").write_text(
+        '{"columns": [{"name": "a"}]}'
+    )
+    assert read_cached_graph(csvw_metadata_json_path) is None
+
+    write_cached_graph(csvw_metadata_json_path, _get_graph(csvw_metadata_json_path))
+    assert read_cached_graph(csvw_metadata_json_path) is not None
+
+    (csvw_metadata_json_path.parent / "cube.table.json").unlink()
+    assert read_cached_graph(csvw_metadata_json_path) is None
+
+
+def test_unreadable_graph_cache_ignored(csvw_metadata_json_path: Path):
+    get_graph_cache_path(csvw_metadata_json_path).write_text("not a cache")
+
+    assert read_cached_graph(csvw_metadata_json_path) is None
+
+
+if __name__ == "__main__":
+    pytest.main()
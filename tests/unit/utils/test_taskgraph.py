@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from csvcubed.utils.taskgraph import Task, run_task_graph
+
+
+def test_tasks_run_after_their_dependencies():
+    finished = []
+
+    def _task(name: str):
+        def _func() -> str:
+            time.sleep(0.01)
+            finished.append(name)
+            return name.upper()
+
+        return _func
+
+    results = run_task_graph(
+        {
+            "c": Task(_task("c"), depends_on=["a", "b"]),
+            "a": Task(_task("a")),
+            "b": Task(_task("b"), depends_on=["a"]),
+            "d": Task(_task("d")),
+        }
+    )
+
+    assert results == {"a": "A", "b": "B", "c": "C", "d": "D"}
+    assert finished.index("a") < finished.index("b") < finished.index("c")
+
+
+def test_independent_tasks_run_concurrently():
+    """
+    Ensure that a task doesn't wait for tasks which it doesn't depend on.
+    """
+    first_task_started = threading.Event()
+    second_task_started = threading.Event()
+
+    def _first():
+        first_task_started.set()
+        assert second_task_started.wait(timeout=5)
+
+    def _second():
+        second_task_started.set()
+        assert first_task_started.wait(timeout=5)
+
+    run_task_graph({"first": Task(_first), "second": Task(_second)}, max_workers=2)
+
+
+def test_task_exception_raised_and_dependents_not_started():
+    started = []
+
+    def _fail():
+        raise ValueError("Task failed")
+
+    with pytest.raises(ValueError, match="Task failed"):
+        run_task_graph(
+            {
+                "fail": Task(_fail),
+                "dependent": Task(lambda: started.append("dependent"), ["fail"]),
+            }
+        )
+
+    assert started == []
+
+
+def test_invalid_dependencies_raise_exception():
+    with pytest.raises(ValueError, match="Unknown task dependencies: missing"):
+        run_task_graph({"a": Task(lambda: None, depends_on=["missing"])})
+
+    with pytest.raises(ValueError, match="cyclic"):
+        run_task_graph(
+            {
+                "a": Task(lambda: None, depends_on=["b"]),
+                "b": Task(lambda: None, depends_on=["a"]),
+            }
+        )
+
+
+if __name__ == "__main__":
+    pytest.main()
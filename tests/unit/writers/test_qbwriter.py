@@ -2,6 +2,7 @@ from tempfile import TemporaryDirectory
 from typing import List
 from copy import deepcopy
 import csv
+import json
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -18,11 +19,17 @@ from csvcubed.models.cube import (
     QbMultiUnits,
 )
 from csvcubed.models.cube.uristyle import URIStyle
+from csvcubed.models.csvcubedexception import InvalidPartitionColumnException
 from csvcubed.models.cube.qb.components.arbitraryrdf import (
     TripleFragment,
     RdfSerialisationHint,
 )
 from csvcubed.utils.iterables import first
+from csvcubed.utils.qb.standardise import (
+    convert_data_values_to_uri_safe_values,
+    ensure_bool_columns_are_csvw_booleans,
+    ensure_int_columns_are_ints,
+)
 from csvcubed.writers.qbwriter import QbWriter
 from csvcubed.writers.urihelpers.skoscodelistconstants import SCHEMA_URI_IDENTIFIER
 
@@ -1539,5 +1546,120 @@ def test_output_integer_obs_val_with_missing_values():
                 # else: len == 0 implies it's a missing value, which is expected in one location.
 
 
+def test_writing_cube_leaves_its_data_unchanged():
+    """
+    Ensure that the data standardised for output is a copy, so the cube can be written more than once.
+    """
+    data = pd.DataFrame(
+        {
+            # n.b. categorical, as the data is following validation during a build.
+            "New Dimension": pd.Categorical(["A Value", "Another Value", "A Value"]),
+            "Flag": [True, False, True],
+            "Value": [1.0, 2.0, 3.0],
+        }
+    )
+    cube = Cube(
+        CatalogMetadata("Some Dataset"),
+        data,
+        [
+            QbColumn(
+                "New Dimension",
+                NewQbDimension.from_data("New Dimension", data["New Dimension"]),
+            ),
+            QbColumn("Flag", NewQbAttributeLiteral("boolean", "Flag")),
+            QbColumn(
+                "Value",
+                QbSingleMeasureObservationValue(
+                    NewQbMeasure("Some Measure"),
+                    NewQbUnit("Some Unit"),
+                    data_type="int",
+                ),
+            ),
+        ],
+    )
+    original_data = data.copy(deep=True)
+
+    output_cube = QbWriter(cube)._get_cube_for_output()
+    ensure_int_columns_are_ints(output_cube)
+    ensure_bool_columns_are_csvw_booleans(output_cube)
+    convert_data_values_to_uri_safe_values(output_cube)
+
+    assert list(output_cube.data["New Dimension"]) == [
+        "a-value",
+        "another-value",
+        "a-value",
+    ]
+    assert list(output_cube.data["Flag"]) == ["true", "false", "true"]
+    assert output_cube.data["Value"].dtype == pd.Int64Dtype()
+    pd.testing.assert_frame_equal(cube.data, original_data)
+
+
+def _get_cube_for_partitioning() -> Cube:
+    data = pd.DataFrame(
+        {
+            "Year": pd.Categorical(["2020", "2021", "2020", "2022"]),
+            "New Dimension": pd.Categorical(["A", "A", "B", "B"]),
+            "Value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    return Cube(
+        CatalogMetadata("Some Dataset"),
+        data,
+        [
+            QbColumn("Year", NewQbDimension.from_data("Year", data["Year"])),
+            QbColumn(
+                "New Dimension",
+                NewQbDimension.from_data("New Dimension", data["New Dimension"]),
+            ),
+            QbColumn(
+                "Value",
+                QbSingleMeasureObservationValue(
+                    NewQbMeasure("Some Measure"), NewQbUnit("Some Unit")
+                ),
+            ),
+        ],
+    )
+
+
+def test_writing_partitioned_observations(tmp_path: Path):
+    """
+    Ensure that one CSV is written for each value of the partition column, with each partition's table sharing the
+    same table schema.
+    """
+    QbWriter(_get_cube_for_partitioning(), partition_by="Year").write(tmp_path)
+
+    with open(tmp_path / "some-dataset.csv-metadata.json") as f:
+        tables = json.load(f)["tables"]
+
+    partition_file_names = [
+        "some-dataset-2020.csv",
+        "some-dataset-2021.csv",
+        "some-dataset-2022.csv",
+    ]
+    assert [t["url"] for t in tables[:3]] == partition_file_names
+    assert all(t["tableSchema"] == "some-dataset.table.json" for t in tables[:3])
+    assert not (tmp_path / "some-dataset.csv").exists()
+
+    with open(tmp_path / "some-dataset.table.json") as f:
+        table_schema = json.load(f)
+    assert table_schema["primaryKey"] == ["year", "new_dimension"]
+
+    partitions = [
+        pd.read_csv(tmp_path / name, dtype=str) for name in partition_file_names
+    ]
+    assert [list(p["Year"].unique()) for p in partitions] == [
+        ["2020"],
+        ["2021"],
+        ["2022"],
+    ]
+    assert list(partitions[0]["New Dimension"]) == ["a", "b"]
+    assert sum(len(p) for p in partitions) == 4
+
+
+def test_writing_partitioned_observations_requires_dimension_column(tmp_path: Path):
+    with pytest.raises(InvalidPartitionColumnException):
+        QbWriter(_get_cube_for_partitioning(), partition_by="Value").write(tmp_path)
+
+
 if __name__ == "__main__":
     pytest.main()